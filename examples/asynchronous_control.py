@@ -34,6 +34,12 @@ def main():
                        help="Movement acceleration (m/s²)")
     parser.add_argument("--responsiveness", type=float, default=1.0,
                        help="Time between command reads (seconds)")
+    parser.add_argument("--coalescing", choices=["latest", "sum", "rate_limited_sum"],
+                       help="How commands arriving between reads are combined (default: config or latest)")
+    parser.add_argument("--watchdog-timeout", type=float,
+                       help="Stop when no command arrives for this long (seconds, 0 = off; default: config or 2.0)")
+    parser.add_argument("--realtime", action="store_true",
+                       help="Real-time scheduling, memory locking and GC control for the loop (see realtime config)")
     
     args = parser.parse_args()
     
@@ -63,6 +69,8 @@ def main():
     
     # Set movement parameters
     controller.default_acceleration = args.acceleration
+    if args.realtime:
+        controller.realtime.enabled = True
     
     try:
         # Connect to robot
@@ -74,6 +82,9 @@ def main():
         
         # Initialize command processor
         processor = URCommandProcessor(controller)
+        if args.watchdog_timeout is not None:
+            processor.watchdog.enabled = args.watchdog_timeout > 0
+            processor.watchdog.timeout = args.watchdog_timeout
         
         print("🚀 Starting streaming mode...")
         print("Press Ctrl+C to stop")
@@ -81,7 +92,8 @@ def main():
         # Process commands asynchronously
         processor.process_asynchronous_commands(
             args.json_file, 
-            args.responsiveness
+            args.responsiveness,
+            coalescing=args.coalescing
         )
         
         return 0
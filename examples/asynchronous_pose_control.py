@@ -35,6 +35,10 @@ def main():
                        help="Movement acceleration (m/s²)")
     parser.add_argument("--responsiveness", type=float, default=2.0,
                        help="Time between command reads (seconds)")
+    parser.add_argument("--watchdog-timeout", type=float,
+                       help="Stop when no command arrives for this long (seconds, 0 = off; default: config or 2.0)")
+    parser.add_argument("--realtime", action="store_true",
+                       help="Real-time scheduling, memory locking and GC control for the loop (see realtime config)")
     
     args = parser.parse_args()
     
@@ -66,6 +70,8 @@ def main():
     # Configure movement parameters
     controller.default_speed = args.speed
     controller.default_acceleration = args.acceleration
+    if args.realtime:
+        controller.realtime.enabled = True
     
     print("🔌 Connecting to robot...")
     if not controller.connect():
@@ -94,6 +100,9 @@ def main():
     try:
         # Initialize command processor
         processor = URCommandProcessor(controller)
+        if args.watchdog_timeout is not None:
+            processor.watchdog.enabled = args.watchdog_timeout > 0
+            processor.watchdog.timeout = args.watchdog_timeout
         
         # Process pose commands asynchronously
         processor.process_asynchronous_poses(
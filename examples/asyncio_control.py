@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+UR Robot Asyncio Control
+
+Drives the robot from an asyncio event loop. Commands come from a JSONL
+file (tailed like the asynchronous examples) or from TCP producers sending
+one JSON command per line, while a second task prints the robot state.
+
+Usage:
+    python examples/asyncio_control.py [options]
+    python examples/asyncio_control.py --listen 30010 --mode poses
+"""
+
+import sys
+import asyncio
+import argparse
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from async_controller import AsyncURRobotController, AsyncCommandProcessor
+from command_sources import FileCommandSource, SocketCommandSource
+
+
+async def print_state(robot: AsyncURRobotController, interval: float) -> None:
+    """Print the TCP position and speed every ``interval`` seconds."""
+    async for state in robot.states(interval=interval):
+        print(f"📍 TCP {[round(p, 3) for p in state.tcp_pose[:3]]}  🏃 {state.linear_speed:.3f} m/s")
+
+
+async def run(args, config_path) -> int:
+    """Connect, then run the command stream and state printer side by side."""
+    if config_path:
+        robot = AsyncURRobotController(config_path=config_path)
+    else:
+        robot = AsyncURRobotController(robot_ip=args.robot_ip, robot_type=args.robot_type)
+    
+    if args.listen:
+        source = SocketCommandSource('0.0.0.0', args.listen, server=True)
+        print(f"📡 Listening for JSONL commands on port {args.listen}")
+    else:
+        source = FileCommandSource(args.json_file, follow=True)
+        print(f"📁 Following command file: {args.json_file}")
+    
+    try:
+        async with robot, source:
+            print("✅ Connected to robot")
+            processor = AsyncCommandProcessor(robot)
+            monitor = asyncio.ensure_future(print_state(robot, args.state_interval))
+            try:
+                if args.mode == "poses":
+                    await processor.process_asynchronous_poses(source, args.responsiveness)
+                else:
+                    await processor.process_asynchronous_commands(source, args.responsiveness)
+            finally:
+                monitor.cancel()
+    except ConnectionError as e:
+        print(f"❌ {e}")
+        return 1
+    
+    print("👋 Disconnected from robot")
+    return 0
+
+
+def main():
+    """Main asyncio control function."""
+    parser = argparse.ArgumentParser(
+        description="Drive the robot from an asyncio event loop"
+    )
+    parser.add_argument("--config", help="Path to configuration file")
+    parser.add_argument("--robot-ip", default="127.0.0.1", help="Robot IP address")
+    parser.add_argument("--robot-type", choices=["simulation", "physical"],
+                       default="simulation", help="Robot type")
+    parser.add_argument("--mode", choices=["deltas", "poses"], default="deltas",
+                       help="Treat commands as velocity deltas or absolute poses")
+    parser.add_argument("--json-file", default="examples/asynchronous_deltas.jsonl",
+                       help="Path to JSONL file to follow")
+    parser.add_argument("--listen", type=int, metavar="PORT",
+                       help="Accept JSONL commands over TCP on this port instead of a file")
+    parser.add_argument("--responsiveness", type=float, default=0.1,
+                       help="Time between control cycles (seconds)")
+    parser.add_argument("--state-interval", type=float, default=1.0,
+                       help="Time between state printouts (seconds)")
+    
+    args = parser.parse_args()
+    
+    print("🤖 UR Robot Controller - Asyncio Mode")
+    print("=" * 40)
+    
+    # Use default config if none specified
+    config_path = args.config
+    if not config_path:
+        default_config = Path(__file__).parent.parent / "config" / "robot_config.yaml"
+        if default_config.exists():
+            config_path = str(default_config)
+            print(f"📁 Using default config: {config_path}")
+    
+    try:
+        return asyncio.run(run(args, config_path))
+    except KeyboardInterrupt:
+        print("\n⚠️  Interrupted by user")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,10 +14,13 @@ import argparse
 import time
 from pathlib import Path
 
+import numpy as np
+
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from ur_controller import URRobotController
+from trajectory import Trajectory
 
 
 def test_basic_connection(controller: URRobotController) -> bool:
@@ -53,24 +56,32 @@ def test_basic_movements(controller: URRobotController) -> bool:
     
     print(f"📍 Initial pose: {[round(p, 3) for p in initial_pose]}")
     
-    # Test small movements
-    movements = [
-        ("Moving +10cm in X", [0.1, 0.0, 0.0, 0.0, 0.0, 0.0]),
-        ("Moving back to start", [-0.1, 0.0, 0.0, 0.0, 0.0, 0.0]),
-        ("Moving +5cm in Y", [0.0, 0.05, 0.0, 0.0, 0.0, 0.0]),
-        ("Moving back to start", [0.0, -0.05, 0.0, 0.0, 0.0, 0.0]),
+    # Test small movements (offsets accumulate, so each "back" returns to start)
+    descriptions = [
+        "Moving +10cm in X",
+        "Moving back to start",
+        "Moving +5cm in Y",
+        "Moving back to start",
     ]
+    offsets = np.array([
+        [0.1, 0.0, 0.0],
+        [-0.1, 0.0, 0.0],
+        [0.0, 0.05, 0.0],
+        [0.0, -0.05, 0.0],
+    ])
+    
+    # Calculate all target poses at once
+    targets = Trajectory(np.tile(initial_pose, (len(offsets), 1))).offset(np.cumsum(offsets, axis=0))
     
-    for description, delta in movements:
+    for description, target_pose in zip(descriptions, targets.to_list()):
         print(f" {description}...")
         
-        # Calculate target pose
-        target_pose = [initial_pose[i] + delta[i] for i in range(6)]
-        
         # Execute movement
         if controller.move_linear(target_pose, speed=0.1):
-            time.sleep(2)  # Wait for movement to complete
-            print("✅ Movement completed")
+            if controller.wait_until_settled(timeout=5.0):
+                print("✅ Movement completed")
+            else:
+                print("⚠️  Movement did not settle in time")
         else:
             print("❌ Movement failed")
             return False
@@ -37,6 +37,11 @@ def main():
                        help="Movement acceleration (m/s²)")
     parser.add_argument("--responsiveness", type=float, default=1.0,
                        help="Time between commands (seconds)")
+    parser.add_argument("--delta-mode", choices=["velocity", "dead_reckoned"],
+                       help="Execute deltas as speedL velocities or as moveL to a dead-reckoned pose "
+                            "(default: config or velocity)")
+    parser.add_argument("--settle", action="store_true",
+                       help="In dead_reckoned mode, start the next move as soon as the robot settles")
     
     args = parser.parse_args()
     
@@ -83,6 +88,8 @@ def main():
         
         # Initialize command processor
         processor = URCommandProcessor(controller)
+        if args.delta_mode:
+            processor.delta_mode = args.delta_mode
         
         print("🚀 Starting command execution...")
         print("Press Ctrl+C to stop")
@@ -91,7 +98,8 @@ def main():
         processor.process_synchronous_commands(
             args.json_source, 
             args.json_log, 
-            args.responsiveness
+            args.responsiveness,
+            settle=args.settle or None
         )
         
         print("✅ Command execution completed")
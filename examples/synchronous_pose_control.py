@@ -37,13 +37,22 @@ def main():
                        help="Movement acceleration (m/s²)")
     parser.add_argument("--responsiveness", type=float, default=2.0,
                        help="Time between commands (seconds)")
+    parser.add_argument("--profile", choices=["trapezoidal", "scurve"],
+                       help="Stream the whole job as one time-optimal servo trajectory "
+                            "using the configured safety limits instead of moveL + sleeps")
+    parser.add_argument("--settle", action="store_true",
+                       help="Start the next move as soon as the robot settles "
+                            "(responsiveness becomes the timeout)")
     
     args = parser.parse_args()
     
     print("🤖 UR Robot Controller - Synchronous Pose Mode")
     print("=" * 45)
     print(f"📁 Command file: {args.json_source}")
-    print(f"⏱️  Responsiveness: {args.responsiveness}s")
+    if args.profile:
+        print(f"📈 Profile: {args.profile} (time-optimal servo streaming)")
+    else:
+        print(f"⏱️  Responsiveness: {args.responsiveness}s")
     print(f"🏃 Speed: {args.speed} m/s")
     print(f"⚡ Acceleration: {args.acceleration} m/s²")
     
@@ -95,11 +104,19 @@ def main():
         processor = URCommandProcessor(controller)
         
         # Process pose commands
-        processor.process_synchronous_poses(
-            json_file=args.json_source,
-            log_file=args.json_log,
-            responsiveness=args.responsiveness
-        )
+        if args.profile:
+            processor.process_timed_poses(
+                json_file=args.json_source,
+                log_file=args.json_log,
+                profile=args.profile
+            )
+        else:
+            processor.process_synchronous_poses(
+                json_file=args.json_source,
+                log_file=args.json_log,
+                responsiveness=args.responsiveness,
+                settle=args.settle or None
+            )
         
     except KeyboardInterrupt:
         print("\n⏹️  Stopping robot...")
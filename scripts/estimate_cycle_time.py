@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+UR Job Cycle Time Estimator
+
+Predicts how long JSONL job files will take on the robot without running
+them, using the speed, acceleration and responsiveness from the robot config.
+
+Usage:
+    python scripts/estimate_cycle_time.py examples/synchronous_poses.jsonl
+    python scripts/estimate_cycle_time.py examples/ --config config/my_robot.yaml --json
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from cycle_time import CycleTimeEstimator
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+def collect_jobs(paths):
+    """Expand directories into the JSONL files they contain."""
+    jobs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            jobs.extend(sorted(path.glob('*.jsonl')))
+        else:
+            jobs.append(path)
+    return jobs
+
+
+def main():
+    """Main estimator function."""
+    parser = argparse.ArgumentParser(description="Estimate execution time of JSONL job files")
+    parser.add_argument("jobs", nargs="+", help="JSONL job files or directories of them")
+    parser.add_argument("--config", help="Path to configuration file (default: config/robot_config.yaml)")
+    parser.add_argument("--speed", type=float, help="Movement speed (m/s), overrides config")
+    parser.add_argument("--acceleration", type=float, help="Movement acceleration (m/s²), overrides config")
+    parser.add_argument("--responsiveness", type=float, help="Time between commands (seconds), overrides config")
+    parser.add_argument("--profile", choices=["trapezoidal", "scurve"],
+                        help="Estimate pose jobs as time-optimal servo trajectories")
+    parser.add_argument("--delta-mode", choices=["velocity", "dead_reckoned"],
+                        help="How delta jobs run, overrides movement.delta_mode")
+    parser.add_argument("--start-pose", type=float, nargs=6, metavar=("X", "Y", "Z", "RX", "RY", "RZ"),
+                        help="TCP pose the robot starts from (default: first pose of each job)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    
+    args = parser.parse_args()
+    
+    # Use default config if none specified
+    config = {}
+    config_path = args.config
+    if not config_path:
+        default_config = Path(__file__).parent.parent / "config" / "robot_config.yaml"
+        if default_config.exists():
+            config_path = str(default_config)
+    if config_path:
+        if yaml is None:
+            print("⚠️  PyYAML not found, ignoring configuration file")
+        else:
+            with open(config_path, 'r') as f:
+                config = yaml.safe_load(f) or {}
+    
+    estimator = CycleTimeEstimator(
+        config,
+        speed=args.speed,
+        acceleration=args.acceleration,
+        responsiveness=args.responsiveness,
+        profile=args.profile,
+        delta_mode=args.delta_mode,
+    )
+    
+    jobs = collect_jobs(args.jobs)
+    missing = [str(job) for job in jobs if not job.exists()]
+    if missing:
+        print(f"❌ Job file(s) not found: {', '.join(missing)}")
+        return 1
+    
+    estimates = estimator.estimate_many(jobs, args.start_pose)
+    
+    if args.json:
+        print(json.dumps([estimate.to_dict() for estimate in estimates], indent=2))
+        return 0
+    
+    print("⏱️  UR Job Cycle Time Estimate")
+    print("=" * 60)
+    for estimate in estimates:
+        print(f"{estimate.name:<40} {estimate.kind:<6} {len(estimate.segment_times):>5} cmds "
+              f"{estimate.total_time:>8.2f}s")
+    print("-" * 60)
+    print(f"Total for {len(estimates)} job(s): {sum(e.total_time for e in estimates):.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Control Loop Jitter Measurement
+
+Runs the library's own control loops for a fixed time and prints their
+timing histograms (parse, RTDE call, sleep overshoot and period):
+
+- servo:  ``servo_trajectory`` holding the current pose at the RTDE frequency
+- stream: ``process_asynchronous_commands`` at ``--responsiveness`` while a
+  producer thread appends delta commands to a temporary file
+
+With ``--stand-in`` no robot or ur_rtde installation is needed: the RTDE
+interfaces are replaced by an in-process stand-in that answers every call
+after ``--rtde-latency`` seconds, so the numbers show the host and Python
+overhead alone. Use it to compare ``--realtime`` against the default, then
+repeat against URSim or the robot.
+
+Usage:
+    python scripts/measure_loop_jitter.py --stand-in --mode servo --frequency 500 --duration 10
+    python scripts/measure_loop_jitter.py --robot-ip 127.0.0.1 --mode stream --responsiveness 0.01
+    python scripts/measure_loop_jitter.py --stand-in --mode stream --duration 5 --trace trace.json
+"""
+
+import sys
+import json
+import time
+import types
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+
+class StandInControl:
+    """RTDE control interface stand-in: accepts every command after a fixed latency."""
+    
+    FLAG_VERBOSE = 0
+    
+    def __init__(self, robot_ip, frequency=500.0, flags=0, latency=0.0):
+        self.dt = 1.0 / frequency
+        self.latency = latency
+    
+    def _answer(self, *args, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        return True
+    
+    speedL = moveL = moveJ = servoL = servoJ = servoStop = stopL = stopJ = _answer
+    
+    def isConnected(self):
+        return True
+    
+    def isSteady(self):
+        return True
+    
+    def getAsyncOperationProgress(self):
+        return -1
+    
+    def initPeriod(self):
+        return time.perf_counter()
+    
+    def waitPeriod(self, t_start):
+        remaining = t_start + self.dt - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+    
+    def disconnect(self):
+        pass
+
+
+class StandInReceive:
+    """RTDE receive interface stand-in: a robot at rest."""
+    
+    def __init__(self, robot_ip, frequency=500.0):
+        self.pose = [0.3, -0.2, 0.4, 0.0, 3.14, 0.0]
+    
+    def isConnected(self):
+        return True
+    
+    def getActualTCPPose(self):
+        return list(self.pose)
+    
+    getTargetTCPPose = getActualTCPPose
+    
+    def getActualTCPSpeed(self):
+        return [0.0] * 6
+    
+    getActualQ = getActualQd = getActualTCPSpeed
+    
+    def getRobotMode(self):
+        return 7
+    
+    def getSafetyMode(self):
+        return 1
+    
+    def disconnect(self):
+        pass
+
+
+def install_stand_in(latency: float) -> None:
+    """Register the stand-in interfaces as the ur_rtde modules."""
+    control = types.ModuleType('rtde_control')
+    control.RTDEControlInterface = lambda *args: StandInControl(*args, latency=latency)
+    control.RTDEControlInterface.FLAG_VERBOSE = 0
+    receive = types.ModuleType('rtde_receive')
+    receive.RTDEReceiveInterface = StandInReceive
+    dashboard = types.ModuleType('dashboard_client')
+    dashboard.DashboardClient = lambda *args: types.SimpleNamespace(
+        connect=lambda: None, isConnected=lambda: True, stop=lambda: None,
+        pause=lambda: None, disconnect=lambda: None)
+    sys.modules.update(rtde_control=control, rtde_receive=receive, dashboard_client=dashboard)
+
+
+def run_servo(controller, duration: float):
+    """Hold the current pose with servoL for ``duration`` seconds."""
+    from trajectory import Trajectory
+    
+    pose = controller.get_tcp_pose()
+    controller.servo_trajectory(Trajectory([pose, pose], [0.0, duration]))
+    return controller.servo_timer
+
+
+def run_stream(controller, duration: float, responsiveness: float, command_rate: float):
+    """Stream small deltas from a producer thread into the asynchronous processor."""
+    from ur_controller import URCommandProcessor
+    
+    processor = URCommandProcessor(controller)
+    processor.watchdog.enabled = False
+    json_file = Path(tempfile.mkdtemp()) / 'jitter_deltas.jsonl'
+    json_file.touch()
+    
+    threading.Thread(target=processor.process_asynchronous_commands,
+                     args=(str(json_file), responsiveness), daemon=True).start()
+    
+    end = time.monotonic() + duration
+    sign = 1.0
+    with open(json_file, 'a') as f:
+        while time.monotonic() < end:
+            f.write(json.dumps({'dx': 0.01 * sign}) + '\n')
+            f.flush()
+            sign = -sign
+            time.sleep(1.0 / command_rate)
+    return processor.timers['asynchronous_commands']
+
+
+def main():
+    """Measure loop timing."""
+    parser = argparse.ArgumentParser(description="Measure control loop jitter")
+    parser.add_argument("--config", help="Path to configuration file")
+    parser.add_argument("--robot-ip", default="127.0.0.1", help="Robot IP address")
+    parser.add_argument("--stand-in", action="store_true",
+                       help="Use the in-process stand-in instead of a robot")
+    parser.add_argument("--rtde-latency", type=float, default=0.0,
+                       help="Stand-in time per control call (seconds)")
+    parser.add_argument("--mode", choices=["servo", "stream"], default="servo", help="Loop to measure")
+    parser.add_argument("--frequency", type=float, default=500.0, help="RTDE frequency (Hz)")
+    parser.add_argument("--responsiveness", type=float, default=0.01,
+                       help="Stream mode cycle time (seconds)")
+    parser.add_argument("--command-rate", type=float, default=50.0,
+                       help="Stream mode producer rate (commands/s)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measurement time (seconds)")
+    parser.add_argument("--realtime", action="store_true", help="Enable the real-time mode")
+    parser.add_argument("--export", help="Write the histograms to this JSON file")
+    parser.add_argument("--trace", help="Record profiling spans and write a Chrome trace to this file")
+    
+    args = parser.parse_args()
+    
+    if args.stand_in:
+        install_stand_in(args.rtde_latency)
+    
+    from ur_controller import URRobotController
+    
+    print("⏱️  UR Control Loop Jitter")
+    print("=" * 40)
+    print(f"🔧 Backend: {'stand-in' if args.stand_in else args.robot_ip}, mode: {args.mode}, "
+          f"realtime: {'on' if args.realtime else 'off'}")
+    
+    if args.config:
+        controller = URRobotController(config_path=args.config)
+    else:
+        controller = URRobotController(robot_ip=args.robot_ip, frequency=args.frequency)
+    controller.frequency = args.frequency
+    controller.realtime.enabled = args.realtime
+    
+    if args.trace:
+        from profiling import PROFILER
+        PROFILER.enabled = True
+    
+    if not controller.connect():
+        print("❌ Failed to connect to robot")
+        return 1
+    
+    try:
+        for step, outcome in controller.realtime.report.items():
+            print(f"   {step}: {outcome}")
+        print(f"🚀 Measuring for {args.duration}s...")
+        
+        if args.mode == "servo":
+            timer = run_servo(controller, args.duration)
+        else:
+            timer = run_stream(controller, args.duration, args.responsiveness, args.command_rate)
+        
+        print("\n📊 Results (microseconds)")
+        for line in timer.summary():
+            print(f"   {line}")
+        
+        if args.export:
+            with open(args.export, 'w') as f:
+                json.dump(timer.to_dict(), f, indent=2)
+            print(f"💾 Histograms written to {args.export}")
+        
+        if args.trace:
+            PROFILER.export(args.trace)
+            print(f"🔍 Trace written to {args.trace} (open in ui.perfetto.dev)")
+        return 0
+    finally:
+        controller.disconnect()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
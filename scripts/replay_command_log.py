@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+UR Command Log Replay
+
+Replays a command log written by the synchronous processors (their
+``log_file``) on the simulated robot, faster than real time, and reports
+how far the reproduced trajectory is from the commanded one. Exits with 1
+if any command failed or missed its pose by more than the tolerance, so it
+can run as a regression test.
+
+Usage:
+    python scripts/replay_command_log.py logs/commands.jsonl
+    python scripts/replay_command_log.py logs/commands.jsonl --speed 50
+    python scripts/replay_command_log.py logs/commands.jsonl --config config/robot_config.yaml \\
+        --telemetry logs/telemetry.jsonl --report replay_report.json
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from clock import DilatedClock, VirtualClock
+from simulated_robot import SimulatedRobot
+from replay import ReplayEngine, load_command_log, load_telemetry
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+def main():
+    """Replay a command log and report the differences."""
+    parser = argparse.ArgumentParser(description="Replay a command log on the simulated robot")
+    parser.add_argument("log_file", help="Command log (JSONL) written by a synchronous processor")
+    parser.add_argument("--config", help="Path to configuration file")
+    parser.add_argument("--speed", type=float,
+                        help="Time dilation, e.g. 50 = fifty times real time (0 = virtual clock, as fast as possible)")
+    parser.add_argument("--max-gap", type=float, help="Shorten pauses between commands to this (seconds)")
+    parser.add_argument("--telemetry", help="Recorded telemetry (JSONL) to compare against as well")
+    parser.add_argument("--position-tolerance", type=float, help="Allowed position error (m)")
+    parser.add_argument("--orientation-tolerance", type=float, help="Allowed orientation error (rad)")
+    parser.add_argument("--report", help="Write the full report to this JSON file")
+    
+    args = parser.parse_args()
+    
+    config = {}
+    if args.config:
+        if yaml is None:
+            print("⚠️  PyYAML not found, ignoring configuration file")
+        else:
+            with open(args.config, 'r') as f:
+                config = yaml.safe_load(f) or {}
+    
+    from ur_controller import URRobotController, URCommandProcessor
+    
+    entries = load_command_log(args.log_file)
+    if not entries:
+        print(f"❌ No commands found in {args.log_file}")
+        return 1
+    
+    speed = args.speed if args.speed is not None else config.get('replay', {}).get('speed', 0.0)
+    robot = SimulatedRobot.from_config(config, clock=DilatedClock(speed) if speed else VirtualClock())
+    controller = URRobotController(config_path=args.config, backend=robot)
+    
+    print("⏪ UR Command Log Replay")
+    print("=" * 40)
+    print(f"📄 {len(entries)} commands from {args.log_file}, "
+          f"{f'replaying at {speed:g}x' if speed else 'replaying on a virtual clock'}")
+    
+    if not controller.connect():
+        print("❌ Failed to connect to the simulated robot")
+        return 1
+    
+    try:
+        engine = ReplayEngine.from_config(URCommandProcessor(controller), config)
+        if args.max_gap is not None:
+            engine.max_gap = args.max_gap
+        if args.position_tolerance is not None:
+            engine.position_tolerance = args.position_tolerance
+        if args.orientation_tolerance is not None:
+            engine.orientation_tolerance = args.orientation_tolerance
+        
+        telemetry = load_telemetry(args.telemetry) if args.telemetry else None
+        report = engine.run(entries, telemetry)
+    finally:
+        controller.disconnect()
+    
+    print("\n📊 Results")
+    for line in report.summary():
+        print(f"   {line}")
+    
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report.to_dict(), f, indent=2)
+        print(f"💾 Report written to {args.report}")
+    
+    print("✅ Replay matches the log" if report.passed else "❌ Replay differs from the log")
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
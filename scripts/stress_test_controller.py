@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Controller Concurrency Stress Test
+
+Hammers one URRobotController from many threads at once: reader threads
+take state snapshots as fast as they can while command threads issue small
+moves around the start pose. Checks that
+
+- every control interface call ran on the single command owner thread,
+- snapshots never go backwards for any reader,
+- no call raised,
+
+and reports read and command latencies. Run it against URSim first, or
+against the in-process simulated robot with ``--simulated``; pytest runs a
+short simulated check from this file.
+
+Usage:
+    python scripts/stress_test_controller.py --robot-ip 127.0.0.1 --readers 16 --commanders 4
+    python scripts/stress_test_controller.py --simulated --duration 5
+    python -m pytest scripts/stress_test_controller.py
+"""
+
+import sys
+import time
+import argparse
+import threading
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from ur_controller import URRobotController
+from simulated_robot import SimulatedRobot
+from clock import DilatedClock
+
+
+class ThreadRecorder:
+    """Wrap the control interface and record which threads call it."""
+    
+    def __init__(self, rtde_c):
+        self._rtde_c = rtde_c
+        self.threads = set()
+    
+    def __getattr__(self, name):
+        attr = getattr(self._rtde_c, name)
+        if not callable(attr):
+            return attr
+        
+        def recorded(*args, **kwargs):
+            self.threads.add(threading.current_thread().name)
+            return attr(*args, **kwargs)
+        return recorded
+
+
+def percentile(values, fraction):
+    """Percentile of a list of numbers (nearest rank)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def reader(controller, stop, results):
+    """Take snapshots in a tight loop and check they never go backwards."""
+    # In-process backends publish no snapshots: read the pose directly instead
+    direct = controller.backend is not None
+    last_sequence = 0
+    latencies = []
+    reads = 0
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        state = controller.get_tcp_pose() if direct else controller.state
+        latencies.append(time.perf_counter() - t0)
+        reads += 1
+        if state is None:
+            results['errors'].append("No TCP pose" if direct else "No state snapshot")
+            continue
+        if direct:
+            # The simulated robot serializes reads on one lock: yield so the readers
+            # cannot form a lock convoy that starves the command threads
+            time.sleep(0)
+            continue
+        if state.sequence < last_sequence:
+            results['errors'].append(f"Snapshot went backwards: {state.sequence} < {last_sequence}")
+        last_sequence = state.sequence
+    results['reads'].append(reads)
+    results['read_latencies'].extend(latencies[::100])
+
+
+def commander(controller, start_pose, index, stop, results, amplitude, speed):
+    """Alternate small moves above and back to the start pose."""
+    up = list(start_pose)
+    up[2] += amplitude * (1 + index % 3) / 3
+    targets = [up, list(start_pose)]
+    latencies = []
+    rejected = 0
+    count = 0
+    while not stop.is_set():
+        target = targets[count % 2]
+        t0 = time.perf_counter()
+        try:
+            if index % 2:
+                ok = controller.move_linear_async(target, speed=speed).result(timeout=30)
+            else:
+                ok = controller.move_linear(target, speed=speed)
+            controller.get_tcp_pose()
+            if not ok:
+                rejected += 1
+        except Exception as e:
+            results['errors'].append(f"Commander {index}: {e}")
+        latencies.append(time.perf_counter() - t0)
+        count += 1
+    # Counts are per thread and only published once, so no increments race
+    results['rejected'].append(rejected)
+    results['command_latencies'].extend(latencies)
+
+
+def run_stress_test(controller, readers=16, commanders=4, duration=20.0, amplitude=0.01, speed=0.1):
+    """
+    Run reader and command threads against a connected controller.
+    
+    Returns:
+        Results dict with the errors, reads and latencies per kind, the
+        number of rejected moves, the threads that used the control
+        interface and ``failures`` (empty if the controller stayed consistent)
+    """
+    recorder = ThreadRecorder(controller.rtde_c)
+    controller.rtde_c = recorder
+    
+    results = {'errors': [], 'reads': [], 'read_latencies': [], 'command_latencies': [], 'rejected': [],
+               'failures': []}
+    stop = threading.Event()
+    
+    try:
+        start_pose = controller.get_tcp_pose()
+        if start_pose is None:
+            results['failures'].append("Could not read start pose")
+            return results
+        results['start_pose'] = start_pose
+        
+        threads = [threading.Thread(target=reader, args=(controller, stop, results))
+                   for _ in range(readers)]
+        threads += [threading.Thread(target=commander,
+                                     args=(controller, start_pose, i, stop, results, amplitude, speed))
+                    for i in range(commanders)]
+        
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        
+        # Leave the robot where it started
+        controller.move_linear(start_pose, speed=speed)
+    finally:
+        stop.set()
+        controller.rtde_c = recorder._rtde_c
+    
+    # Stops bypass the owner thread by design, but none are issued here
+    command_threads = {name for name in recorder.threads if name.startswith('URCommand')}
+    other_threads = recorder.threads - command_threads
+    results['command_threads'] = command_threads
+    
+    if len(command_threads) != 1 or other_threads:
+        results['failures'].append(f"Control interface used outside the owner thread: {sorted(other_threads)}")
+    if results['errors']:
+        results['failures'].append(f"{len(results['errors'])} error(s), first: {results['errors'][0]}")
+    return results
+
+
+def test_controller_under_load():
+    """Short stress run against the simulated robot."""
+    controller = URRobotController(backend=SimulatedRobot(clock=DilatedClock(10.0)))
+    assert controller.connect()
+    try:
+        results = run_stress_test(controller, readers=8, commanders=4, duration=2.0)
+    finally:
+        controller.disconnect()
+    assert not results['failures'], results['failures']
+    assert sum(results['reads']) and results['command_latencies']
+
+
+def main():
+    """Main stress test function."""
+    parser = argparse.ArgumentParser(description="Stress test URRobotController from many threads")
+    parser.add_argument("--config", help="Path to configuration file")
+    parser.add_argument("--robot-ip", default="127.0.0.1", help="Robot IP address")
+    parser.add_argument("--readers", type=int, default=16, help="Number of state reader threads")
+    parser.add_argument("--commanders", type=int, default=4, help="Number of command threads")
+    parser.add_argument("--duration", type=float, default=20.0, help="Test duration (seconds)")
+    parser.add_argument("--amplitude", type=float, default=0.01, help="Move distance above start pose (m)")
+    parser.add_argument("--speed", type=float, default=0.1, help="Move speed (m/s)")
+    parser.add_argument("--simulated", action="store_true",
+                        help="Use the in-process simulated robot (10x real time) instead of RTDE")
+    
+    args = parser.parse_args()
+    
+    print("🧵 UR Controller Concurrency Stress Test")
+    print("=" * 50)
+    print(f"📡 Robot: {'simulated' if args.simulated else args.robot_ip}")
+    print(f"👀 Readers: {args.readers}   🦾 Commanders: {args.commanders}   ⏱️  {args.duration}s")
+    
+    if args.simulated:
+        controller = URRobotController(config_path=args.config, backend=SimulatedRobot(clock=DilatedClock(10.0)))
+    elif args.config:
+        controller = URRobotController(config_path=args.config)
+    else:
+        controller = URRobotController(robot_ip=args.robot_ip, robot_type="simulation")
+    
+    if not controller.connect():
+        print("❌ Failed to connect to robot")
+        return 1
+    
+    try:
+        results = run_stress_test(controller, args.readers, args.commanders, args.duration,
+                                  args.amplitude, args.speed)
+    finally:
+        controller.disconnect()
+    if 'start_pose' in results:
+        print(f"📍 Start pose: {[round(p, 3) for p in results['start_pose']]}")
+    
+    reads = sum(results['reads'])
+    read_latencies = results['read_latencies']
+    command_latencies = results['command_latencies']
+    
+    print("\n📊 Results")
+    print("-" * 50)
+    print(f"State reads:      {reads} ({reads / args.duration:,.0f}/s)")
+    print(f"Read latency:     p50 {percentile(read_latencies, 0.5) * 1e6:.1f} µs   "
+          f"p99 {percentile(read_latencies, 0.99) * 1e6:.1f} µs")
+    print(f"Commands:         {len(command_latencies)} ({sum(results['rejected'])} rejected or superseded)")
+    print(f"Command latency:  p50 {percentile(command_latencies, 0.5) * 1e3:.1f} ms   "
+          f"p99 {percentile(command_latencies, 0.99) * 1e3:.1f} ms")
+    print(f"Control threads:  {sorted(results.get('command_threads', ()))}")
+    
+    for failure in results['failures']:
+        print(f"❌ {failure}")
+    if results['failures']:
+        return 1
+    print("✅ Controller stayed consistent under load")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+UR Job Library Validation
+
+Checks every JSONL job in a directory (``paths.commands_dir`` by default)
+in parallel worker processes: parse errors, safety limits, workspace,
+reachability and cycle time, plus an optional dry run on the simulated
+robot. Exits with 1 if any job fails, so it can run before each shift or
+nightly.
+
+Usage:
+    python scripts/validate_jobs.py
+    python scripts/validate_jobs.py jobs/ --config config/my_robot.yaml --dry-run --report validation.json
+"""
+
+import sys
+import json
+import logging
+import argparse
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from job_validation import validate_jobs
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+def collect_jobs(paths):
+    """Expand directories into the JSONL files they contain."""
+    jobs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            jobs.extend(sorted(path.glob('*.jsonl')))
+        else:
+            jobs.append(path)
+    return jobs
+
+
+def main():
+    """Validate a job library and report the results."""
+    parser = argparse.ArgumentParser(description="Validate JSONL job files in parallel")
+    parser.add_argument("jobs", nargs="*", help="JSONL job files or directories (default: paths.commands_dir)")
+    parser.add_argument("--config", help="Path to configuration file (default: config/robot_config.yaml)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: validation.workers or one per core)")
+    parser.add_argument("--dry-run", action="store_true", help="Also run every job on the simulated robot")
+    parser.add_argument("--responsiveness", type=float, help="Time between commands (seconds), overrides config")
+    parser.add_argument("--report", help="Write the full report to this JSON file")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    
+    args = parser.parse_args()
+    
+    # Use default config if none specified
+    config = {}
+    config_path = args.config
+    if not config_path:
+        default_config = Path(__file__).parent.parent / "config" / "robot_config.yaml"
+        if default_config.exists():
+            config_path = str(default_config)
+    if config_path:
+        if yaml is None:
+            print("⚠️  PyYAML not found, ignoring configuration file")
+            config_path = None
+        else:
+            with open(config_path, 'r') as f:
+                config = yaml.safe_load(f) or {}
+    
+    # Keep per-move messages of the dry runs out of the report
+    logging.basicConfig(level=logging.WARNING, format='%(name)s - %(levelname)s - %(message)s')
+    
+    validation = config.get('validation', {})
+    paths = args.jobs or [config.get('paths', {}).get('commands_dir', 'examples')]
+    jobs = collect_jobs(paths)
+    missing = [str(job) for job in jobs if not job.exists()]
+    if missing:
+        print(f"❌ Job file(s) not found: {', '.join(missing)}")
+        return 1
+    if not jobs:
+        print(f"❌ No job files found in {', '.join(map(str, paths))}")
+        return 1
+    
+    report = validate_jobs(
+        jobs,
+        config_path,
+        workers=args.workers or validation.get('workers'),
+        dry_run=args.dry_run or validation.get('dry_run', False),
+        responsiveness=args.responsiveness,
+    )
+    
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report.to_dict(), f, indent=2)
+    
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+        return 0 if report.passed else 1
+    
+    print("🔍 UR Job Library Validation")
+    print("=" * 60)
+    for line in report.summary():
+        print(line)
+    if args.report:
+        print(f"💾 Report written to {args.report}")
+    
+    print("✅ All jobs passed" if report.passed else "❌ Some jobs failed validation")
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
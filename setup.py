@@ -76,6 +76,7 @@ setup(
         "console_scripts": [
             "ur-check-status=scripts.check_robot_status:main",
             "ur-visual-test=scripts.visual_test:main",
+            "ur-estimate-cycle-time=scripts.estimate_cycle_time:main",
         ],
     },
     include_package_data=True,
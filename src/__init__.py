@@ -6,9 +6,18 @@ Supports both simulation (URSim) and physical robots.
 """
 
 from .ur_controller import URRobotController, URCommandProcessor
+from .trajectory import Trajectory
+from .kinematics import URKinematics
+from .time_parameterization import MotionLimits, parameterize_waypoints, parameterize_joint_path
+from .cycle_time import CycleTimeEstimator
+from .async_controller import AsyncURRobotController, AsyncCommandProcessor
+from .command_sources import FileCommandSource, SocketCommandSource, QueueCommandSource
 
 __version__ = "1.0.0"
 __author__ = "Erol Cemiloglu"
 __license__ = "MIT"
 
-__all__ = ["URRobotController", "URCommandProcessor"]
+__all__ = ["URRobotController", "URCommandProcessor", "Trajectory", "URKinematics",
+           "MotionLimits", "parameterize_waypoints", "parameterize_joint_path",
+           "CycleTimeEstimator", "AsyncURRobotController", "AsyncCommandProcessor",
+           "FileCommandSource", "SocketCommandSource", "QueueCommandSource"]
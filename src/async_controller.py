@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+Asyncio UR Robot Controller
+
+Async counterparts of ``URRobotController`` and ``URCommandProcessor`` for
+use inside an asyncio application, so one event loop can drive several
+robots and command sources without a thread per robot.
+
+- Moves are awaitable. Linear and joint moves use the robot's asynchronous
+  motion and complete through a future, so no thread is held while the
+  robot moves. Cancelling the awaiting task stops the robot.
+- Other RTDE calls run on a small dedicated executor.
+- State is read from the controller's lock-free snapshots; ``states()`` is
+  an async iterator over new snapshots.
+- Processors take any ``AsyncCommandSource`` (files, sockets, queues).
+"""
+
+import json
+import asyncio
+import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional, TextIO
+
+try:
+    from .ur_controller import URRobotController, URCommandProcessor
+    from .robot_state import RobotState
+    from .trajectory import Trajectory
+    from .coalescing import DeltaCoalescer
+    from .command_sources import AsyncCommandSource
+    from .profiling import span
+    from .hot_logging import HotPathLogger
+    from .clock import SYSTEM_CLOCK, SystemClock
+except ImportError:
+    from ur_controller import URRobotController, URCommandProcessor
+    from robot_state import RobotState
+    from trajectory import Trajectory
+    from coalescing import DeltaCoalescer
+    from command_sources import AsyncCommandSource
+    from profiling import span
+    from hot_logging import HotPathLogger
+    from clock import SYSTEM_CLOCK, SystemClock
+
+POSE_KEYS = ('x', 'y', 'z', 'rx', 'ry', 'rz')
+DELTA_KEYS = ('dx', 'dy', 'dz', 'drx', 'dry', 'drz')
+
+
+class AsyncURRobotController:
+    """Asyncio interface to a URRobotController."""
+    
+    def __init__(self, config_path: Optional[str] = None, robot_ip: str = "127.0.0.1",
+                 robot_type: str = "simulation", frequency: float = 500.0,
+                 controller: Optional[URRobotController] = None, max_workers: int = 2):
+        """
+        Initialize the async controller.
+        
+        Args:
+            config_path: Path to YAML configuration file
+            robot_ip: IP address of the robot or simulator
+            robot_type: "simulation" or "physical"
+            frequency: RTDE communication frequency in Hz
+            controller: Existing controller to wrap instead of creating one
+            max_workers: Threads for blocking RTDE calls (connect, speedL, servo streams)
+        """
+        self.controller = controller or URRobotController(config_path, robot_ip, robot_type, frequency)
+        self.logger = logging.getLogger('AsyncURController')
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='URAsync')
+    
+    @property
+    def config(self) -> Dict:
+        return self.controller.config
+    
+    @property
+    def clock(self) -> SystemClock:
+        """Clock the robot runs on (a simulated robot's clock, else the system clock)."""
+        return self.controller.clock
+    
+    async def sleep(self, seconds: float) -> None:
+        """
+        Sleep on the robot's clock without blocking the event loop.
+        
+        The system clock sleeps with asyncio; a simulated robot's clock sleeps
+        on the executor, so the async loops run on the robot's time.
+        """
+        if self.clock is SYSTEM_CLOCK:
+            await asyncio.sleep(max(seconds, 0.0))
+        else:
+            await self._run(self.clock.sleep, seconds)
+    
+    @property
+    def state(self) -> Optional[RobotState]:
+        """Latest robot state snapshot."""
+        return self.controller.state
+    
+    async def _run(self, function, *args, **kwargs):
+        """Run a blocking controller call on the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(function, *args, **kwargs))
+    
+    async def connect(self) -> bool:
+        """Connect to the robot via RTDE."""
+        return await self._run(self.controller.connect)
+    
+    async def disconnect(self) -> None:
+        """Disconnect from the robot."""
+        await self._run(self.controller.disconnect)
+    
+    def close(self) -> None:
+        """Release the executor threads (after disconnect)."""
+        self._executor.shutdown(wait=False)
+    
+    async def __aenter__(self) -> 'AsyncURRobotController':
+        if not await self.connect():
+            raise ConnectionError(f"Failed to connect to robot at {self.controller.robot_ip}")
+        return self
+    
+    async def __aexit__(self, *exc) -> None:
+        await self.disconnect()
+        self.close()
+    
+    def is_connected(self) -> bool:
+        """Check if robot is connected."""
+        return self.controller.is_connected()
+    
+    def get_tcp_pose(self) -> Optional[List[float]]:
+        """Get current TCP pose from the latest state snapshot."""
+        return self.controller.get_tcp_pose()
+    
+    async def start_move_linear(self, target_pose: List[float], speed: Optional[float] = None,
+                                acceleration: Optional[float] = None) -> asyncio.Future:
+        """
+        Start a linear move without waiting for it to complete.
+        
+        The safety checks and the moveL call run on the executor, so the
+        event loop is free while they do.
+        
+        Returns:
+            Future resolving to True when the motion completes (False if
+            rejected or superseded); cancelling it calls stopL
+        """
+        future = await self._run(self.controller.move_linear_async, target_pose, speed, acceleration)
+        return asyncio.wrap_future(future)
+    
+    async def move_linear(self, target_pose: List[float], speed: Optional[float] = None,
+                          acceleration: Optional[float] = None) -> bool:
+        """Move linearly to a pose and wait until the motion completes."""
+        return await (await self.start_move_linear(target_pose, speed, acceleration))
+    
+    async def start_move_joint(self, joint_positions: List[float], speed: Optional[float] = None,
+                               acceleration: Optional[float] = None) -> asyncio.Future:
+        """
+        Start a joint move without waiting for it to complete (checked and sent on the executor).
+        
+        Returns:
+            Future resolving to True when the motion completes; cancelling it calls stopJ
+        """
+        future = await self._run(self.controller.move_joint_async, joint_positions, speed, acceleration)
+        return asyncio.wrap_future(future)
+    
+    async def move_joint(self, joint_positions: List[float], speed: Optional[float] = None,
+                         acceleration: Optional[float] = None) -> bool:
+        """Move to joint positions and wait until the motion completes."""
+        return await (await self.start_move_joint(joint_positions, speed, acceleration))
+    
+    async def move_velocity(self, velocity: List[float], acceleration: Optional[float] = None,
+                            duration: float = 1.0) -> bool:
+        """Apply a velocity command (returns once sent, like speedL)."""
+        return await self._run(self.controller.move_velocity, velocity, acceleration, duration)
+    
+    async def move_path(self, trajectory: Trajectory, speed: Optional[float] = None,
+                        acceleration: Optional[float] = None, blend: float = 0.0) -> bool:
+        """Move linearly through every pose of a trajectory."""
+        return await self._run(self.controller.move_path, trajectory, speed, acceleration, blend)
+    
+    async def servo_trajectory(self, trajectory: Trajectory, joint_space: bool = False,
+                               lookahead_time: float = 0.1, gain: float = 300.0) -> bool:
+        """Stream a time-stamped trajectory with servo commands."""
+        return await self._run(self.controller.servo_trajectory, trajectory, joint_space,
+                               lookahead_time, gain)
+    
+    async def wait_until_settled(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the current motion has completed, without blocking the event loop.
+        
+        Args:
+            timeout: Maximum time to wait in seconds (default: movement.settle.timeout)
+        
+        Returns:
+            True if the robot settled, False on timeout or if not connected
+        """
+        controller = self.controller
+        if not controller.is_connected():
+            self.logger.error("Not connected to robot")
+            return False
+        
+        timeout = controller.settle_timeout if timeout is None else timeout
+        deadline = self.clock.monotonic() + timeout
+        settled_polls = 0
+        last_sequence = -1
+        
+        while True:
+            state = controller.state
+            sequence = state.sequence if state is not None else None
+            if sequence is None or sequence != last_sequence:
+                last_sequence = sequence
+                settled = await self._run(controller.is_settled)
+                settled_polls = settled_polls + 1 if settled else 0
+            if settled_polls >= controller.settle_samples:
+                return True
+            if self.clock.monotonic() >= deadline:
+                self.logger.warning(f"Robot did not settle within {timeout}s")
+                return False
+            await self.sleep(controller.settle_poll_interval)
+    
+    def emergency_stop(self) -> bool:
+        """Emergency stop the robot (returns immediately)."""
+        return self.controller.emergency_stop()
+    
+    async def stop_motion(self, deceleration: float = 2.0) -> bool:
+        """Decelerate the current motion to rest without latching a stop."""
+        return await self._run(self.controller.stop_motion, deceleration)
+    
+    async def states(self, interval: Optional[float] = None) -> AsyncIterator[RobotState]:
+        """
+        Iterate over new state snapshots as they are published.
+        
+        Args:
+            interval: Time between checks for a new snapshot (default: the snapshot period)
+        """
+        interval = interval or 1.0 / self.controller.state_frequency
+        last_sequence = -1
+        while True:
+            state = self.controller.state
+            if state is not None and state.sequence != last_sequence:
+                last_sequence = state.sequence
+                yield state
+            await asyncio.sleep(interval)
+
+
+class AsyncCommandProcessor:
+    """Process commands from async command sources."""
+    
+    def __init__(self, controller: AsyncURRobotController):
+        """Initialize with an async robot controller."""
+        self.controller = controller
+        self.logger = logging.getLogger('AsyncCommandProcessor')
+        self.hot_log = HotPathLogger.from_config(self.logger, controller.controller.config)
+        
+        # Shares deadband, dead reckoning and settle settings with the blocking processor
+        self.processor = URCommandProcessor(controller.controller)
+    
+    async def process_synchronous_commands(self, source: AsyncCommandSource, log_file: Optional[str] = None,
+                                           responsiveness: float = 1.0, settle: Optional[bool] = None) -> None:
+        """
+        Execute delta commands one after another.
+        
+        Args:
+            source: Source of delta commands
+            log_file: Optional log file path
+            responsiveness: Time between commands in seconds
+            settle: In dead-reckoned delta mode, wait for each move to settle
+                instead of sleeping; defaults to movement.settle.enabled
+        """
+        if not self.controller.is_connected():
+            self.logger.error("Robot not connected")
+            return
+        
+        processor = self.processor
+        processor.commanded_pose = None
+        processor.tracker.reset()
+        dead_reckoned = processor.delta_mode == 'dead_reckoned'
+        settle = (processor.settle if settle is None else settle) and dead_reckoned
+        
+        log_f = open(log_file, 'a') if log_file else None
+        try:
+            async for cmd in source:
+                if not processor.accept(cmd):
+                    continue
+                processor.tracker.dispatched(cmd)
+                
+                # Same reckoning, log entry and safety checks as the blocking processor
+                try:
+                    planned = await self.controller._run(processor.plan_delta, cmd, log_f)
+                except (ValueError, TypeError) as e:
+                    self.hot_log.error("Invalid command format: %s", e)
+                    continue
+                if planned is None:
+                    self.logger.error(f"Failed to execute command: {cmd}")
+                    break
+                target_pose, delta = planned
+                
+                if dead_reckoned:
+                    ok = await self.controller.move_linear(target_pose)
+                    processor.commanded_pose = target_pose if ok else None
+                else:
+                    ok = await self.controller.move_velocity(delta)
+                if not ok:
+                    self.logger.error(f"Failed to execute command: {cmd}")
+                    break
+                
+                await self._wait_after_move(responsiveness, settle)
+        finally:
+            if log_f:
+                log_f.close()
+            self.processor.log_tracking()
+            self.hot_log.flush()
+    
+    async def process_synchronous_poses(self, source: AsyncCommandSource, log_file: Optional[str] = None,
+                                        responsiveness: float = 1.0, settle: Optional[bool] = None) -> None:
+        """
+        Execute absolute pose commands one after another.
+        
+        Args:
+            source: Source of pose commands
+            log_file: Optional log file path
+            responsiveness: Time between commands in seconds
+            settle: Wait for each move to settle instead of sleeping;
+                defaults to movement.settle.enabled
+        """
+        if not self.controller.is_connected():
+            self.logger.error("Robot not connected")
+            return
+        
+        processor = self.processor
+        tracker = processor.tracker
+        tracker.reset()
+        settle = processor.settle if settle is None else settle
+        log_f = open(log_file, 'a') if log_file else None
+        try:
+            async for cmd in source:
+                if not processor.accept(cmd):
+                    continue
+                try:
+                    target_pose = [float(cmd.get(key, 0.0)) for key in POSE_KEYS]
+                except (ValueError, TypeError) as e:
+                    self.hot_log.error("Invalid command format: %s", e)
+                    continue
+                
+                self._log(log_f, {'target_pose': target_pose, 'command_type': 'absolute_pose'})
+                tracker.dispatched(cmd)
+                if not await self.controller.move_linear(target_pose):
+                    self.logger.error(f"Failed to execute command: {cmd}")
+                    break
+                
+                await self._wait_after_move(responsiveness, settle)
+        finally:
+            if log_f:
+                log_f.close()
+            self.processor.log_tracking()
+            self.hot_log.flush()
+    
+    async def process_asynchronous_commands(self, source: AsyncCommandSource, responsiveness: float = 1.0,
+                                            coalescing: Optional[str] = None) -> None:
+        """
+        Stream delta commands as velocities, combining those that arrive between cycles.
+        
+        If the source raises, the robot is stopped and the error re-raised.
+        
+        Args:
+            source: Source of delta commands
+            responsiveness: Time between cycles in seconds
+            coalescing: "latest", "sum" or "rate_limited_sum"; defaults to movement.coalescing.policy
+        """
+        if not self.controller.is_connected():
+            self.logger.error("Robot not connected")
+            return
+        
+        processor = self.processor
+        coalescer = DeltaCoalescer.from_config(self.controller.config, coalescing)
+        tracker = processor.tracker
+        tracker.reset()
+        watchdog = processor.watchdog
+        watchdog.reset()
+        clock = self.controller.clock
+        accepted = []
+        
+        async def receive():
+            async for cmd in source:
+                if not processor.accept(cmd):
+                    continue
+                try:
+                    coalescer.push([float(cmd.get(key, 0.0)) for key in DELTA_KEYS])
+                    accepted.append(cmd)
+                    watchdog.feed(clock.monotonic())
+                except (ValueError, TypeError) as e:
+                    self.hot_log.error("Invalid command: %s", e)
+        
+        receiver = asyncio.ensure_future(receive())
+        current_velocity = [0.0] * 6
+        sent_velocity = None
+        last_sent = 0.0
+        try:
+            while True:
+                if watchdog.check(clock.monotonic()):
+                    # Producer went silent: drop what is queued and ramp down to zero
+                    coalescer.reset()
+                    current_velocity = sent_velocity = [0.0] * 6
+                    await self.controller.stop_motion(watchdog.deceleration)
+                    last_sent = clock.monotonic()
+                
+                command = coalescer.next_command()
+                if command is not None:
+                    current_velocity = command
+                
+                # Apply current velocity only if it changed or needs refreshing
+                if processor.needs_send(processor.velocity_changed(current_velocity, sent_velocity), last_sent):
+                    if await self.controller.move_velocity(current_velocity, duration=responsiveness):
+                        sent_velocity = current_velocity
+                        last_sent = clock.monotonic()
+                        processor.metrics.sent.inc()
+                for cmd in accepted:
+                    tracker.dispatched(cmd)
+                accepted.clear()
+                
+                if receiver.done() and receiver.exception() is not None:
+                    self.logger.error(f"Command source failed: {receiver.exception()}")
+                    await self.controller.stop_motion(watchdog.deceleration)
+                    raise receiver.exception()
+                if receiver.done() and not any(coalescer.backlog):
+                    self.logger.info("Command source ended")
+                    break
+                await self.controller.sleep(watchdog.sleep_time(responsiveness, clock.monotonic()))
+        finally:
+            receiver.cancel()
+            self.processor.log_tracking()
+            self.hot_log.flush()
+    
+    async def process_asynchronous_poses(self, source: AsyncCommandSource, responsiveness: float = 1.0) -> None:
+        """
+        Stream absolute pose targets; a new target replaces the move in progress.
+        
+        If the source raises, the robot is stopped and the error re-raised.
+        
+        Args:
+            source: Source of pose commands
+            responsiveness: Time between cycles in seconds
+        """
+        if not self.controller.is_connected():
+            self.logger.error("Robot not connected")
+            return
+        
+        processor = self.processor
+        tracker = processor.tracker
+        tracker.reset()
+        watchdog = processor.watchdog
+        watchdog.reset()
+        clock = self.controller.clock
+        latest = {}
+        accepted = []
+        
+        async def receive():
+            async for cmd in source:
+                if not processor.accept(cmd):
+                    continue
+                try:
+                    latest['pose'] = [float(cmd.get(key, 0.0)) for key in POSE_KEYS]
+                    accepted.append(cmd)
+                    watchdog.feed(clock.monotonic())
+                except (ValueError, TypeError) as e:
+                    self.hot_log.error("Invalid command: %s", e)
+        
+        receiver = asyncio.ensure_future(receive())
+        sent_pose = None
+        last_sent = 0.0
+        motion = None
+        try:
+            while True:
+                if watchdog.check(clock.monotonic()):
+                    # Producer went silent: stop the move in progress and hold position
+                    await self.controller.stop_motion(watchdog.deceleration)
+                    latest.pop('pose', None)
+                    sent_pose = motion = None
+                
+                target_pose = latest.get('pose')
+                if target_pose and processor.needs_send(processor.pose_changed(target_pose, sent_pose), last_sent):
+                    motion = await self.controller.start_move_linear(target_pose)
+                    sent_pose = target_pose
+                    last_sent = clock.monotonic()
+                    processor.metrics.sent.inc()
+                for cmd in accepted:
+                    tracker.dispatched(cmd)
+                accepted.clear()
+                
+                if receiver.done() and receiver.exception() is not None:
+                    self.logger.error(f"Command source failed: {receiver.exception()}")
+                    await self.controller.stop_motion(watchdog.deceleration)
+                    raise receiver.exception()
+                if receiver.done() and (target_pose is None or target_pose is sent_pose):
+                    # Let the final move finish
+                    if motion is not None:
+                        await motion
+                    self.logger.info("Command source ended")
+                    break
+                await self.controller.sleep(watchdog.sleep_time(responsiveness, clock.monotonic()))
+        finally:
+            receiver.cancel()
+            self.processor.log_tracking()
+            self.hot_log.flush()
+    
+    async def _wait_after_move(self, responsiveness: float, settle: bool) -> None:
+        """Sleep ``responsiveness`` or wait at most that long for the robot to settle."""
+        if settle:
+            await self.controller.wait_until_settled(timeout=responsiveness)
+        else:
+            await self.controller.sleep(responsiveness)
+    
+    def _log(self, log_f: Optional[TextIO], entry: Dict) -> None:
+        """Append a command to the log file."""
+        if log_f:
+            with span('log_write'):
+                log_f.write(json.dumps({'timestamp': self.controller.clock.time(), **entry}) + '\n')
+                log_f.flush()
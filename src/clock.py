@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Clocks
+
+The controller and processors read time and sleep through a clock object
+instead of the ``time`` module, so simulated runs can go faster than real
+time:
+
+- ``SystemClock``: the ``time`` module (the default, ``SYSTEM_CLOCK``)
+- ``DilatedClock``: real time scaled by a speed factor; a 1 s sleep at
+  ``speed=20`` takes 50 ms of wall time
+- ``VirtualClock``: simulated time that only moves when someone sleeps;
+  a sleep advances it and returns at once, so a run takes as long as its
+  computation
+"""
+
+import time
+import threading
+from typing import Dict, Optional
+
+
+class SystemClock:
+    """Wall-clock time."""
+    
+    def time(self) -> float:
+        """Unix time in seconds."""
+        return time.time()
+    
+    def monotonic(self) -> float:
+        """Monotonic time in seconds."""
+        return time.monotonic()
+    
+    def sleep(self, seconds: float) -> None:
+        """Sleep for ``seconds`` (no-op for zero or negative values)."""
+        if seconds > 0:
+            time.sleep(seconds)
+    
+    def sleep_until(self, deadline: float) -> None:
+        """Sleep until ``monotonic()`` reaches ``deadline``."""
+        self.sleep(deadline - self.monotonic())
+
+
+class DilatedClock(SystemClock):
+    """Real time running ``speed`` times faster, starting from the current time."""
+    
+    def __init__(self, speed: float = 1.0):
+        """
+        Initialize the clock.
+        
+        Args:
+            speed: Time dilation factor (> 0); 10 runs ten times faster than real time
+        """
+        if speed <= 0:
+            raise ValueError(f"Clock speed must be positive, got {speed}")
+        self.speed = float(speed)
+        self._monotonic_origin = time.monotonic()
+        self._time_origin = time.time()
+    
+    def _elapsed(self) -> float:
+        return (time.monotonic() - self._monotonic_origin) * self.speed
+    
+    def time(self) -> float:
+        return self._time_origin + self._elapsed()
+    
+    def monotonic(self) -> float:
+        return self._monotonic_origin + self._elapsed()
+    
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds / self.speed)
+
+
+class VirtualClock(SystemClock):
+    """
+    Simulated time advanced by sleeping.
+    
+    Every ``sleep`` moves the clock forward by its duration and returns
+    immediately (after yielding the GIL so other threads make progress).
+    Sleeps from several threads add up, so virtual time runs ahead of a
+    real multi-threaded run; that is conservative for validation.
+    """
+    
+    def __init__(self, start: Optional[float] = None):
+        """
+        Initialize the clock.
+        
+        Args:
+            start: Unix time the clock starts at (default: now)
+        """
+        self._time_origin = time.time() if start is None else float(start)
+        self._now = 0.0
+        self._lock = threading.Lock()
+    
+    def time(self) -> float:
+        return self._time_origin + self._now
+    
+    def monotonic(self) -> float:
+        return self._now
+    
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            with self._lock:
+                self._now += seconds
+        time.sleep(0)
+    
+    def sleep_until(self, deadline: float) -> None:
+        with self._lock:
+            self._now = max(self._now, deadline)
+        time.sleep(0)
+
+
+def clock_from_config(config: Dict) -> SystemClock:
+    """
+    Build a clock from a ``simulated_robot`` style config section.
+    
+    ``clock`` selects "virtual" (default), "dilated" (at ``speed``) or
+    "system".
+    """
+    kind = (config or {}).get('clock', 'virtual')
+    if kind == 'virtual':
+        return VirtualClock()
+    if kind == 'dilated':
+        return DilatedClock(config.get('speed', 1.0))
+    if kind == 'system':
+        return SYSTEM_CLOCK
+    raise ValueError(f"Unknown clock {kind!r}, expected 'virtual', 'dilated' or 'system'")
+
+
+# Clock used when none is given
+SYSTEM_CLOCK = SystemClock()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Delta Coalescing
+
+Combines every delta command that arrived between two control cycles into
+at most one command per cycle, so producers can write at any rate without
+motion being silently dropped.
+
+Policies:
+    latest:           Only the newest delta counts; with no new deltas the
+                      previous command is held (the original streaming behaviour).
+    sum:              All new deltas are summed into one command; with no new
+                      deltas the command drops to zero.
+    rate_limited_sum: New deltas are added to a backlog and each cycle releases
+                      at most ``max_linear``/``max_angular`` of it, carrying
+                      the remainder over to later cycles.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+COALESCE_POLICIES = ('latest', 'sum', 'rate_limited_sum')
+
+
+class DeltaCoalescer:
+    """Accumulate delta commands and release one command per control cycle."""
+    
+    def __init__(self, policy: str = 'latest', max_linear: float = 0.5, max_angular: float = 1.0):
+        """
+        Initialize the coalescer.
+        
+        Args:
+            policy: One of ``COALESCE_POLICIES``
+            max_linear: Largest linear component norm released per cycle (rate_limited_sum)
+            max_angular: Largest angular component norm released per cycle (rate_limited_sum)
+        """
+        if policy not in COALESCE_POLICIES:
+            raise ValueError(f"Unknown coalescing policy {policy!r}, expected one of {COALESCE_POLICIES}")
+        
+        self.policy = policy
+        self.max_linear = max_linear
+        self.max_angular = max_angular
+        self._pending = [0.0] * 6
+        self._received = 0
+    
+    @classmethod
+    def from_config(cls, config: Dict, policy: Optional[str] = None) -> 'DeltaCoalescer':
+        """
+        Build a coalescer from the ``movement.coalescing`` config section.
+        
+        Args:
+            config: Robot configuration dictionary
+            policy: Overrides the configured policy if given
+        """
+        coalescing = (config or {}).get('movement', {}).get('coalescing', {})
+        safety = (config or {}).get('physical', {}).get('safety', {})
+        return cls(
+            policy=policy or coalescing.get('policy', 'latest'),
+            max_linear=coalescing.get('max_linear', safety.get('max_velocity', 0.5)),
+            max_angular=coalescing.get('max_angular', safety.get('max_angular_velocity', 1.0)),
+        )
+    
+    @property
+    def backlog(self) -> List[float]:
+        """Motion still waiting to be released (rate_limited_sum only)."""
+        return list(self._pending) if self.policy == 'rate_limited_sum' else [0.0] * 6
+    
+    def push(self, delta: Sequence[float]) -> None:
+        """Add one delta [dx, dy, dz, drx, dry, drz] received since the last cycle."""
+        if self.policy == 'latest':
+            self._pending = [float(v) for v in delta]
+        else:
+            self._pending = [p + float(v) for p, v in zip(self._pending, delta)]
+        self._received += 1
+    
+    def next_command(self) -> Optional[List[float]]:
+        """
+        Release the command for this cycle.
+        
+        Returns:
+            Delta to apply, or None to keep applying the previous command
+            (``latest`` policy with nothing new)
+        """
+        received, self._received = self._received, 0
+        
+        if self.policy == 'latest':
+            return list(self._pending) if received else None
+        
+        if self.policy == 'sum':
+            command, self._pending = self._pending, [0.0] * 6
+            return command
+        
+        # rate_limited_sum: release at most the per-cycle limits, keep the rest
+        command = (_clip_norm(self._pending[:3], self.max_linear)
+                   + _clip_norm(self._pending[3:], self.max_angular))
+        self._pending = [p - c for p, c in zip(self._pending, command)]
+        return command
+    
+    def reset(self) -> None:
+        """Drop anything not yet released."""
+        self._pending = [0.0] * 6
+        self._received = 0
+
+
+def _clip_norm(values: List[float], limit: float) -> List[float]:
+    """Scale a vector down so its Euclidean norm is at most ``limit``."""
+    norm = sum(v * v for v in values) ** 0.5
+    if norm <= limit or norm == 0.0:
+        return list(values)
+    scale = limit / norm
+    return [v * scale for v in values]
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Async Command Sources
+
+Asynchronous iterators over JSON commands for ``AsyncCommandProcessor``.
+Every source yields parsed command dictionaries (the same JSONL format as
+the command files) and skips lines that are not valid JSON objects.
+
+- ``FileCommandSource``: a JSONL file, read once or tailed like the
+  streaming processors do
+- ``SocketCommandSource``: newline-delimited JSON over TCP, either as a
+  client or as a server accepting any number of producers
+- ``QueueCommandSource``: an ``asyncio.Queue`` fed by other tasks
+"""
+
+import json
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Union
+
+try:
+    from .profiling import span
+except ImportError:
+    from profiling import span
+
+logger = logging.getLogger('URCommandSource')
+
+
+def parse_command(line: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+    """
+    Parse one JSONL line into a command.
+    
+    Returns:
+        Command dictionary, or None for blank or invalid lines
+    """
+    if isinstance(line, bytes):
+        line = line.decode('utf-8', errors='replace')
+    if not line.strip():
+        return None
+    try:
+        with span('decode'):
+            command = json.loads(line)
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON command: {e}")
+        return None
+    if not isinstance(command, dict):
+        logger.error(f"Ignoring non-object command: {line.strip()}")
+        return None
+    return command
+
+
+class AsyncCommandSource:
+    """Base class: an async iterator of command dictionaries."""
+    
+    def __aiter__(self) -> 'AsyncCommandSource':
+        return self
+    
+    async def __anext__(self) -> Dict[str, Any]:
+        command = await self.next_command()
+        if command is None:
+            raise StopAsyncIteration
+        return command
+    
+    async def next_command(self) -> Optional[Dict[str, Any]]:
+        """Wait for the next command; None once the source is exhausted."""
+        raise NotImplementedError
+    
+    async def close(self) -> None:
+        """Release the source's resources."""
+    
+    async def __aenter__(self) -> 'AsyncCommandSource':
+        return self
+    
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+class FileCommandSource(AsyncCommandSource):
+    """Commands from a JSONL file."""
+    
+    def __init__(self, json_file: str, follow: bool = False, from_end: Optional[bool] = None,
+                 poll_interval: float = 0.05):
+        """
+        Initialize the file source.
+        
+        Args:
+            json_file: Path to JSONL file
+            follow: Keep waiting for lines appended to the file (like ``tail -f``)
+            from_end: Skip lines already in the file (default: same as ``follow``)
+            poll_interval: Time between checks for new lines when following
+        """
+        self.json_file = json_file
+        self.follow = follow
+        self.from_end = follow if from_end is None else from_end
+        self.poll_interval = poll_interval
+        self._file = None
+    
+    async def next_command(self) -> Optional[Dict[str, Any]]:
+        if self._file is None:
+            self._file = open(self.json_file, 'r')
+            if self.from_end:
+                self._file.seek(0, 2)  # Seek to end
+        
+        while True:
+            line = self._file.readline()
+            if line:
+                command = parse_command(line)
+                if command is not None:
+                    return command
+                continue
+            if not self.follow:
+                return None
+            await asyncio.sleep(self.poll_interval)
+    
+    async def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class QueueCommandSource(AsyncCommandSource):
+    """Commands put on an asyncio.Queue by other tasks; putting None ends the source."""
+    
+    def __init__(self, queue: Optional[asyncio.Queue] = None):
+        """
+        Initialize the queue source.
+        
+        Args:
+            queue: Queue of command dictionaries or JSON strings (a new one if omitted)
+        """
+        self.queue = queue if queue is not None else asyncio.Queue()
+    
+    async def put(self, command: Union[Dict[str, Any], str, None]) -> None:
+        """Add a command (dictionary or JSON string), or None to end the source."""
+        await self.queue.put(command)
+    
+    async def next_command(self) -> Optional[Dict[str, Any]]:
+        while True:
+            item = await self.queue.get()
+            if item is None:
+                return None
+            command = item if isinstance(item, dict) else parse_command(item)
+            if command is not None:
+                return command
+
+
+class SocketCommandSource(AsyncCommandSource):
+    """Newline-delimited JSON commands over TCP."""
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 30010, server: bool = False):
+        """
+        Initialize the socket source.
+        
+        Args:
+            host: Address to connect to, or to listen on with ``server``
+            port: TCP port
+            server: Listen for producers instead of connecting to one. The
+                source then never ends on its own; close it to stop.
+        """
+        self.host = host
+        self.port = port
+        self.server = server
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._queue: Optional[asyncio.Queue] = None
+    
+    async def start(self) -> None:
+        """Connect, or start listening."""
+        if self.server:
+            if self._server is None:
+                self._queue = asyncio.Queue()
+                self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+                logger.info(f"Listening for commands on {self.host}:{self.port}")
+        elif self._reader is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            logger.info(f"Connected to command stream at {self.host}:{self.port}")
+    
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Forward every command from one producer connection."""
+        peer = writer.get_extra_info('peername')
+        logger.info(f"Command producer connected: {peer}")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = parse_command(line)
+                if command is not None:
+                    await self._queue.put(command)
+        finally:
+            writer.close()
+            logger.info(f"Command producer disconnected: {peer}")
+    
+    async def next_command(self) -> Optional[Dict[str, Any]]:
+        await self.start()
+        if self.server:
+            return await self._queue.get()
+        
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                return None
+            command = parse_command(line)
+            if command is not None:
+                return command
+    
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._reader = None
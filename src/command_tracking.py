@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Command Freshness and Latency Tracking
+
+Optional command fields, accepted by every processor next to the motion
+fields:
+    
+    t:   Producer timestamp, Unix time in seconds (time.time() on a clock
+         synchronized with this host)
+    seq: Sequence number, increasing by one per command from a producer
+    ttl: Seconds after ``t`` during which the command may still be executed
+
+``CommandTracker`` decides whether a command is still worth executing
+(drops expired, out-of-order and malformed commands), counts sequence
+gaps, and records producer-to-robot latency in a histogram.
+
+Example:
+    {"t": 1718000000.125, "seq": 42, "ttl": 0.5, "dx": 0.01}
+"""
+
+import time
+import logging
+from typing import Any, Dict, Optional
+
+try:
+    from .histogram import LatencyHistogram
+    from .hot_logging import HotPathLogger
+except ImportError:
+    from histogram import LatencyHistogram
+    from hot_logging import HotPathLogger
+
+
+class CommandTracker:
+    """Drop stale or reordered commands and measure end-to-end latency."""
+    
+    def __init__(self, default_ttl: Optional[float] = None, drop_reordered: bool = True,
+                 hot_log: Optional[HotPathLogger] = None):
+        """
+        Initialize the tracker.
+        
+        Args:
+            default_ttl: TTL for commands that carry ``t`` but no ``ttl`` (None = never expire)
+            drop_reordered: Drop commands whose ``seq`` is not newer than the last one seen
+            hot_log: Rate-limited logger for per-command drops (default: one with default limits)
+        """
+        self.default_ttl = default_ttl
+        self.drop_reordered = drop_reordered
+        self.logger = logging.getLogger('URCommandTracker')
+        self.hot_log = hot_log or HotPathLogger(self.logger)
+        
+        # Producer timestamp to the moment the command is handed to the robot
+        self.latency = LatencyHistogram()
+        self.reset()
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> 'CommandTracker':
+        """Build a tracker from the ``commands`` config section."""
+        commands = (config or {}).get('commands', {})
+        return cls(
+            default_ttl=commands.get('default_ttl'),
+            drop_reordered=commands.get('drop_reordered', True),
+            hot_log=HotPathLogger.from_config(logging.getLogger('URCommandTracker'), config),
+        )
+    
+    def reset(self) -> None:
+        """Forget sequence state and counters (at the start of a new job or stream)."""
+        self.last_seq: Optional[int] = None
+        self.received = 0
+        self.expired = 0
+        self.reordered = 0
+        self.malformed = 0
+        self.gaps = 0
+        self.missing = 0
+        self.latency.reset()
+    
+    def accept(self, cmd: Dict[str, Any], now: Optional[float] = None) -> bool:
+        """
+        Check a received command.
+        
+        Args:
+            cmd: Parsed command
+            now: Current Unix time (default: time.time())
+        
+        Returns:
+            False if the command expired, arrived out of order or has a
+            malformed ``t``/``seq``/``ttl`` and must be dropped
+        """
+        self.received += 1
+        
+        try:
+            t = cmd.get('t')
+            t = None if t is None else float(t)
+            ttl = cmd.get('ttl', self.default_ttl)
+            ttl = None if ttl is None else float(ttl)
+            seq = cmd.get('seq')
+            seq = None if seq is None else int(seq)
+        except (AttributeError, TypeError, ValueError) as e:
+            self.malformed += 1
+            self.hot_log.warning("Dropped malformed command: %s", e)
+            return False
+        
+        if t is not None and ttl is not None:
+            now = time.time() if now is None else now
+            if now - t > ttl:
+                self.expired += 1
+                self.hot_log.warning("Dropped expired command (age %.3fs > ttl %ss)", now - t, ttl)
+                return False
+        
+        if seq is not None:
+            if self.last_seq is not None:
+                if seq <= self.last_seq:
+                    self.reordered += 1
+                    if self.drop_reordered:
+                        self.hot_log.warning("Dropped out-of-order command seq %d (last %d)", seq, self.last_seq)
+                        return False
+                    return True
+                if seq > self.last_seq + 1:
+                    self.gaps += 1
+                    self.missing += seq - self.last_seq - 1
+                    self.hot_log.warning("Sequence gap: %d command(s) missing before seq %d",
+                                         seq - self.last_seq - 1, seq)
+            self.last_seq = seq
+        
+        return True
+    
+    def dispatched(self, cmd: Dict[str, Any], now: Optional[float] = None) -> None:
+        """Record the latency of a command that was just handed to the robot."""
+        t = cmd.get('t')
+        if t is not None:
+            now = time.time() if now is None else now
+            self.latency.record(max(now - float(t), 0.0))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'received': self.received,
+            'expired': self.expired,
+            'reordered': self.reordered,
+            'malformed': self.malformed,
+            'gaps': self.gaps,
+            'missing': self.missing,
+            'latency': self.latency.to_dict(),
+        }
+    
+    def summary(self) -> str:
+        """One-line summary for the log."""
+        return (f"{self.received} received, {self.expired} expired, {self.reordered} out of order, "
+                f"{self.malformed} malformed, {self.missing} missing in {self.gaps} gap(s); "
+                f"latency {self.latency.summary()}")
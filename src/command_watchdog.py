@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Command Watchdog
+
+Deadman for the streaming processors. Every fresh command feeds the
+watchdog; if none arrives within ``timeout`` the watchdog trips once, the
+processor brings the robot to rest (ramping velocity streams down to zero,
+holding position in pose streams) and the trip event is raised.
+
+It is off unless ``movement.watchdog.enabled`` is set: with it, a stream
+that pauses for longer than ``timeout`` stops the robot.
+
+The watchdog has no thread of its own. The control loop checks it every
+cycle and sleeps at most until its deadline (``sleep_time``), so a trip is
+handled on the loop's own timing, right at the deadline, instead of up to
+a full cycle later.
+"""
+
+import time
+import logging
+import threading
+from typing import Callable, Dict, List, Optional
+
+
+class CommandWatchdog:
+    """Trip when a command stream goes silent for longer than ``timeout``."""
+    
+    def __init__(self, timeout: float = 2.0, deceleration: float = 1.0, enabled: bool = False):
+        """
+        Initialize the watchdog.
+        
+        Args:
+            timeout: Seconds without a fresh command before tripping
+            deceleration: Deceleration used to bring the robot to rest (m/s²)
+            enabled: Disabled watchdogs never trip
+        """
+        self.timeout = timeout
+        self.deceleration = deceleration
+        self.enabled = enabled
+        self.logger = logging.getLogger('URWatchdog')
+        
+        # Set while tripped, cleared by the next fresh command
+        self.tripped = threading.Event()
+        self.trips = 0
+        self._listeners: List[Callable[[float], None]] = []
+        self._last_feed: Optional[float] = None
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> 'CommandWatchdog':
+        """Build a watchdog from the ``movement.watchdog`` config section."""
+        watchdog = (config or {}).get('movement', {}).get('watchdog', {})
+        return cls(
+            timeout=watchdog.get('timeout', 2.0),
+            deceleration=watchdog.get('deceleration', 1.0),
+            enabled=watchdog.get('enabled', False),
+        )
+    
+    def add_listener(self, callback: Callable[[float], None]) -> None:
+        """Call ``callback(silence)`` with the seconds since the last command on every trip."""
+        self._listeners.append(callback)
+    
+    def reset(self) -> None:
+        """Disarm until the next command (at the start of a stream)."""
+        self._last_feed = None
+        self.tripped.clear()
+    
+    def feed(self, now: Optional[float] = None) -> None:
+        """Record a fresh command; arms the watchdog and clears a trip."""
+        self._last_feed = time.monotonic() if now is None else now
+        if self.tripped.is_set():
+            self.tripped.clear()
+            self.logger.info("Command stream resumed")
+    
+    def remaining(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the watchdog trips, or None while disarmed."""
+        if not self.enabled or self._last_feed is None or self.tripped.is_set():
+            return None
+        now = time.monotonic() if now is None else now
+        return max(self._last_feed + self.timeout - now, 0.0)
+    
+    def sleep_time(self, period: float, now: Optional[float] = None) -> float:
+        """
+        Time a control loop should sleep: ``period``, cut short at the deadline.
+        
+        While disarmed the sleep is capped at ``timeout`` so that a command
+        arriving during the sleep is picked up before its own deadline.
+        """
+        if not self.enabled:
+            return period
+        remaining = self.remaining(now)
+        return min(period, self.timeout if remaining is None else remaining)
+    
+    def check(self, now: Optional[float] = None) -> bool:
+        """
+        Check the deadline once per control cycle.
+        
+        Returns:
+            True exactly once per silence: on the cycle the deadline passed
+        """
+        now = time.monotonic() if now is None else now
+        remaining = self.remaining(now)
+        if remaining is None or remaining > 0.0:
+            return False
+        
+        silence = now - self._last_feed
+        self.trips += 1
+        self.tripped.set()
+        self.logger.warning(f"No command for {silence:.3f}s (timeout {self.timeout}s), stopping")
+        for callback in self._listeners:
+            try:
+                callback(silence)
+            except Exception as e:
+                self.logger.error(f"Watchdog listener failed: {e}")
+        return True
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Cycle Time Estimation
+
+Predicts how long a JSONL job takes on the robot without running it, using
+the same speed, acceleration and responsiveness settings as
+``URCommandProcessor``:
+
+- Pose jobs (``process_synchronous_poses``): each line is a blocking moveL,
+  modelled as a rest-to-rest trapezoidal profile at the default speed and
+  acceleration, followed by a ``responsiveness`` sleep (none when
+  ``movement.settle.enabled`` is set, as the next move starts once settled).
+- Timed pose jobs (``process_timed_poses``): each line is a segment of the
+  time-parameterized trajectory at the configured motion limits.
+- Delta jobs (``process_synchronous_commands``): with ``movement.delta_mode``
+  "velocity", each line is a non-blocking speedL followed by a
+  ``responsiveness`` sleep, and the last velocity command keeps the robot
+  moving until its duration runs out. With "dead_reckoned", each line is a
+  blocking moveL by the delta, timed like a pose job segment.
+
+Segments from all jobs are timed together in one vectorized pass, so
+thousands of queued jobs are estimated at once.
+
+The processors do not blend moves, so no blend radius is modelled.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    from .time_parameterization import MotionLimits, segment_durations
+except ImportError:
+    from time_parameterization import MotionLimits, segment_durations
+
+logger = logging.getLogger('URCycleTime')
+
+POSE_KEYS = ('x', 'y', 'z', 'rx', 'ry', 'rz')
+DELTA_KEYS = ('dx', 'dy', 'dz', 'drx', 'dry', 'drz')
+
+JOB_POSE = 'pose'
+JOB_DELTA = 'delta'
+
+
+def load_job(json_file: Union[str, Path]) -> Tuple[str, np.ndarray]:
+    """
+    Load a JSONL job file.
+    
+    Lines are parsed like the processors do: blank and invalid lines are
+    skipped, as are lines that are not JSON objects or have non-numeric
+    fields (with a warning). The job type is taken from the first command.
+    
+    Args:
+        json_file: Path to JSONL file with pose or delta commands
+    
+    Returns:
+        Tuple of job type ("pose" or "delta") and (N, 6) array of commands
+    """
+    with open(json_file, 'r') as f:
+        lines = [(line_num, line) for line_num, line in enumerate(f, 1) if line.strip()]
+    
+    # Whole file in one parse when every line is one JSON value
+    try:
+        records = json.loads('[' + ','.join(line for _, line in lines) + ']')
+    except json.JSONDecodeError:
+        records = None
+    if records is None or len(records) != len(lines):
+        records = []
+        for line_num, line in lines:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                records.append(None)
+    
+    commands = []
+    for (line_num, _), record in zip(lines, records):
+        if record is None:
+            continue
+        if not isinstance(record, dict):
+            logger.warning(f"Skipping line {line_num} of {json_file}: expected a JSON object, "
+                           f"got {type(record).__name__}")
+            continue
+        commands.append((line_num, record))
+    
+    kind = JOB_POSE if commands and any(key in commands[0][1] for key in POSE_KEYS) else JOB_DELTA
+    keys = POSE_KEYS if kind == JOB_POSE else DELTA_KEYS
+    values = []
+    for line_num, cmd in commands:
+        try:
+            values.append([float(cmd.get(key, 0.0)) for key in keys])
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Skipping line {line_num} of {json_file}: {e}")
+    return kind, np.array(values, dtype=np.float64).reshape(-1, 6)
+
+
+class CycleTimeEstimate:
+    """Predicted execution time of one job."""
+    
+    def __init__(self, name: str, kind: str, segment_times: np.ndarray):
+        self.name = name
+        self.kind = kind
+        self.segment_times = segment_times
+    
+    @property
+    def total_time(self) -> float:
+        """Predicted total execution time in seconds."""
+        return float(self.segment_times.sum())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'job': self.name,
+            'type': self.kind,
+            'segments': int(self.segment_times.shape[0]),
+            'total_time': self.total_time,
+            'segment_times': self.segment_times.tolist(),
+        }
+    
+    def __repr__(self) -> str:
+        return f"CycleTimeEstimate({self.name!r}, {self.kind}, {self.total_time:.2f}s)"
+
+
+class CycleTimeEstimator:
+    """Estimate job execution times from robot configuration."""
+    
+    def __init__(self, config: Optional[Dict] = None, speed: Optional[float] = None,
+                 acceleration: Optional[float] = None, responsiveness: Optional[float] = None,
+                 velocity_duration: float = 1.0, profile: Optional[str] = None,
+                 delta_mode: Optional[str] = None):
+        """
+        Initialize the estimator.
+        
+        Args:
+            config: Robot configuration dictionary (as loaded by URRobotController)
+            speed: moveL speed in m/s, overrides movement.default_speed
+            acceleration: moveL acceleration in m/s², overrides movement.default_acceleration
+            responsiveness: Sleep between commands in seconds, overrides movement.responsiveness
+            velocity_duration: Duration passed to speedL for delta commands
+            profile: Estimate pose jobs as timed trajectories with this profile
+                ("trapezoidal" or "scurve") instead of moveL plus sleeps
+            delta_mode: How delta jobs run ("velocity" or "dead_reckoned"),
+                overrides movement.delta_mode
+        """
+        config = config or {}
+        movement = config.get('movement', {})
+        self.speed = speed if speed is not None else movement.get('default_speed', 0.2)
+        self.acceleration = acceleration if acceleration is not None else movement.get('default_acceleration', 0.5)
+        self.responsiveness = (responsiveness if responsiveness is not None
+                               else movement.get('responsiveness', 1.0))
+        self.velocity_duration = velocity_duration
+        self.profile = profile
+        self.delta_mode = delta_mode or movement.get('delta_mode', 'velocity')
+        self.settle = movement.get('settle', {}).get('enabled', False)
+        self.motion_limits = MotionLimits.from_config(config)
+        
+        # moveL applies the same speed/acceleration to tool rotation in rad/s
+        self._movel_limits = MotionLimits(
+            linear_velocity=self.speed, linear_acceleration=self.acceleration,
+            angular_velocity=self.speed, angular_acceleration=self.acceleration,
+        )
+    
+    def estimate(self, json_file: Union[str, Path],
+                 start_pose: Optional[Sequence[float]] = None) -> CycleTimeEstimate:
+        """
+        Estimate one job file.
+        
+        Args:
+            json_file: Path to JSONL job
+            start_pose: TCP pose the robot starts from. Without it the robot
+                is assumed to already be at the first pose of a pose job.
+        
+        Returns:
+            Estimate for the job
+        """
+        return self.estimate_many([json_file], start_pose)[0]
+    
+    def estimate_many(self, json_files: Sequence[Union[str, Path]],
+                      start_pose: Optional[Sequence[float]] = None) -> List[CycleTimeEstimate]:
+        """
+        Estimate many job files in one vectorized pass.
+        
+        Args:
+            json_files: Paths to JSONL jobs
+            start_pose: TCP pose every job starts from, see ``estimate``
+        
+        Returns:
+            Estimates in the same order as ``json_files``
+        """
+        jobs = [load_job(path) for path in json_files]
+        return self.estimate_jobs([str(path) for path in json_files],
+                                  [kind for kind, _ in jobs],
+                                  [commands for _, commands in jobs],
+                                  start_pose)
+    
+    def estimate_jobs(self, names: Sequence[str], kinds: Sequence[str],
+                      commands: Sequence[np.ndarray],
+                      start_pose: Optional[Sequence[float]] = None) -> List[CycleTimeEstimate]:
+        """
+        Estimate already-loaded jobs.
+        
+        Args:
+            names: Job names used in the results
+            kinds: Job types ("pose" or "delta"), see ``load_job``
+            commands: (N_i, 6) command arrays, one per job
+            start_pose: TCP pose every job starts from, see ``estimate``
+        
+        Returns:
+            Estimates in input order
+        """
+        counts = np.array([c.shape[0] for c in commands], dtype=np.int64)
+        is_pose = np.array([kind == JOB_POSE for kind in kinds], dtype=bool)
+        all_commands = np.concatenate(commands) if commands else np.empty((0, 6))
+        all_commands = all_commands.reshape(-1, 6)
+        job_start = np.concatenate([[0], np.cumsum(counts)[:-1]]) if len(counts) else np.empty(0, np.int64)
+        job_of = np.repeat(np.arange(len(counts)), counts)
+        first = np.zeros(all_commands.shape[0], dtype=bool)
+        first[job_start[counts > 0]] = True
+        last = np.zeros(all_commands.shape[0], dtype=bool)
+        last[(job_start + counts - 1)[counts > 0]] = True
+        
+        times = np.full(all_commands.shape[0], float(self.responsiveness))
+        pose_rows = is_pose[job_of]
+        
+        # Pose jobs: every segment from the previous pose (or the start pose)
+        if pose_rows.any():
+            previous = np.roll(all_commands, 1, axis=0)
+            if start_pose is None:
+                previous[first] = all_commands[first]
+            else:
+                previous[first] = np.asarray(start_pose, dtype=np.float64)
+            if self.profile:
+                motion = segment_durations(previous[pose_rows], all_commands[pose_rows],
+                                           self.motion_limits, self.profile)
+                times[pose_rows] = motion
+            else:
+                motion = segment_durations(previous[pose_rows], all_commands[pose_rows],
+                                           self._movel_limits, 'trapezoidal')
+                times[pose_rows] = motion if self.settle else motion + self.responsiveness
+        
+        delta_rows = ~pose_rows
+        if self.delta_mode == 'dead_reckoned':
+            # Dead-reckoned delta jobs: a blocking moveL by each delta
+            if delta_rows.any():
+                deltas = all_commands[delta_rows]
+                motion = segment_durations(np.zeros_like(deltas), deltas, self._movel_limits, 'trapezoidal')
+                times[delta_rows] = motion if self.settle else motion + self.responsiveness
+        else:
+            # Velocity delta jobs: the last speedL keeps moving after the final sleep
+            delta_last = last & delta_rows
+            times[delta_last] += max(self.velocity_duration - self.responsiveness, 0.0)
+        
+        segments = np.split(times, np.cumsum(counts)[:-1]) if len(counts) else []
+        return [CycleTimeEstimate(name, kind, seg) for name, kind, seg in zip(names, kinds, segments)]
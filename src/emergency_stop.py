@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Out-of-band Emergency Stop
+
+A stop issued through ``URRobotController.emergency_stop`` used to share
+the control interface with whatever command was in flight, so a stop from a
+signal handler or another thread could wait behind a blocking moveL.
+
+``EmergencyStopChannel`` runs its own thread with its own receive and
+dashboard connections. A stop request only sets a flag and writes one byte
+to a pipe the stop thread waits on (no locks), so it is safe to call from
+signal handlers and other threads. The stop thread then:
+
+1. Sends stopL on the control interface, but only waits ``rtde_timeout``
+   for it to go through.
+2. Falls back to the dashboard ``stop`` (or ``pause``) command if stopL did
+   not complete in time or failed.
+3. Watches joint speeds until the robot is at standstill and records the
+   time from request to standstill.
+
+A dashboard stop ends the control script, so ``reset`` uploads it again
+before motion commands are accepted.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Dict, Optional
+
+try:
+    from .histogram import LatencyHistogram
+except ImportError:
+    from histogram import LatencyHistogram
+
+try:
+    import dashboard_client
+except ImportError:
+    dashboard_client = None
+
+try:
+    import rtde_receive
+except ImportError:
+    rtde_receive = None
+
+STOP_FALLBACKS = ('stop', 'pause')
+
+
+class EmergencyStopChannel:
+    """Dedicated stop thread and connections that pre-empt in-flight commands."""
+    
+    def __init__(self, controller, fallback: str = 'stop', deceleration: float = 2.0,
+                 rtde_timeout: float = 0.05, standstill_speed: float = 0.005,
+                 timeout: float = 2.0, poll_interval: float = 0.002):
+        """
+        Initialize the stop channel.
+        
+        Args:
+            controller: Connected URRobotController whose motion is stopped
+            fallback: Dashboard command used if stopL does not go through ("stop" or "pause")
+            deceleration: stopL deceleration in m/s²
+            rtde_timeout: Time to wait for stopL before using the dashboard fallback
+            standstill_speed: Joint speed in rad/s below which the robot counts as stopped
+            timeout: Maximum time to wait for standstill in seconds
+            poll_interval: Time between standstill checks in seconds
+        """
+        if fallback not in STOP_FALLBACKS:
+            raise ValueError(f"Unknown stop fallback {fallback!r}, expected one of {STOP_FALLBACKS}")
+        
+        self.controller = controller
+        self.fallback = fallback
+        self.deceleration = deceleration
+        self.rtde_timeout = rtde_timeout
+        self.standstill_speed = standstill_speed
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.logger = logging.getLogger('EmergencyStop')
+        
+        # Stop latencies (request to standstill) in seconds; stops that missed standstill are only counted
+        self.latency = LatencyHistogram()
+        self.stops = 0
+        self.missed_standstill = 0
+        self.last_latency: Optional[float] = None
+        
+        self._rtde_r: Optional[rtde_receive.RTDEReceiveInterface] = None
+        self._dashboard = None
+        self._thread: Optional[threading.Thread] = None
+        
+        # Written by trigger() without taking locks; the stop thread wakes on the pipe
+        self._wakeup_r: Optional[int] = None
+        self._wakeup_w: Optional[int] = None
+        self._requested = False
+        self._request_time = 0.0
+        self._reason = ''
+        self._closing = False
+        self._stops_requested = 0
+        self._stops_done = 0
+        self._done = threading.Condition()
+        self._script_stopped = False
+    
+    @classmethod
+    def from_config(cls, controller) -> 'EmergencyStopChannel':
+        """Build a stop channel from the ``physical.safety.emergency_stop`` config section."""
+        stop = controller.config.get('physical', {}).get('safety', {}).get('emergency_stop', {})
+        return cls(
+            controller,
+            fallback=stop.get('fallback', 'stop'),
+            deceleration=stop.get('deceleration', 2.0),
+            rtde_timeout=stop.get('rtde_timeout', 0.05),
+            standstill_speed=stop.get('standstill_speed', 0.005),
+            timeout=stop.get('timeout', 2.0),
+        )
+    
+    @property
+    def running(self) -> bool:
+        """Whether the stop thread is ready to handle requests."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    @property
+    def triggered(self) -> bool:
+        """Whether a stop was requested since the last ``reset``."""
+        return self._requested
+    
+    def start(self) -> bool:
+        """
+        Open the channel's own connections and start the stop thread.
+        
+        Returns:
+            True if the channel is running
+        """
+        if self.running:
+            return True
+        
+        robot_ip = self.controller.robot_ip
+        try:
+            self._rtde_r = rtde_receive.RTDEReceiveInterface(robot_ip, self.controller.frequency)
+        except Exception as e:
+            self.logger.error(f"Failed to open receive interface for stop channel: {e}")
+            return False
+        
+        if dashboard_client is not None:
+            try:
+                self._dashboard = dashboard_client.DashboardClient(robot_ip)
+                self._dashboard.connect()
+            except Exception as e:
+                self.logger.warning(f"Dashboard fallback unavailable: {e}")
+                self._dashboard = None
+        else:
+            self.logger.warning("Dashboard client not available, stop channel has no fallback")
+        
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_w, False)
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name='UREmergencyStop', daemon=True)
+        self._thread.start()
+        self.logger.info("Emergency stop channel ready")
+        return True
+    
+    def trigger(self, reason: str = '') -> None:
+        """
+        Request a stop without blocking; safe to call from signal handlers and other threads.
+        
+        Only plain attribute writes and one ``os.write``: no locks that the
+        interrupted thread could be holding.
+        
+        Args:
+            reason: Logged with the stop
+        """
+        if self._requested:
+            return
+        self._request_time = time.monotonic()
+        self._reason = reason
+        self._stops_requested += 1
+        self._requested = True
+        self._wake()
+    
+    def _wake(self) -> None:
+        """Wake the stop thread."""
+        try:
+            os.write(self._wakeup_w, b'\x00')
+        except (OSError, TypeError):
+            # Pipe full (a wake-up is pending anyway) or channel not started
+            pass
+    
+    def wait(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Wait for a requested stop to complete.
+        
+        Args:
+            timeout: Maximum time to wait in seconds (default: standstill timeout plus margin)
+        
+        Returns:
+            Request-to-standstill latency in seconds, or None if not reached
+        """
+        timeout = self.timeout + self.rtde_timeout + 1.0 if timeout is None else timeout
+        with self._done:
+            if not self._done.wait_for(lambda: self._stops_done >= self._stops_requested, timeout):
+                return None
+        return self.last_latency
+    
+    def reset(self) -> bool:
+        """
+        Re-arm the channel after a stop so motion commands are accepted again.
+        
+        If the stop went through the dashboard (or the control script is not
+        running for another reason), the control script is uploaded again
+        first; a paused program is stopped rather than resumed.
+        
+        Returns:
+            True if motion commands can be sent again
+        """
+        if self._requested and self._stops_done < self._stops_requested:
+            self.logger.warning("Resetting while a stop is still in progress")
+        
+        rtde_c = self.controller.rtde_c
+        if rtde_c is not None:
+            try:
+                if self._script_stopped or not self.controller._call(rtde_c.isProgramRunning):
+                    if self.fallback == 'pause' and self._dashboard is not None:
+                        self._dashboard.stop()
+                    if not self.controller._call(rtde_c.reuploadScript):
+                        self.logger.error("Failed to upload the control script, motion still refused")
+                        return False
+                    self.logger.info("Control script uploaded again")
+                    self._script_stopped = False
+            except Exception as e:
+                self.logger.error(f"Failed to restart the control script: {e}")
+                return False
+        
+        self._requested = False
+        return True
+    
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Summary of recorded stop latencies."""
+        latency = self.latency.to_dict()
+        return {
+            'stops': self.stops,
+            'missed_standstill': self.missed_standstill,
+            'last': self.last_latency,
+            'max': latency['max'],
+            'mean': latency['mean'],
+            'p99': latency['p99'],
+        }
+    
+    def close(self) -> None:
+        """Stop the thread and close the channel's connections."""
+        if self._requested:
+            self.wait(self.timeout + self.rtde_timeout)
+        
+        if self.stops:
+            self.logger.info(f"Stop latency summary: {self.stats()}")
+        
+        if self._thread is not None:
+            self._closing = True
+            self._wake()
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._wakeup_w is not None:
+            os.close(self._wakeup_w)
+            os.close(self._wakeup_r)
+            self._wakeup_r = self._wakeup_w = None
+        self._requested = False
+        
+        if self._dashboard is not None:
+            try:
+                self._dashboard.disconnect()
+            except Exception:
+                pass
+            self._dashboard = None
+        if self._rtde_r is not None:
+            self._rtde_r.disconnect()
+            self._rtde_r = None
+    
+    def _run(self) -> None:
+        """Stop thread: wait for requests and execute them."""
+        while True:
+            os.read(self._wakeup_r, 64)
+            if self._closing:
+                return
+            requested = self._stops_requested
+            if requested > self._stops_done:
+                self._execute_stop(self._request_time, self._reason)
+                with self._done:
+                    self._stops_done = requested
+                    self._done.notify_all()
+    
+    def _execute_stop(self, request_time: float, reason: str) -> None:
+        """Stop the robot and measure the latency to standstill."""
+        self.logger.warning(f"Emergency stop requested{': ' + reason if reason else ''}")
+        
+        if not self._send_rtde_stop():
+            self._send_dashboard_stop()
+        
+        latency = self._wait_for_standstill(request_time)
+        self.stops += 1
+        self.last_latency = latency
+        metrics = self.controller.metrics
+        if latency is None:
+            self.missed_standstill += 1
+            metrics.missed_standstills.inc()
+            self.logger.error(f"Robot not at standstill {self.timeout}s after stop request")
+        else:
+            self.latency.record(latency)
+            metrics.stop_latency.observe(latency)
+            self.logger.warning(f"Robot stopped {latency * 1000:.1f} ms after stop request")
+    
+    def _send_rtde_stop(self) -> bool:
+        """Send stopL on the control interface, giving up after ``rtde_timeout``."""
+        rtde_c = self.controller.rtde_c
+        if rtde_c is None:
+            return False
+        
+        done = threading.Event()
+        result = []
+        
+        def send():
+            try:
+                rtde_c.stopL(self.deceleration)
+                result.append(True)
+            except Exception as e:
+                self.logger.error(f"stopL failed: {e}")
+            done.set()
+        
+        # Helper thread, so a control interface stuck in a blocking command cannot hold the stop up
+        threading.Thread(target=send, name='URStopL', daemon=True).start()
+        if done.wait(self.rtde_timeout) and result:
+            return True
+        
+        self.logger.warning(f"stopL did not complete within {self.rtde_timeout}s, using dashboard {self.fallback}")
+        return False
+    
+    def _send_dashboard_stop(self) -> bool:
+        """Stop or pause the running program through the dashboard server."""
+        if self._dashboard is None:
+            self.logger.error("No dashboard connection for stop fallback")
+            return False
+        
+        try:
+            if self.fallback == 'pause':
+                self._dashboard.pause()
+            else:
+                self._dashboard.stop()
+            self._script_stopped = True
+            return True
+        except Exception as e:
+            self.logger.error(f"Dashboard {self.fallback} failed: {e}")
+            return False
+    
+    def _wait_for_standstill(self, request_time: float) -> Optional[float]:
+        """Poll joint speeds on the channel's own receive interface until the robot is still."""
+        deadline = request_time + self.timeout
+        while time.monotonic() < deadline:
+            try:
+                speeds = self._rtde_r.getActualQd()
+                if max(abs(qd) for qd in speeds) < self.standstill_speed:
+                    return time.monotonic() - request_time
+            except Exception as e:
+                self.logger.error(f"Failed to read joint speeds: {e}")
+            time.sleep(self.poll_interval)
+        return None
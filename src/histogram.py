@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Latency Histogram
+
+A fixed-memory histogram with logarithmic buckets, in the spirit of
+HdrHistogram: every recorded value lands in a bucket no wider than
+``precision`` (relative), so percentiles are accurate to that precision
+across the whole range from ``lowest`` to ``highest``.
+
+Recording is a logarithm and a list increment, with no allocation, so it
+is cheap enough for the control loop.
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """Log-bucketed histogram of durations in seconds."""
+    
+    def __init__(self, lowest: float = 1e-6, highest: float = 100.0, precision: float = 0.01):
+        """
+        Initialize an empty histogram.
+        
+        Args:
+            lowest: Smallest distinguishable value; smaller values count in the first bucket
+            highest: Largest tracked value; larger values count in the last bucket
+            precision: Relative bucket width (0.01 = values within 1%)
+        """
+        self.lowest = lowest
+        self.highest = highest
+        self.precision = precision
+        self._log_lowest = math.log(lowest)
+        self._log_ratio = math.log1p(precision)
+        self._buckets = [0] * (self._index(highest) + 1)
+        self.reset()
+    
+    def _index(self, value: float) -> int:
+        """Bucket index of a value."""
+        if value <= self.lowest:
+            return 0
+        return int((math.log(value) - self._log_lowest) / self._log_ratio) + 1
+    
+    def _value(self, index: int) -> float:
+        """Upper edge of a bucket."""
+        return math.exp(self._log_lowest + index * self._log_ratio)
+    
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        for i in range(len(self._buckets)):
+            self._buckets[i] = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+    
+    def record(self, value: float) -> None:
+        """Record one value in seconds."""
+        index = self._index(value)
+        if index >= len(self._buckets):
+            index = len(self._buckets) - 1
+        self._buckets[index] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add the values of a histogram with the same bucket layout."""
+        if len(other._buckets) != len(self._buckets) or other.lowest != self.lowest:
+            raise ValueError("Histograms have different bucket layouts")
+        for i, n in enumerate(other._buckets):
+            self._buckets[i] += n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    def percentile(self, percentile: float) -> float:
+        """
+        Value below which ``percentile`` percent of the recorded values fall.
+        
+        Returns:
+            Upper edge of the bucket holding that rank (clamped to the recorded max), 0 if empty
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100.0 * self.count))
+        seen = 0
+        for index, n in enumerate(self._buckets):
+            seen += n
+            if seen >= rank:
+                return min(self._value(index), self.max) if index else min(self.lowest, self.max)
+        return self.max
+    
+    def to_dict(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, Optional[float]]:
+        """Summary statistics in seconds."""
+        summary = {
+            'count': self.count,
+            'min': self.min if self.count else None,
+            'mean': self.mean if self.count else None,
+            'max': self.max if self.count else None,
+        }
+        for p in percentiles:
+            summary[f"p{p:g}"] = self.percentile(p) if self.count else None
+        return summary
+    
+    def summary(self, unit: str = 'ms') -> str:
+        """One-line human readable summary."""
+        if not self.count:
+            return "no samples"
+        scale = {'s': 1.0, 'ms': 1e3, 'us': 1e6}[unit]
+        parts = [f"n={self.count}"]
+        parts += [f"p{p:g}={self.percentile(p) * scale:.3f}{unit}" for p in DEFAULT_PERCENTILES]
+        parts.append(f"max={self.max * scale:.3f}{unit}")
+        return " ".join(parts)
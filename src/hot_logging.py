@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Hot-path Logging
+
+Logging for code that runs on every move or loop cycle, where a plain
+``logger.info(f"...")`` formats its message whether or not anyone reads it,
+and a persistent error can write thousands of identical lines per second.
+
+``HotPathLogger`` wraps a logger:
+
+- Lazy: messages take %-style arguments and nothing is formatted unless
+  the level is enabled (and the message passes the limits below)
+- Deduplicated: an identical message (same template and arguments) is
+  logged once per ``interval`` and then as "... (repeated N times)"
+- Rate limited: at most ``burst`` messages per template per ``interval``;
+  the count of dropped ones is appended to the next message that passes
+
+Messages are grouped by their template, so pass the arguments separately:
+    
+    hot_log.info("Moving to pose: %s at speed %s", target_pose, speed)
+
+``start_queue_logging`` moves the root handlers behind a
+``QueueListener`` thread, so a slow console or disk never stalls the
+calling (motion) thread.
+"""
+
+import time
+import queue
+import atexit
+import logging
+import threading
+import logging.handlers
+from typing import Any, Dict, Optional, Tuple
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+class _MessageState:
+    """Limiter state of one (level, template) pair."""
+    
+    __slots__ = ('window_start', 'emitted', 'suppressed', 'last_args', 'last_time', 'repeats')
+    
+    def __init__(self):
+        self.window_start = 0.0
+        self.emitted = 0
+        self.suppressed = 0
+        self.last_args: Optional[Tuple] = None
+        self.last_time = 0.0
+        self.repeats = 0
+
+
+def _same_args(args: Tuple, last_args: Optional[Tuple]) -> bool:
+    """Whether two argument tuples are equal; arrays and other odd types compare by repr."""
+    if last_args is None or len(args) != len(last_args):
+        return False
+    try:
+        return all(a is b or bool(a == b) for a, b in zip(args, last_args))
+    except Exception:
+        # e.g. numpy arrays, whose == is elementwise
+        return repr(args) == repr(last_args)
+
+
+class HotPathLogger:
+    """Lazy, deduplicating, rate-limited front end for a logger."""
+    
+    def __init__(self, logger: logging.Logger, interval: float = 1.0, burst: int = 5):
+        """
+        Initialize the hot-path logger.
+        
+        Args:
+            logger: Logger the messages go to
+            interval: Rate limit window and repeat summary period in seconds
+            burst: Messages per template and window (0 = no rate limit)
+        """
+        self.logger = logger
+        self.interval = interval
+        self.burst = burst
+        self._states: Dict[Tuple[int, str], _MessageState] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, logger: logging.Logger, config: Dict) -> 'HotPathLogger':
+        """Build from the ``logging.hot_path`` config section."""
+        hot_path = (config or {}).get('logging', {}).get('hot_path', {})
+        return cls(logger, interval=hot_path.get('interval', 1.0), burst=hot_path.get('burst', 5))
+    
+    def debug(self, msg: str, *args: Any) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, msg, args)
+    
+    def info(self, msg: str, *args: Any) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, msg, args)
+    
+    def warning(self, msg: str, *args: Any) -> None:
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, msg, args)
+    
+    def error(self, msg: str, *args: Any) -> None:
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, msg, args)
+    
+    def log(self, level: int, msg: str, *args: Any) -> None:
+        """Log ``msg % args`` at ``level`` unless it is disabled, a repeat or over the rate limit."""
+        if self.logger.isEnabledFor(level):
+            self._log(level, msg, args)
+    
+    def _log(self, level: int, msg: str, args: Tuple) -> None:
+        now = time.monotonic()
+        with self._lock:
+            state = self._states.get((level, msg))
+            if state is None:
+                state = self._states[(level, msg)] = _MessageState()
+            
+            # Identical message: count it, summarize once per interval
+            if _same_args(args, state.last_args):
+                if now - state.last_time < self.interval:
+                    state.repeats += 1
+                    return
+                if state.repeats:
+                    state.last_time = now
+                    self._flush_repeats(level, msg, state, stacklevel=4)
+                    return
+            
+            if now - state.window_start >= self.interval:
+                state.window_start = now
+                state.emitted = 0
+            if self.burst and state.emitted >= self.burst:
+                state.suppressed += 1
+                return
+            
+            self._flush_repeats(level, msg, state, stacklevel=4)
+            suffix = f" ({state.suppressed} similar suppressed)" if state.suppressed else ""
+            state.emitted += 1
+            state.suppressed = 0
+            state.last_args = args
+            state.last_time = now
+            self.logger.log(level, msg + suffix, *args, stacklevel=3)
+    
+    def _flush_repeats(self, level: int, msg: str, state: _MessageState, stacklevel: int) -> None:
+        """Log the last message with its repeat count, if it was repeated."""
+        if state.repeats:
+            self.logger.log(level, msg + f" (repeated {state.repeats} times)", *state.last_args,
+                            stacklevel=stacklevel)
+            state.repeats = 0
+    
+    def flush(self) -> None:
+        """Log pending repeat and suppression counts (call when a loop ends)."""
+        with self._lock:
+            for (level, msg), state in self._states.items():
+                self._flush_repeats(level, msg, state, stacklevel=3)
+                if state.suppressed:
+                    self.logger.log(level, f"{state.suppressed} similar messages suppressed: {msg}",
+                                    stacklevel=3)
+                    state.suppressed = 0
+                state.last_args = None
+
+
+def start_queue_logging() -> Optional[logging.handlers.QueueListener]:
+    """
+    Route the root logger through a queue so log I/O happens on a listener thread.
+    
+    The current root handlers move to the listener (keeping their levels);
+    the root logger gets a single ``QueueHandler``. Only the first call does
+    anything; the listener is drained and stopped at exit.
+    
+    Returns:
+        The listener, or None if the root logger has no handlers
+    """
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return _listener
+        
+        root = logging.getLogger()
+        handlers = [h for h in root.handlers if not isinstance(h, logging.handlers.QueueHandler)]
+        if not handlers:
+            return None
+        
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        for handler in handlers:
+            root.removeHandler(handler)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(stop_queue_logging)
+        return _listener
+
+
+def stop_queue_logging() -> None:
+    """Drain the queue and give the handlers back to the root logger."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root.removeHandler(handler)
+        for handler in _listener.handlers:
+            root.addHandler(handler)
+        _listener = None
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Batch Job Validation
+
+Checks a whole library of JSONL jobs before they are run, one job per
+worker process:
+
+- Parse: lines that are not valid JSON (the processors skip them)
+- Safety: default speed and acceleration, delta velocities and every
+  target against ``physical.safety`` (the checks ``URRobotController``
+  applies to physical robots), and the ``workspace_limits`` along the
+  whole path (see ``workspace.WorkspaceLimits``) and the keep-out zones
+  (see ``keep_out.KeepOutZones``)
+- Reachability: every target has an IK solution for ``robot.model``
+- Cycle time: ``CycleTimeEstimator`` prediction
+- Dry run (optional): the job runs on the simulated robot in virtual time
+  (see ``simulation.simulate_job``)
+
+Targets of delta jobs are the dead-reckoned poses from the start pose.
+    
+    report = validate_jobs(sorted(Path('examples').glob('*.jsonl')), 'config/robot_config.yaml',
+                           dry_run=True)
+    print('\\n'.join(report.summary()))
+
+Jobs are independent, so a library check scales with the number of cores.
+"""
+
+import os
+import json
+import time
+import logging
+from functools import partial
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+try:
+    from .spatial import integrate_deltas
+    from .kinematics import URKinematics
+    from .cycle_time import CycleTimeEstimator, load_job, JOB_POSE, POSE_KEYS, DELTA_KEYS
+    from .simulated_robot import DEFAULT_POSE
+    from .workspace import WorkspaceLimits
+    from .keep_out import KeepOutZones
+except ImportError:
+    from spatial import integrate_deltas
+    from kinematics import URKinematics
+    from cycle_time import CycleTimeEstimator, load_job, JOB_POSE, POSE_KEYS, DELTA_KEYS
+    from simulated_robot import DEFAULT_POSE
+    from workspace import WorkspaceLimits
+    from keep_out import KeepOutZones
+
+logger = logging.getLogger('URJobValidation')
+
+AXES = ('x', 'y', 'z')
+
+
+def _load_config(config_path: Optional[str]) -> Dict:
+    if not config_path or yaml is None:
+        return {}
+    with open(config_path, 'r') as f:
+        return yaml.safe_load(f) or {}
+
+
+def _invalid_lines(json_file: Union[str, Path]) -> List[int]:
+    """Line numbers of non-blank lines that are not JSON objects with numeric pose/delta fields."""
+    invalid = []
+    with open(json_file, 'r') as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise TypeError("not an object")
+                for key in POSE_KEYS + DELTA_KEYS:
+                    if key in record:
+                        float(record[key])
+            except (json.JSONDecodeError, TypeError, ValueError):
+                invalid.append(line_num)
+    return invalid
+
+
+def _listed(indices: np.ndarray, limit: int) -> str:
+    """Command numbers (1-based) as a short list."""
+    shown = ', '.join(str(i + 1) for i in indices[:limit])
+    return shown + (f" (+{len(indices) - limit} more)" if len(indices) > limit else "")
+
+
+def check_job(kind: str, commands: np.ndarray, config: Dict,
+              start_pose: Optional[Sequence[float]] = None, max_listed: int = 10) -> List[str]:
+    """
+    Check one loaded job against the safety limits and robot reach.
+    
+    Args:
+        kind: Job type ("pose" or "delta"), see ``cycle_time.load_job``
+        commands: (N, 6) poses or deltas
+        config: Robot configuration dictionary
+        start_pose: TCP pose delta jobs start from (default: the
+            ``simulated_robot`` initial pose)
+        max_listed: Command numbers listed per problem
+    
+    Returns:
+        Problems found, empty if the job passes
+    """
+    safety = config.get('physical', {}).get('safety', {})
+    movement = config.get('movement', {})
+    max_velocity = safety.get('max_velocity', 0.5)
+    max_acceleration = safety.get('max_acceleration', 1.0)
+    problems = []
+    
+    if kind == JOB_POSE:
+        targets = commands
+        path_start = start_pose
+        speed = movement.get('default_speed', 0.2)
+        if speed > max_velocity:
+            problems.append(f"Speed {speed} exceeds maximum {max_velocity}")
+    else:
+        if start_pose is None:
+            start_pose = config.get('simulated_robot', {}).get('initial_pose') or DEFAULT_POSE
+        targets = integrate_deltas(start_pose, commands)
+        path_start = start_pose
+        too_fast = np.flatnonzero(np.linalg.norm(commands[:, :3], axis=1) > max_velocity)
+        if len(too_fast):
+            problems.append(f"Linear velocity exceeds maximum {max_velocity} at commands "
+                            f"{_listed(too_fast, max_listed)}")
+    
+    acceleration = movement.get('default_acceleration', 0.5)
+    if acceleration > max_acceleration:
+        problems.append(f"Acceleration {acceleration} exceeds maximum {max_acceleration}")
+    
+    workspace = safety.get('workspace_limits', {})
+    for axis, column in zip(AXES, targets[:, :3].T):
+        if axis in workspace:
+            low, high = workspace[axis]
+            outside = np.flatnonzero((column < low) | (column > high))
+            if len(outside):
+                problems.append(f"{axis.upper()} position outside workspace limits {workspace[axis]} "
+                                f"at commands {_listed(outside, max_listed)}")
+    
+    # Moves between valid targets can still leave the box (tool points turning with the orientation)
+    limits = WorkspaceLimits.from_config(config)
+    if limits.swept:
+        outside = np.flatnonzero(limits.outside(targets[:, :3]))
+        # Moves from or to a target already reported above are not listed again
+        leaving = np.setdiff1d(limits.check_path(targets, path_start), np.concatenate([outside, outside + 1]))
+        if len(leaving):
+            problems.append(f"Path leaves the workspace limits on the way to commands "
+                            f"{_listed(leaving, max_listed)}")
+    
+    zones = KeepOutZones.from_config(config)
+    if zones.enabled:
+        if zones.swept:
+            hits, hit_zones = zones.check_path(targets, path_start)
+            if path_start is None:
+                # The first target is not reached by a move, only check where it is
+                first, first_zone = zones.check_poses(targets[:1])
+                hits, hit_zones = np.concatenate([first, hits]), np.concatenate([first_zone, hit_zones])
+        else:
+            hits, hit_zones = zones.check_poses(targets)
+        for zone in np.unique(hit_zones):
+            problems.append(f"Enters keep-out zone {zones.names[zone]!r} on the way to commands "
+                            f"{_listed(hits[hit_zones == zone], max_listed)}")
+    
+    robot = config.get('robot', {})
+    try:
+        kinematics = URKinematics(robot.get('model', 'UR5e'), robot.get('tcp_offset'))
+    except ValueError as e:
+        problems.append(f"Reachability not checked: {e}")
+    else:
+        unreachable = np.flatnonzero(~kinematics.is_reachable(targets.reshape(-1, 6)))
+        if len(unreachable):
+            problems.append(f"Not reachable by a {kinematics.model} at commands "
+                            f"{_listed(unreachable, max_listed)}")
+    
+    return problems
+
+
+def validate_job(job_file: Union[str, Path], config_path: Optional[str] = None,
+                 dry_run: bool = False, responsiveness: Optional[float] = None,
+                 start_pose: Optional[Sequence[float]] = None, max_listed: int = 10) -> Dict[str, Any]:
+    """
+    Validate one job file (the per-worker task of ``validate_jobs``).
+    
+    Args:
+        job_file: Path to JSONL job
+        config_path: Path to the robot configuration file
+        dry_run: Also run the job on the simulated robot
+        responsiveness: Time between commands in seconds, overrides movement.responsiveness
+        start_pose: TCP pose the robot starts from (default: first pose of
+            pose jobs, the ``simulated_robot`` initial pose for delta jobs)
+        max_listed: Command numbers listed per problem
+    
+    Returns:
+        JSON-serializable result with ``passed``, the problems found, the
+        estimated cycle time and the dry-run result (None without dry run)
+    """
+    wall_start = time.perf_counter()
+    result: Dict[str, Any] = {
+        'job': str(job_file), 'type': None, 'commands': 0, 'invalid_lines': [], 'problems': [],
+        'estimated_time': None, 'simulation': None, 'passed': False, 'wall_time': 0.0,
+    }
+    
+    try:
+        config = _load_config(config_path)
+        kind, commands = load_job(job_file)
+        result['type'] = kind
+        result['commands'] = int(commands.shape[0])
+        result['invalid_lines'] = _invalid_lines(job_file)
+        
+        problems = result['problems']
+        if not commands.shape[0]:
+            problems.append("No commands")
+        else:
+            problems.extend(check_job(kind, commands, config, start_pose, max_listed))
+            estimator = CycleTimeEstimator(config, responsiveness=responsiveness)
+            result['estimated_time'] = estimator.estimate_jobs(
+                [str(job_file)], [kind], [commands], start_pose)[0].total_time
+        if result['invalid_lines']:
+            problems.append(f"Invalid commands on lines {', '.join(map(str, result['invalid_lines'][:max_listed]))}")
+        
+        if dry_run and commands.shape[0]:
+            try:
+                from .simulation import simulate_job
+            except ImportError:
+                from simulation import simulate_job
+            simulation = simulate_job(job_file, config_path, responsiveness, start_pose)
+            result['simulation'] = simulation
+            if not simulation['ok']:
+                problems.append(f"Dry run failed: {simulation['error']}")
+        
+        result['passed'] = not problems
+    
+    except (OSError, ValueError) as e:
+        result['problems'].append(str(e))
+    except Exception as e:
+        # Malformed commands (wrong JSON types) must not abort the whole batch
+        result['problems'].append(f"{type(e).__name__}: {e}")
+    finally:
+        result['wall_time'] = time.perf_counter() - wall_start
+    
+    return result
+
+
+class ValidationReport:
+    """Aggregated results of a batch validation."""
+    
+    def __init__(self, results: Sequence[Dict[str, Any]], workers: int, wall_time: float):
+        self.results = list(results)
+        self.workers = workers
+        self.wall_time = wall_time
+    
+    @property
+    def failed(self) -> List[Dict[str, Any]]:
+        return [r for r in self.results if not r['passed']]
+    
+    @property
+    def passed(self) -> bool:
+        return not self.failed
+    
+    @property
+    def estimated_time(self) -> float:
+        """Predicted run time of all jobs in seconds."""
+        return float(sum(r['estimated_time'] or 0.0 for r in self.results))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Report as a JSON-serializable dictionary."""
+        return {
+            'passed': self.passed,
+            'jobs': len(self.results),
+            'failed': len(self.failed),
+            'estimated_time': self.estimated_time,
+            'workers': self.workers,
+            'wall_time': self.wall_time,
+            'results': self.results,
+        }
+    
+    def summary(self) -> List[str]:
+        """Human-readable report lines."""
+        lines = []
+        for r in self.results:
+            estimate = f"{r['estimated_time']:8.2f}s" if r['estimated_time'] is not None else "       -"
+            simulated = r['simulation']
+            dry_run = f" (dry run {simulated['simulated_time']:.1f}s)" if simulated and simulated['ok'] else ""
+            lines.append(f"{'✅' if r['passed'] else '❌'} {r['job']:<40} {r['type'] or '-':<6} "
+                         f"{r['commands']:>5} cmds {estimate}{dry_run}")
+            for problem in r['problems']:
+                lines.append(f"     {problem}")
+        lines.append(f"{len(self.results) - len(self.failed)}/{len(self.results)} jobs passed, "
+                     f"{self.estimated_time:.1f}s estimated in total, checked in {self.wall_time:.1f}s "
+                     f"on {self.workers} worker(s)")
+        return lines
+
+
+def validate_jobs(job_files: Sequence[Union[str, Path]], config_path: Optional[str] = None,
+                  workers: Optional[int] = None, dry_run: bool = False,
+                  responsiveness: Optional[float] = None,
+                  start_pose: Optional[Sequence[float]] = None) -> ValidationReport:
+    """
+    Validate many job files in parallel worker processes.
+    
+    Args:
+        job_files: Paths to JSONL jobs
+        config_path: Path to the robot configuration file (each worker loads it)
+        workers: Worker processes (default: one per core; 1 runs in this process)
+        dry_run: Also run every job on the simulated robot
+        responsiveness: Time between commands in seconds, overrides movement.responsiveness
+        start_pose: TCP pose every job starts from, see ``validate_job``
+    
+    Returns:
+        Report with the results in input order
+    """
+    start = time.perf_counter()
+    workers = max(1, min(workers or os.cpu_count() or 1, len(job_files) or 1))
+    task = partial(validate_job, config_path=config_path, dry_run=dry_run,
+                   responsiveness=responsiveness, start_pose=start_pose)
+    
+    if workers == 1:
+        results = [task(job) for job in job_files]
+    else:
+        chunksize = max(1, len(job_files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(task, [str(job) for job in job_files], chunksize=chunksize))
+    
+    report = ValidationReport(results, workers, time.perf_counter() - start)
+    logger.info(f"Validated {len(results)} jobs on {workers} worker(s) in {report.wall_time:.1f}s, "
+                f"{len(report.failed)} failed")
+    return report
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Keep-out Zones
+
+Volumes the tool must not enter (fixtures, conveyors, a second robot),
+configured under ``physical.safety.keep_out``:
+
+- box: axis-aligned, ``min`` and ``max`` corners
+- sphere: ``center`` and ``radius``
+- capsule: segment ``start`` to ``end`` inflated by ``radius`` (a robot
+  link, a conveyor edge)
+
+The tool is approximated by spheres [x, y, z, radius] in the TCP frame
+(by default just the TCP point). A query tests tool spheres at many TCP
+frames at once.
+
+Zones are stored in a uniform grid over their bounding boxes, inflated by
+the largest tool radius, so each sample is tested only against the zones
+sharing its grid cell. The lookup and the exact distance tests are
+vectorized over all (sample, candidate zone) pairs: the interpolated
+samples of a whole job are checked in milliseconds. Path sampling is the
+same as for the swept workspace check (see ``workspace``).
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from .spatial import rotvec_to_matrix
+    from .workspace import interpolate_segments, interpolate_joint_segments
+except ImportError:
+    from spatial import rotvec_to_matrix
+    from workspace import interpolate_segments, interpolate_joint_segments
+
+ZONE_TYPES = ('box', 'sphere', 'capsule')
+BOX, SPHERE, CAPSULE = range(3)
+
+# Grid cells are enlarged when the zones' extent would need more than this
+MAX_CELLS = 1_000_000
+
+
+class KeepOutZones:
+    """Keep-out volumes in a uniform grid, queried with tool spheres."""
+    
+    def __init__(self, zones: Optional[Sequence[Dict]] = None,
+                 tool_spheres: Optional[Sequence[Sequence[float]]] = None, cell_size: float = 0.1,
+                 swept: bool = True, resolution: float = 0.005, angular_resolution: float = 0.05):
+        """
+        Initialize the zones and build the index.
+        
+        Args:
+            zones: Zone dicts with ``type`` ("box", "sphere" or "capsule"), the
+                type's geometry (see module docstring) and an optional ``name``
+            tool_spheres: Tool approximation [[x, y, z, radius], ...] in the TCP
+                frame (default: the TCP point)
+            cell_size: Grid cell edge in meters
+            swept: Check the motion between poses, not only the poses
+            resolution: Largest distance between path samples in meters
+            angular_resolution: Largest rotation between path samples in radians
+        """
+        zones = list(zones or [])
+        self.names: List[str] = []
+        self.kinds = np.empty(len(zones), dtype=np.int64)
+        self.a = np.empty((len(zones), 3))
+        self.b = np.empty((len(zones), 3))
+        self.radii = np.zeros(len(zones))
+        for i, zone in enumerate(zones):
+            kind = zone.get('type')
+            if kind not in ZONE_TYPES:
+                raise ValueError(f"Unknown keep-out zone type {kind!r}, expected one of {ZONE_TYPES}")
+            self.names.append(zone.get('name', f"{kind} {i}"))
+            self.kinds[i] = ZONE_TYPES.index(kind)
+            if kind == 'box':
+                self.a[i], self.b[i] = zone['min'], zone['max']
+            elif kind == 'sphere':
+                self.a[i] = self.b[i] = zone['center']
+                self.radii[i] = zone['radius']
+            else:
+                self.a[i], self.b[i] = zone['start'], zone['end']
+                self.radii[i] = zone['radius']
+        
+        tool = np.zeros((1, 4)) if not tool_spheres else np.asarray(tool_spheres, dtype=np.float64).reshape(-1, 4)
+        self.tool_points = tool[:, :3]
+        self.tool_radii = tool[:, 3]
+        self.swept = swept
+        self.resolution = resolution
+        self.angular_resolution = angular_resolution
+        self._build_index(cell_size)
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> 'KeepOutZones':
+        """Build from ``physical.safety.keep_out``, sampling paths per ``physical.safety.swept_check``."""
+        safety = (config or {}).get('physical', {}).get('safety', {})
+        keep_out = safety.get('keep_out', {})
+        swept = safety.get('swept_check', {})
+        return cls(
+            zones=keep_out.get('zones'),
+            tool_spheres=keep_out.get('tool_spheres'),
+            cell_size=keep_out.get('cell_size', 0.1),
+            swept=swept.get('enabled', True),
+            resolution=swept.get('resolution', 0.005),
+            angular_resolution=swept.get('angular_resolution', 0.05),
+        )
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether any zone is configured."""
+        return bool(len(self.names))
+    
+    def _build_index(self, cell_size: float) -> None:
+        """Bin every zone's inflated bounding box into the cells it overlaps (CSR layout)."""
+        margin = float(self.tool_radii.max())
+        extent = (self.radii + margin)[:, None]
+        lower = np.minimum(self.a, self.b) - extent
+        upper = np.maximum(self.a, self.b) + extent
+        
+        if not self.enabled:
+            self.origin = np.zeros(3)
+            self.cell_size = cell_size
+            self.dims = np.ones(3, dtype=np.int64)
+            self._cell_start = np.zeros(2, dtype=np.int64)
+            self._cell_zones = np.empty(0, dtype=np.int64)
+            return
+        
+        self.origin = lower.min(axis=0)
+        size = upper.max(axis=0) - self.origin
+        self.cell_size = max(cell_size, float(np.cbrt(np.prod(size) / MAX_CELLS)))
+        self.dims = np.maximum(np.ceil(size / self.cell_size).astype(np.int64), 1)
+        
+        first = self._cell_of(lower)
+        last = self._cell_of(upper)
+        cells, owners = [], []
+        for zone, (i0, i1) in enumerate(zip(first, last)):
+            block = np.stack(np.meshgrid(*[np.arange(lo, hi + 1) for lo, hi in zip(i0, i1)],
+                                         indexing='ij'), axis=-1).reshape(-1, 3)
+            cells.append(np.ravel_multi_index(block.T, self.dims))
+            owners.append(np.full(block.shape[0], zone))
+        cells, owners = np.concatenate(cells), np.concatenate(owners)
+        order = np.argsort(cells, kind='stable')
+        self._cell_zones = owners[order]
+        self._cell_start = np.searchsorted(cells[order], np.arange(int(np.prod(self.dims)) + 1))
+    
+    def _cell_of(self, points: np.ndarray) -> np.ndarray:
+        """Grid cell of each point, clipped to the grid."""
+        return np.clip(np.floor((points - self.origin) / self.cell_size).astype(np.int64), 0, self.dims - 1)
+    
+    def _distances(self, points: np.ndarray, zones: np.ndarray) -> np.ndarray:
+        """Signed distance from each point to the surface of its paired zone (negative inside)."""
+        a, b = self.a[zones], self.b[zones]
+        distance = np.empty(points.shape[0])
+        
+        box = self.kinds[zones] == BOX
+        q = np.maximum(a[box] - points[box], points[box] - b[box])
+        distance[box] = np.linalg.norm(np.maximum(q, 0.0), axis=1) + np.minimum(q.max(axis=1), 0.0)
+        
+        # Spheres are capsules of zero length
+        round_ = ~box
+        axis = b[round_] - a[round_]
+        length2 = np.einsum('ij,ij->i', axis, axis)
+        t = np.einsum('ij,ij->i', points[round_] - a[round_], axis) / np.where(length2 > 0, length2, 1.0)
+        closest = a[round_] + np.clip(t, 0.0, 1.0)[:, None] * axis
+        distance[round_] = np.linalg.norm(points[round_] - closest, axis=1) - self.radii[zones][round_]
+        return distance
+    
+    def query(self, points: np.ndarray, radii: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the zones spheres intersect.
+        
+        Args:
+            points: (M, 3) sphere centers in the base frame
+            radii: (M,) sphere radii, at most the largest tool radius
+        
+        Returns:
+            Tuple of point and zone indices of every intersecting pair, ordered by point
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        if not self.enabled or not points.shape[0]:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        
+        cell = (points - self.origin) / self.cell_size
+        in_grid = np.flatnonzero(((cell >= 0) & (cell < self.dims)).all(axis=1))
+        flat = np.ravel_multi_index(np.floor(cell[in_grid]).astype(np.int64).T, self.dims)
+        starts = self._cell_start[flat]
+        counts = self._cell_start[flat + 1] - starts
+        
+        # Expand to (point, candidate zone) pairs
+        pair_point = np.repeat(in_grid, counts)
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+        pair_zone = self._cell_zones[offsets]
+        
+        hit = self._distances(points[pair_point], pair_zone) < np.asarray(radii, dtype=np.float64)[pair_point]
+        return pair_point[hit], pair_zone[hit]
+    
+    def _check_frames(self, positions: np.ndarray, rotations: np.ndarray,
+                      owners: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """First zone hit by the tool spheres per owner (pose or segment) of M TCP frames."""
+        centers = positions[:, None, :] + np.einsum('mij,kj->mki', rotations, self.tool_points)
+        radii = np.broadcast_to(self.tool_radii, centers.shape[:2])
+        point, zone = self.query(centers.reshape(-1, 3), radii.reshape(-1))
+        hit_owners, first = np.unique(owners[point // self.tool_points.shape[0]], return_index=True)
+        return hit_owners, zone[first]
+    
+    def check_poses(self, poses: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Check TCP poses.
+        
+        Args:
+            poses: (N, 6) TCP poses
+        
+        Returns:
+            Tuple of the indices of the poses in a zone and the zone each is in
+        """
+        poses = np.asarray(poses, dtype=np.float64).reshape(-1, 6)
+        rotations = rotvec_to_matrix(poses[:, 3:]).reshape(-1, 3, 3)
+        return self._check_frames(poses[:, :3], rotations, np.arange(poses.shape[0]))
+    
+    def check_path(self, poses: np.ndarray,
+                   start_pose: Optional[Sequence[float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Check the linear moves through a list of poses.
+        
+        Args:
+            poses: (N, 6) TCP poses in path order
+            start_pose: Pose the path starts from (default: the first pose,
+                whose own segment is then skipped)
+        
+        Returns:
+            Tuple of the indices of the poses whose segment (the move to that
+            pose) enters a zone and the first zone entered
+        """
+        poses = np.asarray(poses, dtype=np.float64).reshape(-1, 6)
+        if start_pose is None:
+            starts, ends, offset = poses[:-1], poses[1:], 1
+        else:
+            starts = np.vstack([np.asarray(start_pose, dtype=np.float64).reshape(1, 6), poses[:-1]])
+            ends, offset = poses, 0
+        if not ends.shape[0] or not self.enabled:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        
+        positions, rotations, segment = interpolate_segments(starts, ends, self.resolution,
+                                                             self.angular_resolution)
+        hits, zones = self._check_frames(positions, rotations, segment)
+        return hits + offset, zones
+    
+    def check_joint_path(self, joints: np.ndarray, start_joints: Sequence[float],
+                         kinematics) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Check joint moves (as moveJ executes them) through a list of configurations.
+        
+        Args:
+            joints: (N, 6) joint angles in path order
+            start_joints: Joint angles the path starts from
+            kinematics: ``URKinematics`` of the robot
+        
+        Returns:
+            Tuple of the indices of the configurations whose segment enters a
+            zone and the first zone entered
+        """
+        q1 = np.asarray(joints, dtype=np.float64).reshape(-1, 6)
+        if not self.enabled:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        q0 = np.vstack([np.asarray(start_joints, dtype=np.float64).reshape(1, 6), q1[:-1]])
+        positions, rotations, segment = interpolate_joint_segments(q0, q1, kinematics, self.angular_resolution)
+        return self._check_frames(positions, rotations, segment)
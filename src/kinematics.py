@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+UR Kinematics
+
+Analytic forward and inverse kinematics for the UR e-Series arms using the
+nominal DH parameters published by Universal Robots. Everything is batched
+over poses so thousands of targets can be checked for reachability or
+converted to joint space offline, without calling the controller's
+``getInverseKinematics``.
+
+Nominal parameters ignore the per-robot calibration stored on the
+controller, so results differ from the real arm by a few millimeters.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    from .spatial import pose_to_matrix, matrix_to_pose, pose_inv
+except ImportError:
+    from spatial import pose_to_matrix, matrix_to_pose, pose_inv
+
+
+# Standard DH parameters (meters) for the e-Series arms:
+# a = [0, a2, a3, 0, 0, 0], d = [d1, 0, 0, d4, d5, d6],
+# alpha = [pi/2, 0, 0, pi/2, -pi/2, 0]
+DH_PARAMETERS: Dict[str, Dict[str, float]] = {
+    'UR3e': {'d1': 0.15185, 'a2': -0.24355, 'a3': -0.2132, 'd4': 0.13105, 'd5': 0.08535, 'd6': 0.0921},
+    'UR5e': {'d1': 0.1625, 'a2': -0.425, 'a3': -0.3922, 'd4': 0.1333, 'd5': 0.0997, 'd6': 0.0996},
+    'UR10e': {'d1': 0.1807, 'a2': -0.6127, 'a3': -0.57155, 'd4': 0.17415, 'd5': 0.11985, 'd6': 0.11655},
+    'UR16e': {'d1': 0.1807, 'a2': -0.4784, 'a3': -0.36, 'd4': 0.17415, 'd5': 0.11985, 'd6': 0.11655},
+}
+
+DH_ALPHA = np.array([np.pi / 2, 0.0, 0.0, np.pi / 2, -np.pi / 2, 0.0])
+
+# Controller joint limits are +/- 360 degrees on every joint
+JOINT_LIMIT = 2.0 * np.pi
+
+NUM_SOLUTIONS = 8
+
+
+def _dh_transforms(theta: np.ndarray, a: np.ndarray, d: np.ndarray,
+                   alpha: np.ndarray) -> np.ndarray:
+    """Batched DH link transforms; all inputs broadcast to (N,), result is (N, 4, 4)."""
+    theta, a, d, alpha = np.broadcast_arrays(theta, a, d, alpha)
+    ct, st = np.cos(theta), np.sin(theta)
+    ca, sa = np.cos(alpha), np.sin(alpha)
+    t = np.zeros(theta.shape + (4, 4))
+    t[..., 0, 0] = ct
+    t[..., 0, 1] = -st * ca
+    t[..., 0, 2] = st * sa
+    t[..., 0, 3] = a * ct
+    t[..., 1, 0] = st
+    t[..., 1, 1] = ct * ca
+    t[..., 1, 2] = -ct * sa
+    t[..., 1, 3] = a * st
+    t[..., 2, 1] = sa
+    t[..., 2, 2] = ca
+    t[..., 2, 3] = d
+    t[..., 3, 3] = 1.0
+    return t
+
+
+def _invert_transforms(t: np.ndarray) -> np.ndarray:
+    """Invert (..., 4, 4) rigid transforms."""
+    inv = np.zeros_like(t)
+    rotation_t = np.swapaxes(t[..., :3, :3], -1, -2)
+    inv[..., :3, :3] = rotation_t
+    inv[..., :3, 3] = -np.einsum('...ij,...j->...i', rotation_t, t[..., :3, 3])
+    inv[..., 3, 3] = 1.0
+    return inv
+
+
+class URKinematics:
+    """Analytic kinematics for one UR e-Series model."""
+    
+    def __init__(self, model: str = "UR5e", tcp_offset: Optional[Sequence[float]] = None):
+        """
+        Initialize kinematics for a robot model.
+        
+        Args:
+            model: Robot model name, one of ``DH_PARAMETERS`` (e.g. "UR5e")
+            tcp_offset: TCP pose [x, y, z, rx, ry, rz] relative to the tool flange,
+                as set on the teach pendant. Defaults to the flange itself.
+        """
+        if model not in DH_PARAMETERS:
+            raise ValueError(f"Unknown robot model {model!r}, expected one of {sorted(DH_PARAMETERS)}")
+        
+        self.model = model
+        params = DH_PARAMETERS[model]
+        self.d1, self.a2, self.a3 = params['d1'], params['a2'], params['a3']
+        self.d4, self.d5, self.d6 = params['d4'], params['d5'], params['d6']
+        self.a = np.array([0.0, self.a2, self.a3, 0.0, 0.0, 0.0])
+        self.d = np.array([self.d1, 0.0, 0.0, self.d4, self.d5, self.d6])
+        
+        tcp = np.zeros(6) if tcp_offset is None else np.asarray(tcp_offset, dtype=np.float64)
+        self.tcp_offset = tcp
+        self._tcp = pose_to_matrix(tcp)
+        self._tcp_inv = pose_to_matrix(pose_inv(tcp))
+    
+    # ------------------------------------------------------------------
+    # Forward kinematics
+    # ------------------------------------------------------------------
+    
+    def forward_matrix(self, joints: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+        """
+        Compute TCP transforms for joint configurations.
+        
+        Args:
+            joints: (6,) or (N, 6) joint angles in radians
+        
+        Returns:
+            (4, 4) or (N, 4, 4) homogeneous TCP transforms in the base frame
+        """
+        q = np.asarray(joints, dtype=np.float64)
+        single = q.ndim == 1
+        q = q.reshape(-1, 6)
+        
+        t = _dh_transforms(q[:, 0], self.a[0], self.d[0], DH_ALPHA[0])
+        for i in range(1, 6):
+            t = t @ _dh_transforms(q[:, i], self.a[i], self.d[i], DH_ALPHA[i])
+        t = t @ self._tcp
+        return t[0] if single else t
+    
+    def forward(self, joints: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+        """
+        Compute TCP poses for joint configurations.
+        
+        Args:
+            joints: (6,) or (N, 6) joint angles in radians
+        
+        Returns:
+            (6,) or (N, 6) TCP poses [x, y, z, rx, ry, rz] in the base frame
+        """
+        return matrix_to_pose(self.forward_matrix(joints))
+    
+    # ------------------------------------------------------------------
+    # Inverse kinematics
+    # ------------------------------------------------------------------
+    
+    def inverse(self, poses: Union[Sequence[float], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute all analytic IK branches for TCP poses.
+        
+        Solutions are ordered by (shoulder, wrist, elbow) branch and wrapped
+        to [-pi, pi). Branches that do not exist for a pose are NaN.
+        
+        Args:
+            poses: (6,) or (N, 6) TCP poses [x, y, z, rx, ry, rz]
+        
+        Returns:
+            Tuple of (N, 8, 6) joint solutions and (N, 8) validity mask.
+            For a single pose the leading dimension is dropped.
+        """
+        p = np.asarray(poses, dtype=np.float64)
+        single = p.ndim == 1
+        t06 = pose_to_matrix(p.reshape(-1, 6)) @ self._tcp_inv
+        solutions, valid = self._inverse_flange(t06)
+        if single:
+            return solutions[0], valid[0]
+        return solutions, valid
+    
+    def _inverse_flange(self, t06: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Closed-form IK for (N, 4, 4) flange transforms."""
+        n = t06.shape[0]
+        d1, a2, a3, d4, d5, d6 = self.d1, self.a2, self.a3, self.d4, self.d5, self.d6
+        
+        # Branch layout over the 8 solutions
+        shoulder = np.repeat([1.0, -1.0], 4)
+        wrist = np.tile(np.repeat([1.0, -1.0], 2), 2)
+        elbow = np.tile([1.0, -1.0], 4)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # Theta 1: wrist center (frame 5 origin) seen from above
+            p05 = t06[:, :3, 3] - d6 * t06[:, :3, 2]
+            r05 = np.hypot(p05[:, 0], p05[:, 1])
+            phi = np.arctan2(p05[:, 1], p05[:, 0])
+            psi = np.arccos(d4 / r05)
+            theta1 = phi[:, None] + shoulder * psi[:, None] + np.pi / 2
+            s1, c1 = np.sin(theta1), np.cos(theta1)
+            
+            # Theta 5: wrist flip
+            p06 = t06[:, :3, 3]
+            arg5 = (p06[:, 0, None] * s1 - p06[:, 1, None] * c1 - d4) / d6
+            theta5 = wrist * np.arccos(np.clip(arg5, -1.0, 1.0))
+            reach_ok = np.abs(arg5) <= 1.0 + 1e-9
+            s5 = np.sin(theta5)
+            
+            # Theta 6: from the base x/y axes expressed in the flange frame
+            r = t06[:, :3, :3]
+            num = (-r[:, 0, 1, None] * s1 + r[:, 1, 1, None] * c1) / s5
+            den = (r[:, 0, 0, None] * s1 - r[:, 1, 0, None] * c1) / s5
+            theta6 = np.where(np.abs(s5) < 1e-10, 0.0, np.arctan2(num, den))
+            
+            # Planar 3R problem for joints 2-4
+            t01 = _dh_transforms(theta1, 0.0, d1, DH_ALPHA[0])
+            t45 = _dh_transforms(theta5, 0.0, d5, DH_ALPHA[4])
+            t56 = _dh_transforms(theta6, 0.0, d6, DH_ALPHA[5])
+            t14 = _invert_transforms(t01) @ t06[:, None] @ _invert_transforms(t45 @ t56)
+            # Frame 3 origin in frame 1; joints 2 and 3 move it in the x1-y1 plane
+            p13 = t14[..., :3, 1] * -d4 + t14[..., :3, 3]
+            p13x, p13y = p13[..., 0], p13[..., 1]
+            p13_sq = p13x ** 2 + p13y ** 2
+            
+            arg3 = (p13_sq - a2 ** 2 - a3 ** 2) / (2.0 * a2 * a3)
+            elbow_ok = np.abs(arg3) <= 1.0 + 1e-9
+            theta3 = elbow * np.arccos(np.clip(arg3, -1.0, 1.0))
+            theta2 = -np.arctan2(p13y, -p13x) + np.arcsin(a3 * np.sin(theta3) / np.sqrt(p13_sq))
+            
+            t12 = _dh_transforms(theta2, a2, 0.0, DH_ALPHA[1])
+            t23 = _dh_transforms(theta3, a3, 0.0, DH_ALPHA[2])
+            t34 = _invert_transforms(t12 @ t23) @ t14
+            theta4 = np.arctan2(t34[..., 1, 0], t34[..., 0, 0])
+        
+        solutions = np.stack([theta1, theta2, theta3, theta4, theta5, theta6], axis=-1)
+        solutions = (solutions + np.pi) % (2.0 * np.pi) - np.pi
+        valid = np.isfinite(solutions).all(axis=-1) & (r05 >= abs(d4))[:, None] & reach_ok & elbow_ok
+        solutions[~valid] = np.nan
+        return solutions.reshape(n, NUM_SOLUTIONS, 6), valid.reshape(n, NUM_SOLUTIONS)
+    
+    def inverse_nearest(self, poses: Union[Sequence[float], np.ndarray],
+                        seed: Union[Sequence[float], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pick the IK branch closest to a seed configuration for each pose.
+        
+        Every joint is shifted by multiples of 2*pi to the equivalent angle
+        closest to the seed within the +/- 360 degree joint limits.
+        
+        Args:
+            poses: (6,) or (N, 6) TCP poses
+            seed: (6,) or (N, 6) seed joint angles, e.g. the current joints
+        
+        Returns:
+            Tuple of (N, 6) joint angles (NaN where unreachable) and (N,) validity mask.
+            For a single pose the leading dimension is dropped.
+        """
+        p = np.asarray(poses, dtype=np.float64)
+        single = p.ndim == 1
+        solutions, valid = self.inverse(p.reshape(-1, 6))
+        joints, ok = select_nearest(solutions, valid, seed)
+        if single:
+            return joints[0], ok[0]
+        return joints, ok
+    
+    def inverse_path(self, poses: Union[Sequence[float], np.ndarray],
+                     seed: Union[Sequence[float], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert a pose sequence to a continuous joint-space path.
+        
+        IK for all poses is solved in one batch; each pose then takes the
+        branch nearest to the previous solution so the arm does not flip
+        configuration mid-path.
+        
+        Args:
+            poses: (N, 6) TCP poses in path order
+            seed: (6,) joint angles the path starts from
+        
+        Returns:
+            Tuple of (N, 6) joint angles and (N,) validity mask. An unreachable
+            pose is NaN and the next pose is seeded from the last valid one.
+        """
+        solutions, valid = self.inverse(np.asarray(poses, dtype=np.float64).reshape(-1, 6))
+        joints = np.full((solutions.shape[0], 6), np.nan)
+        ok = np.zeros(solutions.shape[0], dtype=bool)
+        previous = np.asarray(seed, dtype=np.float64).reshape(6)
+        for i in range(solutions.shape[0]):
+            chosen, found = select_nearest(solutions[i:i + 1], valid[i:i + 1], previous)
+            if found[0]:
+                joints[i] = chosen[0]
+                ok[i] = True
+                previous = chosen[0]
+        return joints, ok
+    
+    def is_reachable(self, poses: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+        """
+        Check which poses have at least one IK solution.
+        
+        Args:
+            poses: (6,) or (N, 6) TCP poses
+        
+        Returns:
+            Boolean scalar or (N,) array
+        """
+        _, valid = self.inverse(poses)
+        return valid.any(axis=-1)
+
+
+def select_nearest(solutions: np.ndarray, valid: np.ndarray,
+                   seed: Union[Sequence[float], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Select the IK branch nearest to a seed for a batch of poses.
+    
+    Args:
+        solutions: (N, 8, 6) IK solutions from ``URKinematics.inverse``
+        valid: (N, 8) validity mask
+        seed: (6,) or (N, 6) seed joint angles
+    
+    Returns:
+        Tuple of (N, 6) joint angles and (N,) mask of poses with any valid branch
+    """
+    seed = np.broadcast_to(np.asarray(seed, dtype=np.float64), (solutions.shape[0], 6))[:, None, :]
+    
+    # Shift each joint by a multiple of 2*pi towards the seed, staying in limits
+    shifted = solutions + 2.0 * np.pi * np.round((seed - solutions) / (2.0 * np.pi))
+    shifted = np.where(shifted > JOINT_LIMIT, shifted - 2.0 * np.pi, shifted)
+    shifted = np.where(shifted < -JOINT_LIMIT, shifted + 2.0 * np.pi, shifted)
+    
+    distance = np.where(valid, np.abs(shifted - seed).max(axis=-1), np.inf)
+    best = np.argmin(distance, axis=-1)
+    rows = np.arange(solutions.shape[0])
+    ok = np.isfinite(distance[rows, best])
+    joints = np.where(ok[:, None], shifted[rows, best], np.nan)
+    return joints, ok
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Control Loop Timing
+
+Per-phase timing histograms for the processor and servo loops:
+    
+    parse:     reading and parsing new commands
+    rtde:      the control interface call(s) of one cycle
+    overshoot: how much later than requested the sleep woke up
+    period:    time from one cycle start to the next
+
+Every ``LoopTimer`` registers itself, so all loops in the process can be
+dumped to the log at once (``dump``, also on SIGUSR1 once
+``install_dump_signal`` ran) and written to a JSON file at shutdown
+(``export``).
+"""
+
+import json
+import time
+import atexit
+import signal
+import logging
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from .histogram import LatencyHistogram
+except ImportError:
+    from histogram import LatencyHistogram
+
+PHASES = ('parse', 'rtde', 'overshoot', 'period')
+
+logger = logging.getLogger('URLoopTiming')
+_timers: 'weakref.WeakValueDictionary[str, LoopTimer]' = weakref.WeakValueDictionary()
+_installed = False
+
+
+class LoopTimer:
+    """Timing histograms for one control loop."""
+    
+    def __init__(self, name: str):
+        """
+        Initialize the timer and register it under ``name``.
+        
+        Args:
+            name: Loop name used in dumps and exports (a later timer with
+                the same name replaces this one in the registry)
+        """
+        self.name = name
+        self.histograms = {phase: LatencyHistogram() for phase in PHASES}
+        self._cycle_start: Optional[float] = None
+        _timers[name] = self
+    
+    def record(self, phase: str, seconds: float) -> None:
+        """Record one duration for a phase."""
+        self.histograms[phase].record(seconds)
+    
+    def start_cycle(self) -> float:
+        """Mark the start of a cycle, recording the period since the previous one."""
+        now = time.perf_counter()
+        if self._cycle_start is not None:
+            self.histograms['period'].record(now - self._cycle_start)
+        self._cycle_start = now
+        return now
+    
+    def sleep(self, seconds: float, sleep: Callable[[float], None] = time.sleep) -> None:
+        """Sleep with ``sleep`` and record how late it woke up."""
+        start = time.perf_counter()
+        sleep(seconds)
+        self.histograms['overshoot'].record(max(time.perf_counter() - start - seconds, 0.0))
+    
+    def reset(self) -> None:
+        """Drop all recorded timings (at the start of a new run)."""
+        for histogram in self.histograms.values():
+            histogram.reset()
+        self._cycle_start = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {phase: histogram.to_dict() for phase, histogram in self.histograms.items()}
+    
+    def summary(self) -> List[str]:
+        """One line per phase with samples."""
+        return [f"{self.name} {phase}: {histogram.summary('us')}"
+                for phase, histogram in self.histograms.items() if histogram.count]
+
+
+def timers() -> List[LoopTimer]:
+    """All live loop timers."""
+    return list(_timers.values())
+
+
+def dump() -> None:
+    """Log the timing summary of every loop."""
+    lines = [line for timer in timers() for line in timer.summary()]
+    if not lines:
+        logger.info("No loop timings recorded")
+    for line in lines:
+        logger.info(line)
+
+
+def export(path: str) -> None:
+    """Write the timings of every loop to a JSON file (seconds)."""
+    data = {timer.name: timer.to_dict() for timer in timers()}
+    try:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+        logger.info(f"Loop timings written to {path}")
+    except OSError as e:
+        logger.error(f"Failed to write loop timings to {path}: {e}")
+
+
+def install_dump_signal(config: Optional[Dict] = None) -> None:
+    """
+    Dump on a signal and export at exit, per the ``timing`` config section.
+    
+    Only the first call does anything. Signal handlers can only be
+    installed from the main thread; elsewhere only the export is set up.
+    """
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    
+    timing = (config or {}).get('timing', {})
+    signal_name = timing.get('dump_signal', 'SIGUSR1')
+    signum = getattr(signal, signal_name, None) if signal_name else None
+    if signum is not None and threading.current_thread() is threading.main_thread():
+        signal.signal(signum, lambda *_: dump())
+    
+    export_file = timing.get('export_file')
+    if export_file:
+        atexit.register(export, export_file)
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Metrics Registry
+
+A small Prometheus-compatible metrics registry fed by ``URRobotController``
+and ``URCommandProcessor``, plus a stdlib HTTP endpoint serving it in the
+Prometheus text exposition format (version 0.0.4).
+
+Instruments are created once, and label values are bound once with
+``labels()``. The bound child only holds a number, so ``inc``/``set``/
+``observe`` on the control loop is an attribute update with no lookups,
+string formatting or objects the garbage collector has to track. All
+formatting happens when the endpoint is scraped.
+
+Example:
+    requests = REGISTRY.counter('ur_example_total', 'Example counter', ('robot',))
+    child = requests.labels('192.168.1.5')
+    child.inc()
+    start_server(port=9108)
+"""
+
+import bisect
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger('URMetrics')
+
+# RTDE calls range from sub-millisecond (speedL, servo) to whole blocking moves
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    """Render {name="value",...} (empty without labels)."""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value: float) -> str:
+    """Render a sample value."""
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _CounterChild:
+    __slots__ = ('value',)
+    
+    def __init__(self):
+        self.value = 0
+    
+    def inc(self, amount: float = 1) -> None:
+        """Increase the counter (amount must not be negative)."""
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ('value', 'function')
+    
+    def __init__(self):
+        self.value = 0
+        self.function: Optional[Callable[[], float]] = None
+    
+    def set(self, value: float) -> None:
+        self.value = value
+    
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+    
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+    
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the value from ``function`` at scrape time instead."""
+        self.function = function
+    
+    def get(self) -> float:
+        return self.function() if self.function is not None else self.value
+
+
+class _HistogramChild:
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+    
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Metric:
+    """A named metric family with optional labels."""
+    
+    kind = ''
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self.labels()
+    
+    def _new_child(self):
+        raise NotImplementedError
+    
+    def labels(self, *values: str):
+        """Child for one set of label values; bind it once and keep it."""
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+    
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for key, child in list(self._children.items()):
+            lines.extend(self._render_child(key, child))
+        return lines
+    
+    def _render_child(self, key: Tuple[str, ...], child) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+    
+    kind = 'counter'
+    
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+    
+    def inc(self, amount: float = 1) -> None:
+        self._default.inc(amount)
+    
+    def _render_child(self, key, child) -> List[str]:
+        return [f"{self.name}{_label_text(self.labelnames, key)} {_number(child.value)}"]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or is read from a function at scrape time."""
+    
+    kind = 'gauge'
+    
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+    
+    def set(self, value: float) -> None:
+        self._default.set(value)
+    
+    def _render_child(self, key, child) -> List[str]:
+        try:
+            value = child.get()
+        except Exception as e:
+            logger.debug(f"Gauge {self.name} function failed: {e}")
+            return []
+        return [f"{self.name}{_label_text(self.labelnames, key)} {_number(value)}"]
+
+
+class Histogram(_Metric):
+    """Distribution of observations in fixed buckets."""
+    
+    kind = 'histogram'
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+    
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.bounds)
+    
+    def observe(self, value: float) -> None:
+        self._default.observe(value)
+    
+    def _render_child(self, key, child) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.bounds + (float('inf'),), list(child.counts)):
+            cumulative += count
+            labels = _label_text(self.labelnames, key, f'le="{_number(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _label_text(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_number(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics; asking for an existing name returns the existing metric."""
+    
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+    
+    def _get(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered as a different {metric.kind}")
+        return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get(Counter, name, documentation, labelnames)
+    
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get(Gauge, name, documentation, labelnames)
+    
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, documentation, labelnames, buckets=buckets)
+    
+    def render(self) -> str:
+        """All metrics in the Prometheus text format."""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+# Registry used by the controller and processors
+REGISTRY = MetricsRegistry()
+
+_servers: Dict[Tuple[str, int], ThreadingHTTPServer] = {}
+_servers_lock = threading.Lock()
+
+
+def start_server(host: str = '0.0.0.0', port: int = 9108,
+                 registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """
+    Serve ``registry`` at http://host:port/metrics from a daemon thread.
+    
+    Starting a server on an address that is already serving returns the
+    running server.
+    """
+    with _servers_lock:
+        server = _servers.get((host, port))
+        if server is not None:
+            return server
+        
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+        
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='URMetrics', daemon=True).start()
+        _servers[(host, port)] = server
+        logger.info(f"Serving metrics on http://{host}:{port}/metrics")
+        return server
+
+
+class ControllerMetrics:
+    """Metrics of one URRobotController, bound to its robot label."""
+    
+    def __init__(self, robot: str, registry: MetricsRegistry = REGISTRY):
+        labels = ('robot',)
+        self.commands = registry.counter(
+            'ur_commands_total', 'Control interface calls run on the command thread', labels).labels(robot)
+        self.call_seconds = registry.histogram(
+            'ur_rtde_call_seconds', 'Duration of control interface calls (blocking moves included)',
+            labels).labels(robot)
+        self.queue_depth = registry.gauge(
+            'ur_command_queue_depth', 'Commands waiting for the command thread', labels).labels(robot)
+        self.connects = registry.counter('ur_connects_total', 'Successful connections', labels).labels(robot)
+        self.reconnects = registry.counter(
+            'ur_reconnects_total', 'Connections after the first one', labels).labels(robot)
+        self.connected = registry.gauge('ur_connected', '1 while connected to the robot', labels).labels(robot)
+        self.emergency_stops = registry.counter(
+            'ur_emergency_stops_total', 'Emergency stop requests', labels).labels(robot)
+        self.stop_latency = registry.histogram(
+            'ur_stop_latency_seconds', 'Time from emergency stop request to standstill', labels).labels(robot)
+        self.missed_standstills = registry.counter(
+            'ur_stop_missed_standstill_total', 'Emergency stops that did not reach standstill in time',
+            labels).labels(robot)
+        rejections = registry.counter(
+            'ur_safety_rejections_total', 'Commands refused by the safety checks', ('robot', 'check'))
+        self.rejections = {check: rejections.labels(robot, check) for check in ('pose', 'joint', 'velocity')}
+
+
+class ProcessorMetrics:
+    """Metrics of the command processors, bound to the robot label."""
+    
+    def __init__(self, robot: str, registry: MetricsRegistry = REGISTRY):
+        commands = registry.counter(
+            'ur_stream_commands_total', 'Commands read by the processors', ('robot', 'result'))
+        self.accepted = commands.labels(robot, 'accepted')
+        self.dropped = commands.labels(robot, 'dropped')
+        self.sent = registry.counter(
+            'ur_stream_sends_total', 'Motion commands sent by the streaming loops', ('robot',)).labels(robot)
+        self.watchdog_trips = registry.counter(
+            'ur_watchdog_trips_total', 'Streams stopped because the producer went silent',
+            ('robot',)).labels(robot)
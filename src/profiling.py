@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Hot-path Profiling
+
+Sampled spans around the steps of a control cycle (JSON decode, log write,
+safety check, RTDE call, moves), exported in the Chrome trace-event format
+so a real run can be opened in Perfetto (ui.perfetto.dev) or
+chrome://tracing.
+    
+    with span('decode'):
+        cmd = json.loads(line)
+    
+    @traced('move_linear')
+    def move_linear(self, ...): ...
+
+Disabled (the default) a span is one attribute check returning a shared
+no-op context manager, and a traced function one attribute check before
+the call. Enabled, only every ``sample_every``-th top-level span on a
+thread is recorded, together with everything nested inside it; events go
+to a bounded ring buffer.
+"""
+
+import os
+import json
+import time
+import atexit
+import logging
+import threading
+import functools
+from collections import deque
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger('URProfiler')
+
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    """Records one complete event when it exits."""
+    
+    __slots__ = ('profiler', 'name', 'args', 'start')
+    
+    def __init__(self, profiler: 'Profiler', name: str, args: Optional[Dict[str, Any]]):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+    
+    def __enter__(self) -> '_Span':
+        self.profiler._local.depth += 1
+        self.start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        end = time.perf_counter_ns()
+        local = self.profiler._local
+        local.depth -= 1
+        self.profiler._events.append((self.name, self.start, end - self.start, threading.get_ident(), self.args))
+
+
+class _SkippedSpan:
+    """Stand-in for a span that is not sampled; keeps the nesting depth so children are skipped too."""
+    
+    __slots__ = ('profiler',)
+    
+    def __init__(self, profiler: 'Profiler'):
+        self.profiler = profiler
+    
+    def __enter__(self) -> None:
+        self.profiler._local.depth += 1
+    
+    def __exit__(self, *exc) -> None:
+        self.profiler._local.depth -= 1
+
+
+class Profiler:
+    """Sampling span recorder with Chrome trace export."""
+    
+    def __init__(self, enabled: bool = False, sample_every: int = 1, max_events: int = 100000):
+        """
+        Initialize the profiler.
+        
+        Args:
+            enabled: Record spans at all
+            sample_every: Record one in this many top-level spans per thread
+            max_events: Ring buffer size; the oldest events are dropped first
+        """
+        self.enabled = enabled
+        self.sample_every = max(1, int(sample_every))
+        self._events = deque(maxlen=max_events)
+        self._local = threading.local()
+        self._thread_names: Dict[int, str] = {}
+        self._skipped = _SkippedSpan(self)
+    
+    def configure(self, config: Dict) -> None:
+        """Apply the ``profiling`` config section (and register the export at exit)."""
+        profiling = (config or {}).get('profiling', {})
+        self.enabled = profiling.get('enabled', self.enabled)
+        self.sample_every = max(1, int(profiling.get('sample_every', self.sample_every)))
+        max_events = profiling.get('max_events')
+        if max_events and max_events != self._events.maxlen:
+            self._events = deque(self._events, maxlen=max_events)
+        export_file = profiling.get('export_file')
+        if self.enabled and export_file:
+            atexit.register(self.export, export_file)
+    
+    def _sampled(self) -> bool:
+        """Sampling decision: top-level spans decide, nested spans follow their parent."""
+        local = self._local
+        if not hasattr(local, 'depth'):
+            local.depth = 0
+            local.count = 0
+            local.sampled = False
+            self._thread_names[threading.get_ident()] = threading.current_thread().name
+        if local.depth == 0:
+            local.count += 1
+            local.sampled = local.count % self.sample_every == 0
+        return local.sampled
+    
+    def span(self, name: str, args: Optional[Dict[str, Any]] = None):
+        """Context manager timing the enclosed block."""
+        if not self.enabled:
+            return _NULL_SPAN
+        if not self._sampled():
+            return self._skipped
+        return _Span(self, name, args)
+    
+    def traced(self, name: Optional[str] = None) -> Callable:
+        """Decorator timing every (sampled) call of a function."""
+        def decorator(function: Callable) -> Callable:
+            span_name = name or function.__qualname__
+            
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with self.span(span_name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+    
+    def clear(self) -> None:
+        """Drop all recorded events."""
+        self._events.clear()
+    
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Recorded events as a Chrome trace-event document (timestamps in microseconds)."""
+        pid = os.getpid()
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+                  for tid, name in list(self._thread_names.items())]
+        for name, start, duration, tid, args in list(self._events):
+            event = {'name': name, 'cat': 'ur', 'ph': 'X', 'pid': pid, 'tid': tid,
+                     'ts': start / 1000.0, 'dur': duration / 1000.0}
+            if args:
+                event['args'] = args
+            events.append(event)
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+    
+    def export(self, path: str) -> None:
+        """Write the Chrome trace to ``path`` (open it in Perfetto)."""
+        try:
+            with open(path, 'w') as f:
+                json.dump(self.to_chrome_trace(), f)
+            logger.info(f"Wrote {len(self._events)} trace events to {path}")
+        except OSError as e:
+            logger.error(f"Failed to write trace to {path}: {e}")
+
+
+# Process-wide profiler used by the controller and processors
+PROFILER = Profiler()
+span = PROFILER.span
+traced = PROFILER.traced
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Real-time Process Tuning
+
+Opt-in tuning for the control loops, aimed at Linux edge PCs where loop
+jitter comes from the scheduler and the garbage collector rather than the
+robot:
+
+- CPU affinity: pin the control threads to the configured CPU(s)
+- SCHED_FIFO: run the control threads at a real-time priority
+- mlockall: lock the process memory so the loop never waits on a page fault
+- GC: ``gc.freeze()`` the objects allocated during startup, keep the
+  collector disabled while a loop runs and collect in the idle time
+  before each sleep instead, promoting to the older generations on the
+  collector's own schedule (so a long streaming run still collects them)
+
+Each step needs privileges (CAP_SYS_NICE, memlock limits) or platform
+support that may be missing; steps that cannot be applied are reported and
+skipped, never fatal. ``report`` holds the outcome of every step.
+"""
+
+import gc
+import os
+import ctypes
+import ctypes.util
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Union
+
+try:
+    from .clock import SYSTEM_CLOCK, SystemClock
+except ImportError:
+    from clock import SYSTEM_CLOCK, SystemClock
+
+# mlockall flags (Linux)
+MCL_CURRENT = 1
+MCL_FUTURE = 2
+
+
+class RealtimeMode:
+    """Apply and undo real-time settings for the control threads."""
+    
+    def __init__(self, enabled: bool = False, cpu: Union[int, List[int], None] = None,
+                 priority: Optional[int] = 80, lock_memory: bool = True, manage_gc: bool = True,
+                 gc_idle_slack: float = 0.0005, clock: Optional[SystemClock] = None):
+        """
+        Initialize the real-time mode (nothing is applied until ``setup_process``/``thread``).
+        
+        Args:
+            enabled: Apply the settings at all
+            cpu: CPU or list of CPUs for the control threads (None = leave affinity)
+            priority: SCHED_FIFO priority 1-99 (None = leave the scheduler)
+            lock_memory: Lock current and future memory with mlockall
+            manage_gc: Freeze startup objects and collect only in idle slots during loops
+            gc_idle_slack: Smallest idle time (seconds) worth spending on a collection
+            clock: Clock the loops sleep on (default: the system clock)
+        """
+        self.enabled = enabled
+        self.cpus = [cpu] if isinstance(cpu, int) else (list(cpu) if cpu is not None else None)
+        self.priority = priority
+        self.lock_memory = lock_memory
+        self.manage_gc = manage_gc
+        self.gc_idle_slack = gc_idle_slack
+        self.clock = clock or SYSTEM_CLOCK
+        self.logger = logging.getLogger('URRealtime')
+        
+        # Outcome of every step: name -> "applied ..." / "skipped ..." / "failed ..."
+        self.report: Dict[str, str] = {}
+        self._libc = None
+        self._gc_lock = threading.Lock()
+        self._gc_depth = 0
+        self._gc_was_enabled = True
+    
+    @classmethod
+    def from_config(cls, config: Dict, clock: Optional[SystemClock] = None) -> 'RealtimeMode':
+        """Build from the ``realtime`` config section, sleeping on ``clock``."""
+        realtime = (config or {}).get('realtime', {})
+        return cls(
+            enabled=realtime.get('enabled', False),
+            cpu=realtime.get('cpu'),
+            priority=realtime.get('priority', 80),
+            lock_memory=realtime.get('lock_memory', True),
+            manage_gc=realtime.get('manage_gc', True),
+            gc_idle_slack=realtime.get('gc_idle_slack', 0.0005),
+            clock=clock,
+        )
+    
+    def _record(self, step: str, outcome: str) -> None:
+        """Store and log the outcome of one step."""
+        self.report[step] = outcome
+        if outcome.startswith('applied'):
+            self.logger.info(f"Real-time {step}: {outcome}")
+        else:
+            self.logger.warning(f"Real-time {step}: {outcome}")
+    
+    def setup_process(self) -> Dict[str, str]:
+        """
+        Apply the process-wide steps (memory lock, GC freeze); call once after startup.
+        
+        Returns:
+            The report
+        """
+        if not self.enabled:
+            return self.report
+        
+        if self.lock_memory:
+            self._lock_memory()
+        
+        if self.manage_gc:
+            gc.collect()
+            gc.freeze()
+            self._record('gc_freeze', f"applied ({gc.get_freeze_count()} objects frozen)")
+        return self.report
+    
+    def release_process(self) -> None:
+        """Undo the process-wide steps."""
+        if self._libc is not None:
+            self._libc.munlockall()
+            self._libc = None
+        if self.enabled and self.manage_gc:
+            gc.unfreeze()
+    
+    def _lock_memory(self) -> None:
+        """mlockall(MCL_CURRENT | MCL_FUTURE)."""
+        library = ctypes.util.find_library('c')
+        if not library or not hasattr(ctypes.CDLL(library), 'mlockall'):
+            self._record('mlockall', "skipped (not supported on this platform)")
+            return
+        libc = ctypes.CDLL(library, use_errno=True)
+        if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+            errno = ctypes.get_errno()
+            self._record('mlockall', f"failed ({os.strerror(errno)}; raise the memlock limit or grant CAP_IPC_LOCK)")
+            return
+        self._libc = libc
+        self._record('mlockall', "applied (current and future memory locked)")
+    
+    def apply_thread(self, name: str = 'control') -> Dict[str, str]:
+        """
+        Pin the calling thread and give it SCHED_FIFO priority.
+        
+        Args:
+            name: Label for the report ("affinity[name]", "sched_fifo[name]")
+        
+        Returns:
+            Previous settings, for ``restore_thread``
+        """
+        previous: Dict = {}
+        if not self.enabled:
+            return previous
+        
+        if self.cpus is not None:
+            if not hasattr(os, 'sched_setaffinity'):
+                self._record(f"affinity[{name}]", "skipped (not supported on this platform)")
+            else:
+                try:
+                    previous['affinity'] = os.sched_getaffinity(0)
+                    os.sched_setaffinity(0, self.cpus)
+                    self._record(f"affinity[{name}]", f"applied (CPU {', '.join(map(str, self.cpus))})")
+                except OSError as e:
+                    previous.pop('affinity', None)
+                    self._record(f"affinity[{name}]", f"failed ({e.strerror})")
+        
+        if self.priority is not None:
+            if not hasattr(os, 'sched_setscheduler'):
+                self._record(f"sched_fifo[{name}]", "skipped (not supported on this platform)")
+            else:
+                try:
+                    previous['scheduler'] = (os.sched_getscheduler(0), os.sched_getparam(0))
+                    os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.priority))
+                    self._record(f"sched_fifo[{name}]", f"applied (priority {self.priority})")
+                except OSError as e:
+                    previous.pop('scheduler', None)
+                    self._record(f"sched_fifo[{name}]",
+                                 f"failed ({e.strerror}; needs CAP_SYS_NICE or an rtprio limit)")
+        return previous
+    
+    def restore_thread(self, previous: Dict) -> None:
+        """Undo ``apply_thread`` on the calling thread."""
+        try:
+            if 'scheduler' in previous:
+                policy, param = previous['scheduler']
+                os.sched_setscheduler(0, policy, param)
+            if 'affinity' in previous:
+                os.sched_setaffinity(0, previous['affinity'])
+        except OSError as e:
+            self.logger.warning(f"Failed to restore thread scheduling: {e}")
+    
+    @contextmanager
+    def gc_paused(self) -> Iterator[None]:
+        """Keep the garbage collector disabled for the duration of a loop (nestable)."""
+        if not (self.enabled and self.manage_gc):
+            yield
+            return
+        
+        with self._gc_lock:
+            if self._gc_depth == 0:
+                self._gc_was_enabled = gc.isenabled()
+                gc.disable()
+            self._gc_depth += 1
+        try:
+            yield
+        finally:
+            with self._gc_lock:
+                self._gc_depth -= 1
+                if self._gc_depth == 0 and self._gc_was_enabled:
+                    gc.enable()
+    
+    @contextmanager
+    def thread(self, name: str = 'control') -> Iterator[None]:
+        """Run a control loop on the calling thread with real-time scheduling and GC paused."""
+        previous = self.apply_thread(name)
+        try:
+            with self.gc_paused():
+                yield
+        finally:
+            self.restore_thread(previous)
+    
+    def idle(self, slack: float) -> None:
+        """
+        Collect garbage if ``slack`` seconds are free before the next cycle.
+        
+        Collects the youngest generation, or an older one once it is due by
+        the collector's thresholds (as automatic collection would).
+        """
+        if self._gc_depth and slack >= self.gc_idle_slack:
+            _, young_collections, middle_collections = gc.get_count()
+            _, middle_threshold, old_threshold = gc.get_threshold()
+            if middle_collections >= old_threshold:
+                gc.collect(2)
+            elif young_collections >= middle_threshold:
+                gc.collect(1)
+            else:
+                gc.collect(0)
+    
+    def sleep(self, seconds: float) -> None:
+        """Sleep on the clock until the next cycle, collecting garbage in the idle time first."""
+        if self._gc_depth:
+            start = self.clock.monotonic()
+            self.idle(seconds)
+            seconds -= self.clock.monotonic() - start
+        self.clock.sleep(seconds)
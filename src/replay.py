@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Command Log Replay
+
+Feeds the command log written by the synchronous processors (the
+``log_file`` argument) back through ``URCommandProcessor`` against a
+simulated robot, keeping the recorded spacing between commands on the
+robot's clock. With a ``DilatedClock`` a day of production commands
+replays in minutes; long idle gaps are shortened to ``max_gap``.
+
+The report compares, for every command, the pose the robot was at when
+the next command was sent in the log with the pose the simulated robot
+reached at the same moment. For absolute poses and dead-reckoned deltas
+that is the commanded pose. A velocity-mode delta (speedL) does not aim
+for a pose within the gap, so its reference is the recorded telemetry if
+given, else the actual pose the next velocity delta was applied to;
+without either (the last command) it is not compared.
+
+Example:
+    robot = SimulatedRobot(clock=DilatedClock(50))
+    controller = URRobotController(config_path, backend=robot)
+    controller.connect()
+    engine = ReplayEngine(URCommandProcessor(controller))
+    report = engine.run(load_command_log('logs/commands.jsonl'))
+    print('\\n'.join(report.summary()))
+"""
+
+import json
+import time
+import logging
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from .spatial import compose_rotvecs
+except ImportError:
+    from spatial import compose_rotvecs
+
+POSE_KEYS = ('x', 'y', 'z', 'rx', 'ry', 'rz')
+DELTA_KEYS = ('dx', 'dy', 'dz', 'drx', 'dry', 'drz')
+
+logger = logging.getLogger('URReplay')
+
+
+class ReplayEntry(NamedTuple):
+    """One logged command."""
+    
+    line: int
+    timestamp: float
+    kind: str  # "delta" or "pose"
+    command: Dict[str, float]
+    commanded_pose: Tuple[float, ...]
+    delta_mode: Optional[str] = None  # "velocity" or "dead_reckoned"; None if not logged
+
+
+def load_command_log(path: str) -> List[ReplayEntry]:
+    """
+    Read a processor command log.
+    
+    Delta entries (with a ``delta`` field) are replayed as delta commands
+    in their logged ``delta_mode``, all others as absolute pose commands
+    to their ``target_pose``. Lines without a timestamp or target pose are
+    skipped.
+    """
+    entries = []
+    with open(path, 'r') as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                timestamp = float(record['timestamp'])
+                target = tuple(float(v) for v in record['target_pose'])
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping log line {line_num}: {e}")
+                continue
+            
+            if 'delta' in record:
+                command = dict(zip(DELTA_KEYS, map(float, record['delta'])))
+                entries.append(ReplayEntry(line_num, timestamp, 'delta', command, target, record.get('delta_mode')))
+            else:
+                entries.append(ReplayEntry(line_num, timestamp, 'pose', dict(zip(POSE_KEYS, target)), target))
+    return entries
+
+
+def load_telemetry(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Read telemetry written by ``TelemetryRecorder``.
+    
+    Returns:
+        (N,) Unix timestamps and (N, 6) actual TCP poses
+    """
+    times, poses = [], []
+    with open(path, 'r') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            sample = json.loads(line)
+            times.append(float(sample['timestamp']))
+            poses.append(sample['tcp_pose'])
+    return np.asarray(times, dtype=np.float64), np.asarray(poses, dtype=np.float64).reshape(-1, 6)
+
+
+class TelemetryRecorder:
+    """Background thread appending the controller's TCP pose to a JSONL file."""
+    
+    def __init__(self, controller, path: str, frequency: float = 50.0):
+        """
+        Initialize the recorder.
+        
+        Args:
+            controller: Connected ``URRobotController``
+            path: JSONL file to append samples to
+            frequency: Samples per second
+        """
+        self.controller = controller
+        self.path = path
+        self.period = 1.0 / frequency
+        self._running = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, name='URTelemetry', daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        self._running.clear()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+    
+    def __enter__(self) -> 'TelemetryRecorder':
+        self.start()
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.stop()
+    
+    def _run(self) -> None:
+        clock = self.controller.clock
+        with open(self.path, 'a') as f:
+            while self._running.is_set():
+                pose = self.controller.get_tcp_pose()
+                if pose is not None:
+                    f.write(json.dumps({'timestamp': clock.time(), 'tcp_pose': list(pose)}) + '\n')
+                clock.sleep(self.period)
+
+
+def _pose_errors(expected: np.ndarray, actual: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Position (m) and orientation (rad) distance between two (N, 6) pose arrays."""
+    position = np.linalg.norm(actual[:, :3] - expected[:, :3], axis=1)
+    rotation = compose_rotvecs(-expected[:, 3:], actual[:, 3:]).reshape(-1, 3)
+    return position, np.linalg.norm(rotation, axis=1)
+
+
+def _statistics(values: np.ndarray) -> Dict[str, float]:
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return {'mean': 0.0, 'p95': 0.0, 'max': 0.0}
+    return {'mean': float(values.mean()), 'p95': float(np.percentile(values, 95)), 'max': float(values.max())}
+
+
+class ReplayReport:
+    """Commanded vs reproduced poses of one replay."""
+    
+    def __init__(self, entries: Sequence[ReplayEntry], reproduced: np.ndarray, executed: np.ndarray,
+                 recorded_duration: float, replayed_duration: float, wall_time: float,
+                 position_tolerance: float, orientation_tolerance: float,
+                 telemetry_poses: Optional[np.ndarray] = None, expected: Optional[np.ndarray] = None):
+        self.entries = list(entries)
+        self.commanded = np.array([e.commanded_pose for e in entries], dtype=np.float64).reshape(-1, 6)
+        # Reference poses (NaN rows are not compared), the commanded poses by default
+        self.expected = self.commanded if expected is None else expected
+        self.reproduced = reproduced
+        self.executed = executed
+        self.recorded_duration = recorded_duration
+        self.replayed_duration = replayed_duration
+        self.wall_time = wall_time
+        self.position_tolerance = position_tolerance
+        self.orientation_tolerance = orientation_tolerance
+        self.position_error, self.orientation_error = _pose_errors(self.expected, reproduced)
+        self.telemetry_error = (_pose_errors(telemetry_poses, reproduced)
+                                if telemetry_poses is not None else None)
+    
+    @property
+    def compared(self) -> int:
+        """Number of entries with a reference pose."""
+        return int((~np.isnan(self.position_error)).sum())
+    
+    @property
+    def out_of_tolerance(self) -> np.ndarray:
+        """Indices of entries whose reproduced pose missed the reference pose."""
+        return np.flatnonzero((self.position_error > self.position_tolerance) |
+                              (self.orientation_error > self.orientation_tolerance))
+    
+    @property
+    def passed(self) -> bool:
+        return bool(self.executed.all()) and not len(self.out_of_tolerance)
+    
+    def to_dict(self, limit: int = 50) -> Dict[str, Any]:
+        """Report as a JSON-serializable dictionary (at most ``limit`` listed deviations)."""
+        deviations = [{
+            'line': self.entries[i].line,
+            'kind': self.entries[i].kind,
+            'commanded_pose': self.commanded[i].tolist(),
+            'expected_pose': self.expected[i].tolist(),
+            'reproduced_pose': self.reproduced[i].tolist(),
+            'position_error': float(self.position_error[i]),
+            'orientation_error': float(self.orientation_error[i]),
+        } for i in self.out_of_tolerance[:limit]]
+        report = {
+            'passed': self.passed,
+            'commands': len(self.entries),
+            'compared': self.compared,
+            'failed_commands': [self.entries[i].line for i in np.flatnonzero(~self.executed)],
+            'recorded_duration': self.recorded_duration,
+            'replayed_duration': self.replayed_duration,
+            'wall_time': self.wall_time,
+            'position_error': _statistics(self.position_error),
+            'orientation_error': _statistics(self.orientation_error),
+            'tolerance': {'position': self.position_tolerance, 'orientation': self.orientation_tolerance},
+            'out_of_tolerance': len(self.out_of_tolerance),
+            'deviations': deviations,
+        }
+        if self.telemetry_error is not None:
+            report['telemetry_position_error'] = _statistics(self.telemetry_error[0])
+            report['telemetry_orientation_error'] = _statistics(self.telemetry_error[1])
+        return report
+    
+    def summary(self) -> List[str]:
+        """Human-readable report lines."""
+        position = _statistics(self.position_error)
+        orientation = _statistics(self.orientation_error)
+        speedup = self.replayed_duration / self.wall_time if self.wall_time > 0 else float('inf')
+        lines = [
+            f"Commands: {len(self.entries)} ({int((~self.executed).sum())} failed, "
+            f"{len(self.entries) - self.compared} without reference pose)",
+            f"Time: {self.recorded_duration:.1f}s recorded, {self.replayed_duration:.1f}s replayed "
+            f"in {self.wall_time:.1f}s wall time ({speedup:.1f}x)",
+            f"Position error: mean {position['mean'] * 1000:.2f} mm, p95 {position['p95'] * 1000:.2f} mm, "
+            f"max {position['max'] * 1000:.2f} mm",
+            f"Orientation error: mean {orientation['mean']:.4f} rad, p95 {orientation['p95']:.4f} rad, "
+            f"max {orientation['max']:.4f} rad",
+        ]
+        if self.telemetry_error is not None:
+            telemetry = _statistics(self.telemetry_error[0])
+            lines.append(f"Versus telemetry: mean {telemetry['mean'] * 1000:.2f} mm, "
+                         f"max {telemetry['max'] * 1000:.2f} mm")
+        for i in self.out_of_tolerance[:10]:
+            lines.append(f"  line {self.entries[i].line}: off by {self.position_error[i] * 1000:.2f} mm, "
+                         f"{self.orientation_error[i]:.4f} rad")
+        if len(self.out_of_tolerance) > 10:
+            lines.append(f"  ... {len(self.out_of_tolerance) - 10} more")
+        return lines
+
+
+class ReplayEngine:
+    """Replays logged commands through a processor whose controller has a simulated backend."""
+    
+    def __init__(self, processor, max_gap: Optional[float] = 5.0, settle_timeout: float = 2.0,
+                 position_tolerance: float = 0.002, orientation_tolerance: float = 0.01):
+        """
+        Initialize the engine.
+        
+        Args:
+            processor: ``URCommandProcessor`` whose controller has a backend
+            max_gap: Longest pause between two commands in seconds; longer
+                recorded gaps are shortened to this (None = keep them)
+            settle_timeout: Time the last command gets to finish
+            position_tolerance: Allowed commanded vs reproduced distance in meters
+            orientation_tolerance: Allowed commanded vs reproduced angle in radians
+        """
+        self.processor = processor
+        self.controller = processor.controller
+        self.max_gap = max_gap
+        self.settle_timeout = settle_timeout
+        self.position_tolerance = position_tolerance
+        self.orientation_tolerance = orientation_tolerance
+    
+    @classmethod
+    def from_config(cls, processor, config: Dict) -> 'ReplayEngine':
+        """Build from the ``replay`` config section."""
+        replay = (config or {}).get('replay', {})
+        return cls(
+            processor,
+            max_gap=replay.get('max_gap', 5.0),
+            settle_timeout=replay.get('settle_timeout', 2.0),
+            position_tolerance=replay.get('position_tolerance', 0.002),
+            orientation_tolerance=replay.get('orientation_tolerance', 0.01),
+        )
+    
+    def schedule(self, entries: Sequence[ReplayEntry]) -> np.ndarray:
+        """Offsets (seconds from the first command) at which each entry is replayed."""
+        gaps = np.diff([e.timestamp for e in entries]) if len(entries) > 1 else np.zeros(0)
+        gaps = np.maximum(gaps, 0.0)
+        if self.max_gap is not None:
+            gaps = np.minimum(gaps, self.max_gap)
+        return np.concatenate([[0.0], np.cumsum(gaps)])
+    
+    @staticmethod
+    def _applied_to(entry: ReplayEntry) -> np.ndarray:
+        """Pose a logged command started from (for a delta, its target minus the delta)."""
+        pose = np.asarray(entry.commanded_pose, dtype=np.float64)
+        if entry.kind == 'delta':
+            delta = np.array([entry.command[key] for key in DELTA_KEYS])
+            pose = np.concatenate([pose[:3] - delta[:3], compose_rotvecs(-delta[3:], pose[3:])])
+        return pose
+    
+    def _start_pose(self, entries: Sequence[ReplayEntry]) -> np.ndarray:
+        """Pose the robot was at before the first logged command."""
+        return self._applied_to(entries[0])
+    
+    def _expected_poses(self, entries: Sequence[ReplayEntry], modes: Sequence[Optional[str]],
+                        telemetry_poses: Optional[np.ndarray]) -> np.ndarray:
+        """Reference pose of every entry at the time of the next command (NaN if unknown)."""
+        expected = np.array([e.commanded_pose for e in entries], dtype=np.float64).reshape(-1, 6)
+        for i, entry in enumerate(entries):
+            if entry.kind != 'delta' or modes[i] != 'velocity':
+                continue
+            if telemetry_poses is not None:
+                expected[i] = telemetry_poses[i]
+            elif i + 1 < len(entries) and entries[i + 1].kind == 'delta' and modes[i + 1] == 'velocity':
+                # Velocity deltas are applied to the actual pose read when they are sent
+                expected[i] = self._applied_to(entries[i + 1])
+            else:
+                expected[i] = np.nan
+        return expected
+    
+    def run(self, entries: Sequence[ReplayEntry],
+            telemetry: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> ReplayReport:
+        """
+        Replay ``entries`` and compare the result with the log.
+        
+        Args:
+            entries: Logged commands (``load_command_log``)
+            telemetry: Optional recorded (timestamps, poses) to compare against as well
+        
+        Returns:
+            The replay report
+        """
+        controller, clock = self.controller, self.controller.clock
+        if not entries:
+            return ReplayReport([], np.zeros((0, 6)), np.zeros(0, dtype=bool), 0.0, 0.0, 0.0,
+                                self.position_tolerance, self.orientation_tolerance)
+        
+        backend = controller.backend
+        if backend is not None and hasattr(backend, 'reset'):
+            start_pose = telemetry[1][0] if telemetry is not None and len(telemetry[0]) else self._start_pose(entries)
+            backend.reset(start_pose)
+        self.processor.commanded_pose = None
+        
+        # Deltas run in their logged mode (the processor's mode for older logs)
+        processor_mode = self.processor.delta_mode
+        modes = [(e.delta_mode or processor_mode) if e.kind == 'delta' else None for e in entries]
+        
+        offsets = self.schedule(entries)
+        reproduced = np.zeros((len(entries), 6))
+        executed = np.zeros(len(entries), dtype=bool)
+        wall_start = time.perf_counter()
+        start = clock.monotonic()
+        
+        try:
+            for i, entry in enumerate(entries):
+                clock.sleep_until(start + offsets[i])
+                if i:
+                    reproduced[i - 1] = controller.get_tcp_pose()
+                if entry.kind == 'delta':
+                    if modes[i] != self.processor.delta_mode:
+                        self.processor.delta_mode = modes[i]
+                        self.processor.commanded_pose = None
+                    executed[i] = self.processor._execute_delta_command(entry.command)
+                else:
+                    executed[i] = self.processor._execute_pose_command(entry.command)
+                if not executed[i]:
+                    logger.warning(f"Command from log line {entry.line} failed")
+        finally:
+            self.processor.delta_mode = processor_mode
+        
+        controller.wait_until_settled(timeout=self.settle_timeout)
+        reproduced[-1] = controller.get_tcp_pose()
+        replayed = clock.monotonic() - start
+        wall_time = time.perf_counter() - wall_start
+        
+        telemetry_poses = None
+        if telemetry is not None and len(telemetry[0]):
+            # Telemetry at the moments the reproduced poses were sampled (next command, or the end)
+            sample_times = np.array([e.timestamp for e in entries[1:]] + [entries[-1].timestamp + self.settle_timeout])
+            nearest = np.clip(np.searchsorted(telemetry[0], sample_times), 0, len(telemetry[0]) - 1)
+            telemetry_poses = telemetry[1][nearest]
+        
+        return ReplayReport(entries, reproduced, executed, entries[-1].timestamp - entries[0].timestamp,
+                            replayed, wall_time, self.position_tolerance, self.orientation_tolerance,
+                            telemetry_poses, self._expected_poses(entries, modes, telemetry_poses))
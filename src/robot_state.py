@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Robot State Snapshots
+
+A telemetry thread is the only reader of the RTDE receive interface. At a
+fixed rate it builds an immutable ``RobotState`` and publishes it by
+replacing a single reference. Rebinding an attribute is atomic in Python, so
+any number of threads can read the latest snapshot without locks and
+without ever seeing a half-updated state.
+"""
+
+import time
+import logging
+import threading
+from typing import NamedTuple, Optional, Tuple
+
+try:
+    from .hot_logging import HotPathLogger
+except ImportError:
+    from hot_logging import HotPathLogger
+
+Vector6 = Tuple[float, float, float, float, float, float]
+
+
+class RobotState(NamedTuple):
+    """Immutable snapshot of the robot state."""
+    
+    sequence: int  # Increases by one per published snapshot
+    timestamp: float  # time.monotonic() when the snapshot was taken
+    tcp_pose: Vector6
+    target_tcp_pose: Vector6
+    tcp_speed: Vector6
+    joint_positions: Vector6
+    joint_speeds: Vector6
+    robot_mode: int
+    safety_mode: int
+    
+    @property
+    def linear_speed(self) -> float:
+        """TCP linear speed in m/s."""
+        return sum(v * v for v in self.tcp_speed[:3]) ** 0.5
+    
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was taken."""
+        return time.monotonic() - self.timestamp
+
+
+class StateMonitor:
+    """Telemetry thread publishing RobotState snapshots by atomic reference swap."""
+    
+    def __init__(self, rtde_r, frequency: float = 125.0):
+        """
+        Initialize the monitor.
+        
+        Args:
+            rtde_r: Connected RTDEReceiveInterface, read only by the monitor thread
+            frequency: Snapshot rate in Hz
+        """
+        self.rtde_r = rtde_r
+        self.frequency = frequency
+        self.errors = 0
+        self.logger = logging.getLogger('URStateMonitor')
+        # A persistent read error would otherwise log on every cycle
+        self.hot_log = HotPathLogger(self.logger)
+        
+        self._state: Optional[RobotState] = None
+        self._running = threading.Event()
+        self._first = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def latest(self) -> Optional[RobotState]:
+        """Most recent snapshot, or None before the first one."""
+        return self._state
+    
+    @property
+    def running(self) -> bool:
+        """Whether the monitor thread is publishing snapshots."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self, timeout: float = 1.0) -> bool:
+        """
+        Start the monitor thread and wait for the first snapshot.
+        
+        Args:
+            timeout: Maximum time to wait for the first snapshot in seconds
+        
+        Returns:
+            True if a snapshot is available
+        """
+        if not self.running:
+            self._running.set()
+            self._thread = threading.Thread(target=self._run, name='URStateMonitor', daemon=True)
+            self._thread.start()
+        return self._first.wait(timeout)
+    
+    def stop(self) -> None:
+        """Stop the monitor thread."""
+        self._running.clear()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.hot_log.flush()
+    
+    def read(self, sequence: int) -> RobotState:
+        """
+        Take one snapshot from the receive interface.
+        
+        Args:
+            sequence: Sequence number of the new snapshot
+        """
+        r = self.rtde_r
+        return RobotState(
+            sequence=sequence,
+            timestamp=time.monotonic(),
+            tcp_pose=tuple(r.getActualTCPPose()),
+            target_tcp_pose=tuple(r.getTargetTCPPose()),
+            tcp_speed=tuple(r.getActualTCPSpeed()),
+            joint_positions=tuple(r.getActualQ()),
+            joint_speeds=tuple(r.getActualQd()),
+            robot_mode=r.getRobotMode(),
+            safety_mode=r.getSafetyMode(),
+        )
+    
+    def _run(self) -> None:
+        """Monitor thread: publish a snapshot every period."""
+        period = 1.0 / self.frequency
+        sequence = 0
+        next_time = time.monotonic()
+        
+        while self._running.is_set():
+            try:
+                self._state = self.read(sequence + 1)
+                sequence += 1
+                self._first.set()
+            except Exception as e:
+                self.errors += 1
+                self.hot_log.error("Failed to read robot state: %s", e)
+            
+            next_time += period
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind, do not try to catch up with a burst of reads
+                next_time = time.monotonic()
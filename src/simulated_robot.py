@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+"""
+Simulated Robot Backend
+
+An in-process stand-in for the RTDE control and receive interfaces that
+moves a kinematic model of the configured arm on a clock, so command files
+and recorded logs run without URSim or a robot:
+    
+    robot = SimulatedRobot.from_config(config, clock=VirtualClock())
+    controller = URRobotController(config_path, backend=robot)
+    controller.connect()
+
+(or set ``robot.type: "simulated"`` in the config). With a ``VirtualClock``
+every wait returns immediately while simulated time advances, so a whole
+job finishes in a fraction of its real duration; with a ``DilatedClock``
+it runs at a fixed multiple of real time.
+
+Motions follow the commands the controller uses:
+
+- moveL (single poses, async, and paths): rest-to-rest trapezoidal
+  segments along the straight line, position and orientation synchronized.
+  The path is converted to joint space with the model's analytic IK, and
+  each segment is slowed down until no joint exceeds the joint velocity
+  and acceleration limits. An unreachable path is rejected like the robot
+  does. Blends are not modelled.
+- moveJ: synchronized trapezoidal joint motion at the commanded leading
+  axis speed, capped by the joint limits
+- speedL: the TCP velocity ramps to the target at the given acceleration,
+  holds for the given time and ramps back down
+- stopL/stopJ: ramp the current velocity down at the given deceleration
+- servoL/servoJ: jump to the target
+
+Without a known robot model (see ``kinematics.DH_PARAMETERS``) only the
+Cartesian motion is simulated and the joints read as zero.
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from .clock import SystemClock, clock_from_config
+    from .spatial import rotvec_to_matrix, matrix_to_rotvec, compose_rotvecs
+    from .kinematics import URKinematics
+    from .time_parameterization import MotionLimits
+except ImportError:
+    from clock import SystemClock, clock_from_config
+    from spatial import rotvec_to_matrix, matrix_to_rotvec, compose_rotvecs
+    from kinematics import URKinematics
+    from time_parameterization import MotionLimits
+
+DEFAULT_POSE = (0.3, -0.2, 0.4, 0.0, 3.14, 0.0)
+
+# Elbow-up configuration used to pick the IK branch of the initial pose
+HOME_JOINTS = (0.0, -1.57, 1.57, -1.57, -1.57, 0.0)
+
+# Robot mode RUNNING and safety mode NORMAL, as reported by the receive interface
+ROBOT_MODE_RUNNING = 7
+SAFETY_MODE_NORMAL = 1
+
+# Step for velocities taken by finite differences (seconds)
+_DIFF_STEP = 1e-3
+
+
+class _Motion:
+    """One commanded motion, evaluated at any time since its start."""
+    
+    target: Optional[np.ndarray] = None
+    
+    def __init__(self, start: float, seed: np.ndarray, kinematics: Optional[URKinematics]):
+        self.start = start
+        self.end = start
+        self.seed = seed
+        self.kinematics = kinematics
+    
+    def pose(self, t: float) -> np.ndarray:
+        raise NotImplementedError
+    
+    def velocity(self, t: float) -> np.ndarray:
+        """TCP velocity [vx, vy, vz, wx, wy, wz] (base frame), by finite differences."""
+        p1, p0 = self.pose(t), self.pose(t - _DIFF_STEP)
+        return np.concatenate([p1[:3] - p0[:3], compose_rotvecs(p1[3:], -p0[3:])]) / _DIFF_STEP
+    
+    def joints(self, t: float) -> np.ndarray:
+        """Joint angles, from IK nearest to the joints at the start of the motion."""
+        if self.kinematics is None:
+            return self.seed
+        joints, ok = self.kinematics.inverse_nearest(self.pose(t), self.seed)
+        return joints if ok else self.seed
+    
+    def joint_velocity(self, t: float) -> np.ndarray:
+        if self.end <= self.start or t >= self.end:
+            return np.zeros(6)
+        return (self.joints(t) - self.joints(t - _DIFF_STEP)) / _DIFF_STEP
+
+
+class _Hold(_Motion):
+    """Robot at rest on a pose."""
+    
+    def __init__(self, pose: np.ndarray, joints: np.ndarray, start: float):
+        super().__init__(start, joints, None)
+        self.target = pose
+    
+    def pose(self, t: float) -> np.ndarray:
+        return self.target
+    
+    def velocity(self, t: float) -> np.ndarray:
+        return np.zeros(6)
+    
+    def joints(self, t: float) -> np.ndarray:
+        return self.seed
+
+
+class _Segments(_Motion):
+    """Rest-to-rest trapezoidal profiles over the path parameter s in [0, 1], run one after another."""
+    
+    def _time_segments(self, v: np.ndarray, a: np.ndarray) -> None:
+        """Set the timing from per-segment limits on ds/dt and d²s/dt² (infinite = no motion)."""
+        moving = np.isfinite(v)
+        v = np.where(moving, v, 1.0)
+        a = np.where(moving, a, 1.0)
+        self.ramp = np.where(v * v / a <= 1.0, v / a, np.sqrt(1.0 / a))
+        self.peak = a * self.ramp
+        self.acceleration = a
+        self.durations = np.where(moving, 2.0 * self.ramp + (1.0 - a * self.ramp ** 2) / self.peak, 0.0)
+        self.starts = self.start + np.concatenate([[0.0], np.cumsum(self.durations)[:-1]])
+        self.end = self.start + float(self.durations.sum())
+    
+    def _segment(self, t: float) -> Tuple[int, float, float]:
+        """Active segment, its path parameter s and ds/dt at time t."""
+        i = int(np.clip(np.searchsorted(self.starts, t, side='right') - 1, 0, len(self.starts) - 1))
+        duration = self.durations[i]
+        tau = t - self.starts[i]
+        if duration == 0.0 or tau >= duration:
+            return i, 1.0, 0.0
+        if tau <= 0.0:
+            return i, 0.0, 0.0
+        a, ramp, peak = self.acceleration[i], self.ramp[i], self.peak[i]
+        if tau < ramp:
+            return i, 0.5 * a * tau * tau, a * tau
+        if tau < duration - ramp:
+            return i, 0.5 * a * ramp * ramp + peak * (tau - ramp), peak
+        remaining = duration - tau
+        return i, 1.0 - 0.5 * a * remaining * remaining, a * remaining
+
+
+class _LinearMove(_Segments):
+    """Straight-line segments through a list of poses, limited in Cartesian and joint space."""
+    
+    def __init__(self, start_pose: np.ndarray, start_joints: np.ndarray, targets: np.ndarray,
+                 speeds: np.ndarray, accelerations: np.ndarray, start: float, limits: MotionLimits,
+                 kinematics: Optional[URKinematics], resolution: float):
+        super().__init__(start, start_joints, kinematics)
+        poses = np.vstack([start_pose, targets])
+        self.p0 = poses[:-1, :3]
+        self.translation = poses[1:, :3] - poses[:-1, :3]
+        self.r0 = rotvec_to_matrix(poses[:-1, 3:])
+        self.relative = matrix_to_rotvec(np.swapaxes(self.r0, 1, 2) @ rotvec_to_matrix(poses[1:, 3:]))
+        self.angular = np.einsum('nij,nj->ni', self.r0, self.relative)
+        self.target = poses[-1]
+        
+        # Normalized Cartesian limits on s of every segment
+        length = np.linalg.norm(self.translation, axis=1)
+        angle = np.linalg.norm(self.relative, axis=1)
+        with np.errstate(divide='ignore'):
+            v = np.minimum(speeds / length, limits.angular_velocity / angle)
+            a = np.minimum(accelerations / length, limits.angular_acceleration / angle)
+        
+        self.grids: List[np.ndarray] = []
+        self.path_joints: List[np.ndarray] = []
+        if kinematics is not None:
+            v, a = self._joint_path(length, angle, v, a, limits, resolution)
+        self._time_segments(v, a)
+    
+    def _joint_path(self, length, angle, v, a, limits: MotionLimits, resolution: float):
+        """Solve IK along every segment and tighten the s limits to the joint limits."""
+        counts = np.clip(np.ceil(np.maximum(length, 0.1 * angle) / resolution).astype(int) + 1, 2, 500)
+        grids = [np.linspace(0.0, 1.0, n) for n in counts]
+        segment = np.repeat(np.arange(len(counts)), counts)
+        s = np.concatenate(grids)
+        samples = np.empty((s.shape[0], 6))
+        samples[:, :3] = self.p0[segment] + self.translation[segment] * s[:, None]
+        samples[:, 3:] = matrix_to_rotvec(self.r0[segment] @ rotvec_to_matrix(self.relative[segment] * s[:, None]))
+        
+        joints, ok = self.kinematics.inverse_path(samples, self.seed)
+        if not ok.all():
+            raise ValueError(f"Pose {samples[np.argmin(ok)].round(4).tolist()} on the path is not reachable")
+        
+        bounds = np.cumsum(counts)[:-1]
+        self.grids = grids
+        self.path_joints = np.split(joints, bounds)
+        
+        # Largest joint travel per unit s on each segment sets the joint-limited ds/dt
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = np.array([np.abs(np.diff(q, axis=0) / np.diff(g)[:, None]).max(axis=0)
+                              for q, g in zip(self.path_joints, grids)])
+            v_joint = np.min(limits.joint_velocity / slope, axis=1)
+            a_joint = np.min(limits.joint_acceleration / slope, axis=1)
+        return np.minimum(v, v_joint), np.minimum(a, a_joint)
+    
+    def pose(self, t: float) -> np.ndarray:
+        i, s, _ = self._segment(t)
+        pose = np.empty(6)
+        pose[:3] = self.p0[i] + self.translation[i] * s
+        pose[3:] = matrix_to_rotvec(self.r0[i] @ rotvec_to_matrix(self.relative[i] * s))
+        return pose
+    
+    def velocity(self, t: float) -> np.ndarray:
+        i, _, rate = self._segment(t)
+        return np.concatenate([self.translation[i], self.angular[i]]) * rate
+    
+    def joints(self, t: float) -> np.ndarray:
+        if not self.grids:
+            return self.seed
+        i, s, _ = self._segment(t)
+        grid, q = self.grids[i], self.path_joints[i]
+        return np.array([np.interp(s, grid, q[:, k]) for k in range(6)])
+    
+    def joint_velocity(self, t: float) -> np.ndarray:
+        if not self.grids:
+            return np.zeros(6)
+        i, s, rate = self._segment(t)
+        grid, q = self.grids[i], self.path_joints[i]
+        k = int(np.clip(np.searchsorted(grid, s, side='right') - 1, 0, len(grid) - 2))
+        return (q[k + 1] - q[k]) / (grid[k + 1] - grid[k]) * rate
+
+
+class _JointMove(_Segments):
+    """Synchronized joint-space segments through a list of joint configurations."""
+    
+    def __init__(self, start_joints: np.ndarray, targets: np.ndarray, speeds: np.ndarray,
+                 accelerations: np.ndarray, start: float, limits: MotionLimits, kinematics: URKinematics):
+        super().__init__(start, start_joints, kinematics)
+        q = np.vstack([start_joints, targets])
+        self.q0 = q[:-1]
+        self.travel = q[1:] - q[:-1]
+        distance = np.abs(self.travel)
+        with np.errstate(divide='ignore'):
+            v = np.min(np.minimum(speeds[:, None], limits.joint_velocity) / distance, axis=1)
+            a = np.min(np.minimum(accelerations[:, None], limits.joint_acceleration) / distance, axis=1)
+        self._time_segments(v, a)
+        self.target = kinematics.forward(q[-1])
+    
+    def joints(self, t: float) -> np.ndarray:
+        i, s, _ = self._segment(t)
+        return self.q0[i] + self.travel[i] * s
+    
+    def joint_velocity(self, t: float) -> np.ndarray:
+        i, _, rate = self._segment(t)
+        return self.travel[i] * rate
+    
+    def pose(self, t: float) -> np.ndarray:
+        return self.kinematics.forward(self.joints(t))
+
+
+class _VelocityMove(_Motion):
+    """TCP velocity interpolated linearly between knots and constant after the last one."""
+    
+    def __init__(self, start_pose: np.ndarray, start_joints: np.ndarray, start: float,
+                 times: Sequence[float], velocities: Sequence[Sequence[float]],
+                 kinematics: Optional[URKinematics]):
+        super().__init__(start, start_joints, kinematics)
+        self.p0 = start_pose[:3]
+        self.r0 = rotvec_to_matrix(start_pose[3:])
+        self.times = start + np.asarray(times, dtype=np.float64)
+        self.velocities = np.asarray(velocities, dtype=np.float64)
+        
+        # Displacement accumulated up to every knot (trapezoid rule is exact for linear pieces)
+        steps = np.diff(self.times)[:, None] * 0.5 * (self.velocities[1:] + self.velocities[:-1])
+        self.displacement = np.vstack([np.zeros(6), np.cumsum(steps, axis=0)])
+        self.end = float(self.times[-1]) if not self.velocities[-1].any() else float('inf')
+    
+    def velocity(self, t: float) -> np.ndarray:
+        return np.array([np.interp(t, self.times, self.velocities[:, k]) for k in range(6)])
+    
+    def pose(self, t: float) -> np.ndarray:
+        i = int(np.clip(np.searchsorted(self.times, t, side='right') - 1, 0, len(self.times) - 1))
+        dt = max(t - self.times[i], 0.0)
+        displacement = self.displacement[i] + dt * 0.5 * (self.velocities[i] + self.velocity(t))
+        pose = np.empty(6)
+        pose[:3] = self.p0 + displacement[:3]
+        pose[3:] = matrix_to_rotvec(rotvec_to_matrix(displacement[3:]) @ self.r0)
+        return pose
+
+
+class SimulatedRobot:
+    """
+    Simulated RTDE control and receive interface on a clock.
+    
+    The same object serves as both interfaces; ``connect`` is the backend
+    hook ``URRobotController`` calls instead of opening RTDE connections.
+    ``stats`` counts accepted and rejected motion commands (stops excluded).
+    """
+    
+    def __init__(self, clock: Optional[SystemClock] = None, initial_pose: Optional[Sequence[float]] = None,
+                 limits: Optional[MotionLimits] = None, kinematics: Optional[URKinematics] = None,
+                 initial_joints: Optional[Sequence[float]] = None, path_resolution: float = 0.005):
+        """
+        Initialize the simulated robot.
+        
+        Args:
+            clock: Clock the motions run on (default: a ``VirtualClock``)
+            initial_pose: Starting TCP pose [x, y, z, rx, ry, rz]
+            limits: Cartesian and joint limits; defaults to ``MotionLimits()``
+            kinematics: Arm model for joint-space simulation (None = Cartesian only)
+            initial_joints: Starting joint angles; overrides ``initial_pose`` when
+                kinematics are given
+            path_resolution: Spacing of the IK samples along moveL paths in meters
+        """
+        self.clock = clock or clock_from_config({})
+        self.limits = limits or MotionLimits()
+        self.kinematics = kinematics
+        self.path_resolution = path_resolution
+        self.logger = logging.getLogger('URSimulatedRobot')
+        self.connected = False
+        self.dt = 1.0 / 500.0
+        self.stats: Dict[str, int] = {'commands': 0, 'rejected': 0}
+        self._lock = threading.RLock()
+        self._async = False
+        
+        pose = np.asarray(initial_pose or DEFAULT_POSE, dtype=np.float64)
+        joints = np.zeros(6)
+        if kinematics is not None:
+            if initial_joints is not None:
+                joints = np.asarray(initial_joints, dtype=np.float64)
+                pose = kinematics.forward(joints)
+            else:
+                joints, ok = kinematics.inverse_nearest(pose, HOME_JOINTS)
+                if not ok:
+                    raise ValueError(f"Initial pose {pose.tolist()} is not reachable by a {kinematics.model}")
+        self._motion: _Motion = _Hold(pose, joints, self.clock.monotonic())
+    
+    @classmethod
+    def from_config(cls, config: Dict, clock: Optional[SystemClock] = None) -> 'SimulatedRobot':
+        """
+        Build from a robot config.
+        
+        Uses the arm model and TCP offset from ``robot``, the limits from
+        ``physical.safety`` and the ``simulated_robot`` section (initial
+        pose or joints, path resolution and, unless ``clock`` is given, the
+        clock).
+        """
+        config = config or {}
+        simulated = config.get('simulated_robot', {})
+        robot = config.get('robot', {})
+        try:
+            kinematics = URKinematics(robot.get('model', 'UR5e'), robot.get('tcp_offset'))
+        except ValueError as e:
+            logging.getLogger('URSimulatedRobot').warning(f"Joint-space simulation disabled: {e}")
+            kinematics = None
+        return cls(
+            clock=clock or clock_from_config(simulated),
+            initial_pose=simulated.get('initial_pose'),
+            limits=MotionLimits.from_config(config),
+            kinematics=kinematics,
+            initial_joints=simulated.get('initial_joints'),
+            path_resolution=simulated.get('path_resolution', 0.005),
+        )
+    
+    # ------------------------------------------------------------------
+    # Backend hook
+    # ------------------------------------------------------------------
+    
+    def connect(self, robot_ip: str, frequency: float) -> Tuple['SimulatedRobot', 'SimulatedRobot']:
+        """Return the control and receive interfaces (both this object)."""
+        self.dt = 1.0 / frequency
+        self.connected = True
+        return self, self
+    
+    def reset(self, pose: Sequence[float]) -> None:
+        """Place the robot at rest on ``pose``."""
+        pose = np.asarray(pose, dtype=np.float64)
+        with self._lock:
+            motion, now = self._state()
+            joints = motion.joints(now)
+            if self.kinematics is not None:
+                joints, ok = self.kinematics.inverse_nearest(pose, joints)
+                if not ok:
+                    raise ValueError(f"Pose {pose.tolist()} is not reachable by a {self.kinematics.model}")
+            self._motion = _Hold(pose, joints, now)
+    
+    def _state(self) -> Tuple[_Motion, float]:
+        with self._lock:
+            return self._motion, self.clock.monotonic()
+    
+    def _command(self, build, asynchronous: bool = False, count: bool = True) -> Optional[_Motion]:
+        """Start the motion ``build(current_motion, now)`` returns, or count a rejection."""
+        with self._lock:
+            motion, now = self._state()
+            try:
+                new_motion = build(motion, now)
+            except ValueError as e:
+                self.stats['rejected'] += 1
+                self.logger.error(f"Motion rejected: {e}")
+                return None
+            self._motion = new_motion
+            self._async = asynchronous
+            self.stats['commands'] += count
+            return new_motion
+    
+    def _wait(self, motion: _Motion) -> None:
+        """Sleep on the clock until ``motion`` ends or is replaced."""
+        while self._motion is motion:
+            remaining = motion.end - self.clock.monotonic()
+            if remaining <= 0:
+                return
+            self.clock.sleep(min(remaining, 0.05))
+    
+    @staticmethod
+    def _rows(values, speed: float, acceleration: float) -> np.ndarray:
+        """Single target or path as [target(6), speed, acceleration, blend] rows."""
+        rows = np.asarray(values, dtype=np.float64)
+        if rows.ndim == 1:
+            rows = np.concatenate([rows[:6], [speed, acceleration, 0.0]])[None, :]
+        return rows
+    
+    # ------------------------------------------------------------------
+    # Control interface
+    # ------------------------------------------------------------------
+    
+    def isConnected(self) -> bool:
+        return self.connected
+    
+    def disconnect(self) -> None:
+        self.connected = False
+    
+    def moveL(self, pose, speed: float = 0.25, acceleration: float = 1.2, asynchronous: bool = False) -> bool:
+        """Linear move to a pose, or through a path of [pose, speed, acceleration, blend] rows."""
+        rows = self._rows(pose, speed, acceleration)
+        move = self._command(lambda motion, now: _LinearMove(
+            motion.pose(now), motion.joints(now), rows[:, :6], rows[:, 6], rows[:, 7], now,
+            self.limits, self.kinematics, self.path_resolution), asynchronous)
+        if move is None:
+            return False
+        if not asynchronous:
+            self._wait(move)
+        return True
+    
+    def moveJ(self, q, speed: float = 1.05, acceleration: float = 1.4, asynchronous: bool = False) -> bool:
+        """Joint move to a configuration, or through a path of [q, speed, acceleration, blend] rows."""
+        if self.kinematics is None:
+            self.logger.error("Joint moves need a known robot model")
+            return False
+        rows = self._rows(q, speed, acceleration)
+        move = self._command(lambda motion, now: _JointMove(
+            motion.joints(now), rows[:, :6], rows[:, 6], rows[:, 7], now, self.limits, self.kinematics),
+            asynchronous)
+        if move is None:
+            return False
+        if not asynchronous:
+            self._wait(move)
+        return True
+    
+    def speedL(self, xd, acceleration: float = 0.25, time: float = 0.0) -> bool:
+        """Ramp the TCP velocity to ``xd``, hold it for ``time`` seconds (0 = until the next command) and stop."""
+        xd = np.asarray(xd, dtype=np.float64)
+        
+        def build(motion, now):
+            current = motion.velocity(now)
+            change = xd - current
+            ramp = max(np.linalg.norm(change[:3]), np.linalg.norm(change[3:])) / acceleration
+            times, velocities = [0.0, ramp], [current, xd]
+            if time > 0:
+                hold = max(time, ramp)
+                stop = max(np.linalg.norm(xd[:3]), np.linalg.norm(xd[3:])) / acceleration
+                times += [hold, hold + stop]
+                velocities += [xd, np.zeros(6)]
+            return _VelocityMove(motion.pose(now), motion.joints(now), now, times, velocities, self.kinematics)
+        
+        return self._command(build) is not None
+    
+    def stopL(self, deceleration: float = 10.0, asynchronous: bool = False) -> bool:
+        """Ramp the current TCP velocity down to zero."""
+        def build(motion, now):
+            current = motion.velocity(now)
+            if not current.any():
+                return _Hold(motion.pose(now), motion.joints(now), now)
+            stop = max(np.linalg.norm(current[:3]), np.linalg.norm(current[3:])) / deceleration
+            return _VelocityMove(motion.pose(now), motion.joints(now), now, [0.0, stop],
+                                 [current, np.zeros(6)], self.kinematics)
+        
+        return self._command(build, count=False) is not None
+    
+    stopJ = stopL
+    
+    def servoL(self, pose, speed: float = 0.0, acceleration: float = 0.0, time: float = 0.008,
+               lookahead_time: float = 0.1, gain: float = 300) -> bool:
+        pose = np.asarray(pose, dtype=np.float64)
+        
+        def build(motion, now):
+            joints = motion.joints(now)
+            if self.kinematics is not None:
+                joints, ok = self.kinematics.inverse_nearest(pose, joints)
+                if not ok:
+                    raise ValueError(f"Servo target {pose.round(4).tolist()} is not reachable")
+            return _Hold(pose, joints, now)
+        
+        return self._command(build) is not None
+    
+    def servoJ(self, q, speed: float = 0.0, acceleration: float = 0.0, time: float = 0.008,
+               lookahead_time: float = 0.1, gain: float = 300) -> bool:
+        if self.kinematics is None:
+            self.logger.error("Joint servoing needs a known robot model")
+            return False
+        q = np.asarray(q, dtype=np.float64)
+        return self._command(lambda motion, now: _Hold(self.kinematics.forward(q), q, now)) is not None
+    
+    def servoStop(self, deceleration: float = 10.0) -> bool:
+        return True
+    
+    def initPeriod(self) -> float:
+        return self.clock.monotonic()
+    
+    def waitPeriod(self, t_start: float) -> None:
+        self.clock.sleep_until(t_start + self.dt)
+    
+    def isSteady(self) -> bool:
+        motion, now = self._state()
+        return now >= motion.end and not motion.velocity(now).any()
+    
+    def getAsyncOperationProgress(self) -> int:
+        """Index of the running asynchronous path segment, or -1 when none is running."""
+        motion, now = self._state()
+        if not self._async or now >= motion.end:
+            return -1
+        return int(np.searchsorted(motion.starts, now, side='right') - 1)
+    
+    # ------------------------------------------------------------------
+    # Receive interface
+    # ------------------------------------------------------------------
+    
+    def getActualTCPPose(self) -> List[float]:
+        motion, now = self._state()
+        return motion.pose(now).tolist()
+    
+    def getTargetTCPPose(self) -> List[float]:
+        motion, now = self._state()
+        target = motion.target
+        return (target if target is not None else motion.pose(now)).tolist()
+    
+    def getActualTCPSpeed(self) -> List[float]:
+        motion, now = self._state()
+        return motion.velocity(now).tolist()
+    
+    def getActualQ(self) -> List[float]:
+        motion, now = self._state()
+        return motion.joints(now).tolist()
+    
+    def getActualQd(self) -> List[float]:
+        motion, now = self._state()
+        return motion.joint_velocity(now).tolist()
+    
+    def getRobotMode(self) -> int:
+        return ROBOT_MODE_RUNNING
+    
+    def getSafetyMode(self) -> int:
+        return SAFETY_MODE_NORMAL
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Job Simulation
+
+Runs a JSONL job through ``URCommandProcessor`` on a ``SimulatedRobot``
+with a ``VirtualClock``: the processor, controller and safety checks are
+the ones used on the robot, but every move and sleep completes as soon as
+it is computed, so a job that takes minutes on the arm finishes in a
+fraction of a second.
+
+``simulate_job`` builds everything it needs from a file path and returns
+a plain dict, so it can be handed to a ``ProcessPoolExecutor`` to validate
+many jobs in parallel:
+    
+    with ProcessPoolExecutor() as pool:
+        results = list(pool.map(simulate_job, job_files, repeat(config_path)))
+"""
+
+import time
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+try:
+    from .clock import VirtualClock
+    from .cycle_time import load_job, JOB_POSE
+    from .simulated_robot import SimulatedRobot
+    from .ur_controller import URRobotController, URCommandProcessor
+except ImportError:
+    from clock import VirtualClock
+    from cycle_time import load_job, JOB_POSE
+    from simulated_robot import SimulatedRobot
+    from ur_controller import URRobotController, URCommandProcessor
+
+logger = logging.getLogger('URSimulation')
+
+
+def simulate_job(job_file: Union[str, Path], config_path: Optional[str] = None,
+                 responsiveness: Optional[float] = None,
+                 start_pose: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+    """
+    Run one job on a simulated robot in virtual time.
+    
+    Pose jobs run with ``process_synchronous_poses`` and, unless
+    ``start_pose`` is given, start at their first pose (as
+    ``CycleTimeEstimator`` assumes). Delta jobs run with
+    ``process_synchronous_commands`` from ``start_pose`` or the configured
+    ``simulated_robot`` start.
+    
+    Args:
+        job_file: Path to JSONL job
+        config_path: Path to the robot configuration file
+        responsiveness: Time between commands in seconds, defaults to
+            movement.responsiveness
+        start_pose: TCP pose the robot starts from
+    
+    Returns:
+        Dict with the job, its type, the number of commands and motions run,
+        rejected motions, ``ok`` (every command executed and none rejected),
+        simulated and wall time in seconds, the final TCP pose and an error
+        message (None on success)
+    """
+    wall_start = time.perf_counter()
+    result: Dict[str, Any] = {
+        'job': str(job_file), 'type': None, 'commands': 0, 'executed': 0, 'rejected': 0,
+        'ok': False, 'simulated_time': 0.0, 'wall_time': 0.0, 'final_pose': None, 'error': None,
+    }
+    
+    try:
+        config = {}
+        if config_path and yaml:
+            with open(config_path, 'r') as f:
+                config = yaml.safe_load(f) or {}
+        
+        kind, commands = load_job(job_file)
+        result['type'] = kind
+        result['commands'] = int(commands.shape[0])
+        if responsiveness is None:
+            responsiveness = config.get('movement', {}).get('responsiveness', 1.0)
+        
+        robot = SimulatedRobot.from_config(config, clock=VirtualClock())
+        if start_pose is not None:
+            robot.reset(start_pose)
+        elif kind == JOB_POSE and commands.shape[0]:
+            robot.reset(commands[0])
+        
+        controller = URRobotController(config_path=config_path, backend=robot)
+        if not controller.connect():
+            result['error'] = "Failed to connect to the simulated robot"
+            return result
+        
+        start = robot.clock.monotonic()
+        try:
+            processor = URCommandProcessor(controller)
+            if kind == JOB_POSE:
+                processor.process_synchronous_poses(str(job_file), responsiveness=responsiveness)
+            else:
+                processor.process_synchronous_commands(str(job_file), responsiveness=responsiveness)
+            result['simulated_time'] = robot.clock.monotonic() - start
+            result['final_pose'] = robot.getActualTCPPose()
+        finally:
+            controller.disconnect()
+        
+        result['executed'] = robot.stats['commands']
+        result['rejected'] = robot.stats['rejected']
+        result['ok'] = result['rejected'] == 0 and result['executed'] >= result['commands']
+        if not result['ok']:
+            result['error'] = (f"{result['rejected']} motions rejected, "
+                               f"{result['executed']}/{result['commands']} commands executed")
+    
+    except (OSError, ValueError) as e:
+        result['error'] = str(e)
+        logger.error(f"Simulation of {job_file} failed: {e}")
+    finally:
+        result['wall_time'] = time.perf_counter() - wall_start
+    
+    return result
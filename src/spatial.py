@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+SO(3)/SE(3) Math
+
+Vectorized conversions between axis-angle rotation vectors (the UR pose
+convention), unit quaternions and rotation matrices, plus proper pose
+composition. Every function accepts a single value or a batch with the
+rotation/pose dimension last, e.g. (3,) or (N, 3) rotation vectors and
+(6,) or (N, 6) poses.
+
+Quaternions are stored scalar-first as [w, x, y, z].
+"""
+
+from typing import Sequence, Union
+
+import numpy as np
+
+
+ArrayLike = Union[Sequence[float], Sequence[Sequence[float]], np.ndarray]
+
+
+def _as_batch(values: ArrayLike, width: int):
+    """Return (values as (N, width) float64 array, whether input was a single item)."""
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.shape[-1] != width:
+        raise ValueError(f"Expected trailing dimension {width}, got shape {arr.shape}")
+    single = arr.ndim == 1
+    return arr.reshape(-1, width), single
+
+
+def _as_matrix_batch(matrices: ArrayLike, size: int):
+    """Return (matrices as (N, size, size) float64 array, whether input was a single matrix)."""
+    arr = np.asarray(matrices, dtype=np.float64)
+    if arr.shape[-2:] != (size, size):
+        raise ValueError(f"Expected trailing dimensions ({size}, {size}), got shape {arr.shape}")
+    single = arr.ndim == 2
+    return arr.reshape(-1, size, size), single
+
+
+def _unbatch(arr: np.ndarray, single: bool) -> np.ndarray:
+    return arr[0] if single else arr
+
+
+# ----------------------------------------------------------------------
+# Rotation conversions
+# ----------------------------------------------------------------------
+
+def rotvec_to_matrix(rotvecs: ArrayLike) -> np.ndarray:
+    """
+    Convert rotation vectors to rotation matrices (Rodrigues' formula).
+    
+    Args:
+        rotvecs: (3,) or (N, 3) axis-angle rotation vectors
+    
+    Returns:
+        (3, 3) or (N, 3, 3) rotation matrices
+    """
+    r, single = _as_batch(rotvecs, 3)
+    theta_sq = np.einsum('ij,ij->i', r, r)
+    theta = np.sqrt(theta_sq)
+    small = theta < 1e-6
+    safe = np.where(small, 1.0, theta)
+    # Taylor expansions keep the Rodrigues coefficients stable near zero
+    a = np.where(small, 1.0 - theta_sq / 6.0, np.sin(safe) / safe)
+    b = np.where(small, 0.5 - theta_sq / 24.0, (1.0 - np.cos(safe)) / (safe * safe))
+    
+    k = _skew(r)
+    eye = np.broadcast_to(np.eye(3), k.shape)
+    return _unbatch(eye + a[:, None, None] * k + b[:, None, None] * (k @ k), single)
+
+
+def matrix_to_rotvec(matrices: ArrayLike) -> np.ndarray:
+    """
+    Convert rotation matrices to rotation vectors with angles in [0, pi].
+    
+    Args:
+        matrices: (3, 3) or (N, 3, 3) rotation matrices
+    
+    Returns:
+        (3,) or (N, 3) axis-angle rotation vectors
+    """
+    m, single = _as_matrix_batch(matrices, 3)
+    return _unbatch(_quaternion_to_rotvec(_matrix_to_quaternion(m)), single)
+
+
+def rotvec_to_quaternion(rotvecs: ArrayLike) -> np.ndarray:
+    """
+    Convert rotation vectors to unit quaternions.
+    
+    Args:
+        rotvecs: (3,) or (N, 3) axis-angle rotation vectors
+    
+    Returns:
+        (4,) or (N, 4) quaternions [w, x, y, z]
+    """
+    r, single = _as_batch(rotvecs, 3)
+    theta_sq = np.einsum('ij,ij->i', r, r)
+    theta = np.sqrt(theta_sq)
+    small = theta < 1e-6
+    safe = np.where(small, 1.0, theta)
+    half_sinc = np.where(small, 0.5 - theta_sq / 48.0, np.sin(0.5 * safe) / safe)
+    
+    quat = np.empty((r.shape[0], 4))
+    quat[:, 0] = np.cos(0.5 * theta)
+    quat[:, 1:] = r * half_sinc[:, None]
+    return _unbatch(quat, single)
+
+
+def quaternion_to_rotvec(quaternions: ArrayLike) -> np.ndarray:
+    """
+    Convert quaternions to rotation vectors with angles in [0, pi].
+    
+    Args:
+        quaternions: (4,) or (N, 4) quaternions [w, x, y, z]; normalized internally
+    
+    Returns:
+        (3,) or (N, 3) axis-angle rotation vectors
+    """
+    q, single = _as_batch(quaternions, 4)
+    return _unbatch(_quaternion_to_rotvec(q), single)
+
+
+def matrix_to_quaternion(matrices: ArrayLike) -> np.ndarray:
+    """
+    Convert rotation matrices to unit quaternions with non-negative scalar part.
+    
+    Args:
+        matrices: (3, 3) or (N, 3, 3) rotation matrices
+    
+    Returns:
+        (4,) or (N, 4) quaternions [w, x, y, z]
+    """
+    m, single = _as_matrix_batch(matrices, 3)
+    return _unbatch(_matrix_to_quaternion(m), single)
+
+
+def quaternion_to_matrix(quaternions: ArrayLike) -> np.ndarray:
+    """
+    Convert quaternions to rotation matrices.
+    
+    Args:
+        quaternions: (4,) or (N, 4) quaternions [w, x, y, z]; normalized internally
+    
+    Returns:
+        (3, 3) or (N, 3, 3) rotation matrices
+    """
+    q, single = _as_batch(quaternions, 4)
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    w, x, y, z = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+    
+    m = np.empty((q.shape[0], 3, 3))
+    m[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    m[:, 0, 1] = 2.0 * (x * y - w * z)
+    m[:, 0, 2] = 2.0 * (x * z + w * y)
+    m[:, 1, 0] = 2.0 * (x * y + w * z)
+    m[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    m[:, 1, 2] = 2.0 * (y * z - w * x)
+    m[:, 2, 0] = 2.0 * (x * z - w * y)
+    m[:, 2, 1] = 2.0 * (y * z + w * x)
+    m[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return _unbatch(m, single)
+
+
+# ----------------------------------------------------------------------
+# Rotation composition
+# ----------------------------------------------------------------------
+
+def quaternion_multiply(q1: ArrayLike, q2: ArrayLike) -> np.ndarray:
+    """
+    Hamilton product q1 * q2 (apply q2 first, then q1). Inputs broadcast.
+    
+    Args:
+        q1: (4,) or (N, 4) quaternions [w, x, y, z]
+        q2: (4,) or (N, 4) quaternions [w, x, y, z]
+    
+    Returns:
+        (4,) or (N, 4) product quaternions
+    """
+    a = np.asarray(q1, dtype=np.float64)
+    b = np.asarray(q2, dtype=np.float64)
+    w1, x1, y1, z1 = np.moveaxis(a, -1, 0)
+    w2, x2, y2, z2 = np.moveaxis(b, -1, 0)
+    return np.stack([
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+    ], axis=-1)
+
+
+def quaternion_conjugate(quaternions: ArrayLike) -> np.ndarray:
+    """Return the conjugate (inverse for unit quaternions) of (4,) or (N, 4) quaternions."""
+    q = np.array(quaternions, dtype=np.float64)
+    q[..., 1:] *= -1.0
+    return q
+
+
+def compose_rotvecs(first: ArrayLike, second: ArrayLike) -> np.ndarray:
+    """
+    Compose rotations given as rotation vectors: R(result) = R(first) @ R(second).
+    
+    Args:
+        first: (3,) or (N, 3) rotation vectors
+        second: (3,) or (N, 3) rotation vectors; broadcasts against ``first``
+    
+    Returns:
+        (3,) or (N, 3) rotation vectors of the composed rotations
+    """
+    q = quaternion_multiply(rotvec_to_quaternion(first), rotvec_to_quaternion(second))
+    return quaternion_to_rotvec(q)
+
+
+def cumulative_quaternion_product(quaternions: ArrayLike) -> np.ndarray:
+    """
+    Running left products: out[i] = q[i] * q[i-1] * ... * q[0].
+    
+    Uses a log-step parallel scan, so a sequence of N rotations is
+    integrated in O(log N) vectorized passes instead of a Python loop.
+    
+    Args:
+        quaternions: (N, 4) quaternions [w, x, y, z]
+    
+    Returns:
+        (N, 4) cumulative products
+    """
+    out = np.array(quaternions, dtype=np.float64).reshape(-1, 4)
+    step = 1
+    while step < out.shape[0]:
+        out[step:] = quaternion_multiply(out[step:], out[:-step])
+        # Renormalize to stop rounding error compounding across passes
+        out[step:] /= np.linalg.norm(out[step:], axis=-1, keepdims=True)
+        step *= 2
+    return out
+
+
+# ----------------------------------------------------------------------
+# Poses
+# ----------------------------------------------------------------------
+
+def pose_to_matrix(poses: ArrayLike) -> np.ndarray:
+    """
+    Convert [x, y, z, rx, ry, rz] poses to 4x4 homogeneous transforms.
+    
+    Args:
+        poses: (6,) or (N, 6) poses
+    
+    Returns:
+        (4, 4) or (N, 4, 4) transforms
+    """
+    p, single = _as_batch(poses, 6)
+    t = np.zeros((p.shape[0], 4, 4))
+    t[:, :3, :3] = rotvec_to_matrix(p[:, 3:])
+    t[:, :3, 3] = p[:, :3]
+    t[:, 3, 3] = 1.0
+    return _unbatch(t, single)
+
+
+def matrix_to_pose(matrices: ArrayLike) -> np.ndarray:
+    """
+    Convert 4x4 homogeneous transforms to [x, y, z, rx, ry, rz] poses.
+    
+    Args:
+        matrices: (4, 4) or (N, 4, 4) transforms
+    
+    Returns:
+        (6,) or (N, 6) poses
+    """
+    t, single = _as_matrix_batch(matrices, 4)
+    p = np.empty((t.shape[0], 6))
+    p[:, :3] = t[:, :3, 3]
+    p[:, 3:] = matrix_to_rotvec(t[:, :3, :3])
+    return _unbatch(p, single)
+
+
+def pose_trans(frame: ArrayLike, pose: ArrayLike) -> np.ndarray:
+    """
+    Compose poses like URScript ``pose_trans``: ``pose`` expressed in ``frame``.
+    
+    Args:
+        frame: (6,) or (N, 6) poses
+        pose: (6,) or (N, 6) poses; broadcasts against ``frame``
+    
+    Returns:
+        (6,) or (N, 6) composed poses
+    """
+    f = np.asarray(frame, dtype=np.float64)
+    p = np.asarray(pose, dtype=np.float64)
+    single = f.ndim == 1 and p.ndim == 1
+    f, p = np.broadcast_arrays(f.reshape(-1, 6), p.reshape(-1, 6))
+    
+    out = np.empty(f.shape)
+    rotation = rotvec_to_matrix(f[:, 3:])
+    out[:, :3] = np.einsum('nij,nj->ni', rotation, p[:, :3]) + f[:, :3]
+    out[:, 3:] = compose_rotvecs(f[:, 3:], p[:, 3:])
+    return _unbatch(out, single)
+
+
+def pose_inv(poses: ArrayLike) -> np.ndarray:
+    """
+    Invert poses like URScript ``pose_inv``.
+    
+    Args:
+        poses: (6,) or (N, 6) poses
+    
+    Returns:
+        (6,) or (N, 6) inverse poses
+    """
+    p, single = _as_batch(poses, 6)
+    out = np.empty_like(p)
+    out[:, 3:] = -p[:, 3:]
+    rotation_t = np.swapaxes(rotvec_to_matrix(p[:, 3:]), 1, 2)
+    out[:, :3] = -np.einsum('nij,nj->ni', rotation_t, p[:, :3])
+    return _unbatch(out, single)
+
+
+def apply_delta(pose: ArrayLike, delta: ArrayLike) -> np.ndarray:
+    """
+    Apply a base-frame delta [dx, dy, dz, drx, dry, drz] to a pose.
+    
+    The translation is added and the rotation vector delta is composed on
+    the left, i.e. the tool is rotated about base-frame axes. This matches
+    how ``speedL`` integrates a constant angular velocity.
+    
+    Args:
+        pose: (6,) or (N, 6) poses
+        delta: (6,) or (N, 6) deltas; broadcasts against ``pose``
+    
+    Returns:
+        (6,) or (N, 6) resulting poses
+    """
+    p = np.asarray(pose, dtype=np.float64)
+    d = np.asarray(delta, dtype=np.float64)
+    single = p.ndim == 1 and d.ndim == 1
+    p, d = np.broadcast_arrays(p.reshape(-1, 6), d.reshape(-1, 6))
+    
+    out = np.empty(p.shape)
+    out[:, :3] = p[:, :3] + d[:, :3]
+    out[:, 3:] = compose_rotvecs(d[:, 3:], p[:, 3:])
+    return _unbatch(out, single)
+
+
+def integrate_deltas(start_pose: ArrayLike, deltas: ArrayLike) -> np.ndarray:
+    """
+    Apply a whole sequence of base-frame deltas in one vectorized call.
+    
+    Args:
+        start_pose: (6,) pose the sequence starts from
+        deltas: (N, 6) deltas [dx, dy, dz, drx, dry, drz], applied in order
+    
+    Returns:
+        (N, 6) pose reached after each delta
+    """
+    start = np.asarray(start_pose, dtype=np.float64).reshape(6)
+    d = np.asarray(deltas, dtype=np.float64).reshape(-1, 6)
+    
+    out = np.empty_like(d)
+    out[:, :3] = start[:3] + np.cumsum(d[:, :3], axis=0)
+    cumulative = cumulative_quaternion_product(rotvec_to_quaternion(d[:, 3:]))
+    out[:, 3:] = quaternion_to_rotvec(quaternion_multiply(cumulative, rotvec_to_quaternion(start[3:])))
+    return out
+
+
+# ----------------------------------------------------------------------
+# Internal helpers (already batched)
+# ----------------------------------------------------------------------
+
+def _skew(r: np.ndarray) -> np.ndarray:
+    """(N, 3) vectors to (N, 3, 3) cross-product matrices."""
+    x, y, z = r[:, 0], r[:, 1], r[:, 2]
+    zero = np.zeros_like(x)
+    return np.stack([
+        np.stack([zero, -z, y], axis=-1),
+        np.stack([z, zero, -x], axis=-1),
+        np.stack([-y, x, zero], axis=-1),
+    ], axis=-2)
+
+
+def _matrix_to_quaternion(m: np.ndarray) -> np.ndarray:
+    """(N, 3, 3) matrices to (N, 4) quaternions using Shepperd's method."""
+    trace = m[:, 0, 0] + m[:, 1, 1] + m[:, 2, 2]
+    
+    # Pick the numerically largest quaternion component for each matrix
+    candidates = np.stack([trace, m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]], axis=-1)
+    choice = np.argmax(candidates, axis=-1)
+    quat = np.empty((m.shape[0], 4))
+    
+    sel = choice == 0
+    s = np.sqrt(1.0 + trace[sel]) * 2.0
+    quat[sel] = np.stack([
+        0.25 * s,
+        (m[sel, 2, 1] - m[sel, 1, 2]) / s,
+        (m[sel, 0, 2] - m[sel, 2, 0]) / s,
+        (m[sel, 1, 0] - m[sel, 0, 1]) / s,
+    ], axis=-1)
+    
+    sel = choice == 1
+    s = np.sqrt(1.0 + m[sel, 0, 0] - m[sel, 1, 1] - m[sel, 2, 2]) * 2.0
+    quat[sel] = np.stack([
+        (m[sel, 2, 1] - m[sel, 1, 2]) / s,
+        0.25 * s,
+        (m[sel, 0, 1] + m[sel, 1, 0]) / s,
+        (m[sel, 0, 2] + m[sel, 2, 0]) / s,
+    ], axis=-1)
+    
+    sel = choice == 2
+    s = np.sqrt(1.0 + m[sel, 1, 1] - m[sel, 0, 0] - m[sel, 2, 2]) * 2.0
+    quat[sel] = np.stack([
+        (m[sel, 0, 2] - m[sel, 2, 0]) / s,
+        (m[sel, 0, 1] + m[sel, 1, 0]) / s,
+        0.25 * s,
+        (m[sel, 1, 2] + m[sel, 2, 1]) / s,
+    ], axis=-1)
+    
+    sel = choice == 3
+    s = np.sqrt(1.0 + m[sel, 2, 2] - m[sel, 0, 0] - m[sel, 1, 1]) * 2.0
+    quat[sel] = np.stack([
+        (m[sel, 1, 0] - m[sel, 0, 1]) / s,
+        (m[sel, 0, 2] + m[sel, 2, 0]) / s,
+        (m[sel, 1, 2] + m[sel, 2, 1]) / s,
+        0.25 * s,
+    ], axis=-1)
+    
+    quat[quat[:, 0] < 0] *= -1.0
+    return quat
+
+
+def _quaternion_to_rotvec(q: np.ndarray) -> np.ndarray:
+    """(N, 4) quaternions to (N, 3) rotation vectors with angles in [0, pi]."""
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    # q and -q are the same rotation; take the short way round
+    q = np.where(q[:, :1] < 0, -q, q)
+    w = q[:, 0]
+    v = q[:, 1:]
+    norm_v = np.linalg.norm(v, axis=-1)
+    small = norm_v < 1e-12
+    angle = 2.0 * np.arctan2(norm_v, w)
+    scale = np.where(small, 2.0 / np.where(w == 0, 1.0, w), angle / np.where(small, 1.0, norm_v))
+    return v * scale[:, None]
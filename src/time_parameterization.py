@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+"""
+Time Parameterization
+
+Turns waypoint lists into time-stamped trajectories that respect velocity,
+acceleration and jerk limits, ready to be streamed with servo commands.
+
+- Cartesian waypoints: rest-to-rest trapezoidal or S-curve (jerk-limited)
+  segments, with all axes synchronized on a shared path parameter and each
+  segment running at whichever limit binds first.
+- Joint waypoints: TOPP-style time-optimal parameterization of a smooth
+  spline through the waypoints under per-joint velocity and acceleration
+  limits, without stopping at intermediate waypoints.
+
+Joint trajectories are returned as ``Trajectory`` objects whose rows are
+joint angles rather than TCP poses; the pose-specific methods such as
+``transform`` and ``resample`` do not apply to them.
+"""
+
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+
+try:
+    from .trajectory import Trajectory
+    from .spatial import rotvec_to_matrix, matrix_to_rotvec
+except ImportError:
+    from trajectory import Trajectory
+    from spatial import rotvec_to_matrix, matrix_to_rotvec
+
+
+PROFILES = ('trapezoidal', 'scurve')
+
+
+class MotionLimits:
+    """Velocity, acceleration and jerk limits used for time parameterization."""
+    
+    def __init__(self, linear_velocity: float = 0.5, linear_acceleration: float = 1.0,
+                 angular_velocity: float = 1.0, angular_acceleration: float = 2.0,
+                 linear_jerk: float = 5.0, angular_jerk: float = 10.0,
+                 axis_velocity: Optional[Sequence[float]] = None,
+                 axis_acceleration: Optional[Sequence[float]] = None,
+                 joint_velocity: Optional[Sequence[float]] = None,
+                 joint_acceleration: Optional[Sequence[float]] = None):
+        """
+        Initialize motion limits.
+        
+        Args:
+            linear_velocity: Maximum TCP speed in m/s
+            linear_acceleration: Maximum TCP acceleration in m/s²
+            angular_velocity: Maximum TCP angular speed in rad/s
+            angular_acceleration: Maximum TCP angular acceleration in rad/s²
+            linear_jerk: Maximum TCP jerk in m/s³ (S-curve profiles only)
+            angular_jerk: Maximum TCP angular jerk in rad/s³ (S-curve profiles only)
+            axis_velocity: Optional per-axis [vx, vy, vz, wx, wy, wz] limits
+            axis_acceleration: Optional per-axis acceleration limits
+            joint_velocity: Per-joint velocity limits in rad/s
+            joint_acceleration: Per-joint acceleration limits in rad/s²
+        """
+        self.linear_velocity = float(linear_velocity)
+        self.linear_acceleration = float(linear_acceleration)
+        self.angular_velocity = float(angular_velocity)
+        self.angular_acceleration = float(angular_acceleration)
+        self.linear_jerk = float(linear_jerk)
+        self.angular_jerk = float(angular_jerk)
+        self.axis_velocity = np.full(6, np.inf) if axis_velocity is None else np.asarray(axis_velocity, dtype=np.float64)
+        self.axis_acceleration = (np.full(6, np.inf) if axis_acceleration is None
+                                  else np.asarray(axis_acceleration, dtype=np.float64))
+        self.joint_velocity = np.full(6, 1.05) if joint_velocity is None else np.asarray(joint_velocity, dtype=np.float64)
+        self.joint_acceleration = (np.full(6, 1.4) if joint_acceleration is None
+                                   else np.asarray(joint_acceleration, dtype=np.float64))
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> 'MotionLimits':
+        """Build limits from the ``physical.safety`` section of a robot config."""
+        safety = (config or {}).get('physical', {}).get('safety', {})
+        return cls(
+            linear_velocity=safety.get('max_velocity', 0.5),
+            linear_acceleration=safety.get('max_acceleration', 1.0),
+            angular_velocity=safety.get('max_angular_velocity', 1.0),
+            angular_acceleration=safety.get('max_angular_acceleration', 2.0),
+            linear_jerk=safety.get('max_jerk', 5.0),
+            angular_jerk=safety.get('max_angular_jerk', 10.0),
+            axis_velocity=safety.get('max_axis_velocity'),
+            axis_acceleration=safety.get('max_axis_acceleration'),
+            joint_velocity=safety.get('max_joint_velocity'),
+            joint_acceleration=safety.get('max_joint_acceleration'),
+        )
+
+
+# ----------------------------------------------------------------------
+# 1-D rest-to-rest profiles (vectorized over segments)
+# ----------------------------------------------------------------------
+
+def trapezoidal_duration(distance: np.ndarray, velocity: np.ndarray,
+                         acceleration: np.ndarray) -> np.ndarray:
+    """
+    Rest-to-rest duration of a trapezoidal velocity profile.
+    
+    Args:
+        distance: Distances to travel (any shape, non-negative)
+        velocity: Velocity limits, broadcast against ``distance``
+        acceleration: Acceleration limits, broadcast against ``distance``
+    
+    Returns:
+        Durations in seconds. Moves too short to reach ``velocity`` use a
+        triangular profile.
+    """
+    d, v, a = np.broadcast_arrays(np.asarray(distance, dtype=np.float64),
+                                  np.asarray(velocity, dtype=np.float64),
+                                  np.asarray(acceleration, dtype=np.float64))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cruise = d / v + v / a
+        triangle = 2.0 * np.sqrt(d / a)
+        t = np.where(d >= v * v / a, cruise, triangle)
+    return np.where(d > 0, t, 0.0)
+
+
+def scurve_duration(distance: np.ndarray, velocity: np.ndarray, acceleration: np.ndarray,
+                    jerk: np.ndarray) -> np.ndarray:
+    """
+    Rest-to-rest duration of a jerk-limited (7-phase S-curve) profile.
+    
+    Args:
+        distance: Distances to travel (any shape, non-negative)
+        velocity: Velocity limits, broadcast against ``distance``
+        acceleration: Acceleration limits, broadcast against ``distance``
+        jerk: Jerk limits, broadcast against ``distance``
+    
+    Returns:
+        Durations in seconds
+    """
+    phases = _scurve_phases(distance, velocity, acceleration, jerk)
+    return phases[..., 0]
+
+
+def _scurve_phases(distance, velocity, acceleration, jerk) -> np.ndarray:
+    """
+    Return (..., 4) arrays of [total time, jerk time, acceleration time, cruise time].
+    
+    The acceleration phase lasts ``acceleration time`` and includes two jerk
+    ramps of ``jerk time`` each; deceleration mirrors it.
+    """
+    d, v, a, j = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64)
+                                       for x in (distance, velocity, acceleration, jerk)))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Reduce the peak acceleration when the velocity limit is reached first
+        a = np.where(v * j < a * a, np.sqrt(v * j), a)
+        ta = v / a + a / j
+        full = d >= v * ta
+        
+        # Peak velocity for short moves, first with the acceleration plateau...
+        v_plateau = 0.5 * (-a * a / j + np.sqrt((a * a / j) ** 2 + 4.0 * d * a))
+        # ...and for very short moves without it
+        v_ramp = np.cbrt((d * np.sqrt(j) / 2.0) ** 2)
+        v_peak = np.where(full, v, np.where(v_plateau >= a * a / j, v_plateau, v_ramp))
+        
+        a_peak = np.where(v_peak * j < a * a, np.sqrt(v_peak * j), a)
+        tj = a_peak / j
+        ta = v_peak / a_peak + tj
+        tv = np.where(full, (d - v * ta) / v, 0.0)
+        total = 2.0 * ta + tv
+    
+    zero = ~(d > 0)
+    out = np.stack([total, tj, ta, tv], axis=-1)
+    out[zero] = 0.0
+    return out
+
+
+def _profile_intervals(profile: str, distance: np.ndarray, velocity: np.ndarray,
+                       acceleration: np.ndarray, jerk: np.ndarray):
+    """
+    Describe each rest-to-rest profile as 7 intervals of linear acceleration.
+    
+    Returns:
+        Tuple of (S,) durations and (S, 7) interval lengths, start and end accelerations
+    """
+    n = distance.shape[0]
+    lengths = np.zeros((n, 7))
+    a_start = np.zeros((n, 7))
+    a_end = np.zeros((n, 7))
+    
+    if profile == 'trapezoidal':
+        total = trapezoidal_duration(distance, velocity, acceleration)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            v_peak = np.where(distance >= velocity * velocity / acceleration,
+                              velocity, np.sqrt(distance * acceleration))
+            ta = np.where(distance > 0, v_peak / acceleration, 0.0)
+        lengths[:, 1] = ta
+        lengths[:, 3] = np.maximum(total - 2.0 * ta, 0.0)
+        lengths[:, 5] = ta
+        a_start[:, 1] = a_end[:, 1] = acceleration
+        a_start[:, 5] = a_end[:, 5] = -acceleration
+    elif profile == 'scurve':
+        phases = _scurve_phases(distance, velocity, acceleration, jerk)
+        total, tj, ta, tv = phases[:, 0], phases[:, 1], phases[:, 2], phases[:, 3]
+        a_peak = np.where(tj > 0, tj * jerk, 0.0)
+        lengths[:] = np.stack([tj, ta - 2.0 * tj, tj, tv, tj, ta - 2.0 * tj, tj], axis=-1)
+        a_start[:] = np.stack([0 * a_peak, a_peak, a_peak, 0 * a_peak, 0 * a_peak, -a_peak, -a_peak], axis=-1)
+        a_end[:] = np.stack([a_peak, a_peak, 0 * a_peak, 0 * a_peak, -a_peak, -a_peak, 0 * a_peak], axis=-1)
+    else:
+        raise ValueError(f"Unknown profile {profile!r}, expected one of {PROFILES}")
+    
+    return total, np.maximum(lengths, 0.0), a_start, a_end
+
+
+def _sample_intervals(lengths: np.ndarray, a_start: np.ndarray, a_end: np.ndarray,
+                      segment: np.ndarray, local_t: np.ndarray) -> np.ndarray:
+    """Evaluate position along piecewise-linear-acceleration profiles at sample times."""
+    safe = np.where(lengths > 0, lengths, 1.0)
+    slope = np.where(lengths > 0, (a_end - a_start) / safe, 0.0)
+    
+    # Velocity and position at the start of every interval
+    dv = a_start * lengths + 0.5 * slope * lengths ** 2
+    v0 = np.concatenate([np.zeros((lengths.shape[0], 1)), np.cumsum(dv, axis=1)[:, :-1]], axis=1)
+    ds = v0 * lengths + 0.5 * a_start * lengths ** 2 + slope * lengths ** 3 / 6.0
+    s0 = np.concatenate([np.zeros((lengths.shape[0], 1)), np.cumsum(ds, axis=1)[:, :-1]], axis=1)
+    starts = np.concatenate([np.zeros((lengths.shape[0], 1)), np.cumsum(lengths, axis=1)[:, :-1]], axis=1)
+    
+    idx = np.sum(local_t[:, None] >= starts[segment, 1:], axis=1)
+    rows = segment
+    tau = np.clip(local_t - starts[rows, idx], 0.0, lengths[rows, idx])
+    return (s0[rows, idx] + v0[rows, idx] * tau + 0.5 * a_start[rows, idx] * tau ** 2
+            + slope[rows, idx] * tau ** 3 / 6.0)
+
+
+# ----------------------------------------------------------------------
+# Cartesian waypoints
+# ----------------------------------------------------------------------
+
+def parameterize_waypoints(waypoints: Union[Trajectory, np.ndarray, Sequence[Sequence[float]]],
+                           limits: Optional[MotionLimits] = None, profile: str = 'trapezoidal',
+                           frequency: float = 500.0) -> Trajectory:
+    """
+    Time-parameterize Cartesian waypoints with rest-to-rest segments.
+    
+    Each segment moves on a straight line with slerped orientation. Linear,
+    angular and per-axis limits are mapped onto the shared path parameter,
+    so the segment runs exactly as fast as its tightest limit allows.
+    
+    Args:
+        waypoints: (N, 6) TCP poses, or a Trajectory whose timestamps are ignored
+        limits: Motion limits; defaults to ``MotionLimits()``
+        profile: "trapezoidal" or "scurve"
+        frequency: Output sample rate in Hz, normally the RTDE frequency
+    
+    Returns:
+        Trajectory sampled every 1/frequency seconds, ending exactly on the last waypoint
+    """
+    limits = limits or MotionLimits()
+    poses = waypoints.poses if isinstance(waypoints, Trajectory) else np.asarray(waypoints, dtype=np.float64)
+    poses = poses.reshape(-1, 6)
+    if poses.shape[0] < 2:
+        return Trajectory(poses, np.zeros(poses.shape[0]))
+    
+    start, end = poses[:-1], poses[1:]
+    translation, r0, relative, angular = _segment_geometry(start, end)
+    moving, v_s, a_s, j_s = _normalized_limits(translation, angular, limits)
+    distance = moving.astype(np.float64)
+    
+    durations, lengths, a_start, a_end = _profile_intervals(profile, distance, v_s, a_s, j_s)
+    segment_start = np.concatenate([[0.0], np.cumsum(durations)])
+    
+    times = _sample_times(segment_start[-1], frequency)
+    segment = np.clip(np.searchsorted(segment_start, times, side='right') - 1, 0, len(durations) - 1)
+    local_t = times - segment_start[segment]
+    s = np.clip(_sample_intervals(lengths, a_start, a_end, segment, local_t), 0.0, 1.0)
+    s = np.where(moving[segment], s, 0.0)
+    s[-1] = 1.0
+    
+    out = np.empty((times.shape[0], 6))
+    out[:, :3] = start[segment, :3] + translation[segment] * s[:, None]
+    out[:, 3:] = matrix_to_rotvec(r0[segment] @ rotvec_to_matrix(relative[segment] * s[:, None]))
+    return Trajectory(out, times)
+
+
+def segment_durations(start: np.ndarray, end: np.ndarray, limits: Optional[MotionLimits] = None,
+                      profile: str = 'trapezoidal') -> np.ndarray:
+    """
+    Rest-to-rest durations of independent Cartesian segments.
+    
+    Segments do not need to be consecutive, so segments from many jobs
+    can be timed in a single vectorized call.
+    
+    Args:
+        start: (S, 6) segment start poses
+        end: (S, 6) segment end poses
+        limits: Motion limits; defaults to ``MotionLimits()``
+        profile: "trapezoidal" or "scurve"
+    
+    Returns:
+        (S,) durations in seconds, as used by ``parameterize_waypoints``
+    """
+    limits = limits or MotionLimits()
+    start = np.asarray(start, dtype=np.float64).reshape(-1, 6)
+    end = np.asarray(end, dtype=np.float64).reshape(-1, 6)
+    translation, _, _, angular = _segment_geometry(start, end)
+    moving, v_s, a_s, j_s = _normalized_limits(translation, angular, limits)
+    distance = moving.astype(np.float64)
+    if profile == 'trapezoidal':
+        return trapezoidal_duration(distance, v_s, a_s)
+    if profile == 'scurve':
+        return scurve_duration(distance, v_s, a_s, j_s)
+    raise ValueError(f"Unknown profile {profile!r}, expected one of {PROFILES}")
+
+
+def _segment_geometry(start: np.ndarray, end: np.ndarray):
+    """Translation, start rotation, relative rotation vector and base-frame rotation axis per segment."""
+    translation = end[:, :3] - start[:, :3]
+    r0 = rotvec_to_matrix(start[:, 3:])
+    relative = matrix_to_rotvec(np.swapaxes(r0, 1, 2) @ rotvec_to_matrix(end[:, 3:]))
+    angular = np.einsum('nij,nj->ni', r0, relative)  # rotation axis in the base frame
+    return translation, r0, relative, angular
+
+
+def _normalized_limits(translation: np.ndarray, angular: np.ndarray, limits: MotionLimits):
+    """Map every limit onto the normalized path parameter s in [0, 1] of each segment."""
+    linear_dist = np.linalg.norm(translation, axis=1)
+    angular_dist = np.linalg.norm(angular, axis=1)
+    axis_dist = np.abs(np.concatenate([translation, angular], axis=1))
+    with np.errstate(divide='ignore'):
+        v_s = np.minimum.reduce([
+            limits.linear_velocity / linear_dist,
+            limits.angular_velocity / angular_dist,
+            np.min(limits.axis_velocity / axis_dist, axis=1),
+        ])
+        a_s = np.minimum.reduce([
+            limits.linear_acceleration / linear_dist,
+            limits.angular_acceleration / angular_dist,
+            np.min(limits.axis_acceleration / axis_dist, axis=1),
+        ])
+        j_s = np.minimum(limits.linear_jerk / linear_dist, limits.angular_jerk / angular_dist)
+    
+    # Segments that do not move get a dummy unit profile with zero distance
+    moving = np.isfinite(v_s)
+    return (moving, np.where(moving, v_s, 1.0), np.where(moving, a_s, 1.0),
+            np.where(moving, j_s, 1.0))
+
+
+# ----------------------------------------------------------------------
+# Joint waypoints (TOPP)
+# ----------------------------------------------------------------------
+
+def parameterize_joint_path(waypoints: Union[np.ndarray, Sequence[Sequence[float]]],
+                            limits: Optional[MotionLimits] = None, frequency: float = 500.0,
+                            grid_points: int = 1000) -> Trajectory:
+    """
+    Time-optimal parameterization of a joint path (TOPP, reachability form).
+    
+    A natural cubic spline is fitted through the joint waypoints by chord
+    length. The path is discretized and a backward pass computes the
+    largest controllable squared path speed at each grid point, then a
+    forward pass accelerates greedily within it. The limits are enforced
+    at the grid points only, so the joint velocities and accelerations are
+    then evaluated between them and the whole profile is slowed uniformly
+    if any exceeds its limit. The result starts and ends at rest and keeps
+    every joint within its velocity and acceleration limits.
+    
+    Args:
+        waypoints: (N, 6) joint angles in radians
+        limits: Motion limits; only the joint limits are used
+        frequency: Output sample rate in Hz, normally the RTDE frequency
+        grid_points: Path discretization used by the optimizer
+    
+    Returns:
+        Trajectory whose rows are joint angles, sampled every 1/frequency seconds
+    """
+    limits = limits or MotionLimits()
+    q = np.asarray(waypoints, dtype=np.float64).reshape(-1, 6)
+    if q.shape[0] < 2:
+        return Trajectory(q, np.zeros(q.shape[0]))
+    
+    knots = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(q, axis=0), axis=1))])
+    keep = np.concatenate([[True], np.diff(knots) > 1e-12])
+    q, knots = q[keep], knots[keep]
+    if q.shape[0] < 2:
+        return Trajectory(q, np.zeros(q.shape[0]))
+    
+    spline = _CubicSpline(knots, q)
+    grid = np.linspace(0.0, knots[-1], grid_points)
+    step = grid[1] - grid[0]
+    qs, qss = spline.derivative(grid, 1), spline.derivative(grid, 2)
+    
+    v_lim = limits.joint_velocity
+    a_lim = limits.joint_acceleration
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_max = np.min((v_lim / np.abs(qs)) ** 2, axis=1)
+    x_max = np.minimum(x_max, _acceleration_feasible_x(qs, qss, a_lim))
+    
+    # Backward pass: largest x = sdot^2 from which the end can still be reached at rest
+    controllable = np.zeros(grid_points)
+    controllable[-1] = 0.0
+    for i in range(grid_points - 2, -1, -1):
+        controllable[i] = _max_x_reaching(qs[i], qss[i], a_lim, step, controllable[i + 1], x_max[i])
+    
+    # Forward pass: accelerate as hard as allowed while staying controllable
+    x = np.zeros(grid_points)
+    for i in range(grid_points - 1):
+        u_hi = _u_bounds(qs[i], qss[i], a_lim, x[i])[1]
+        u = min(u_hi, (controllable[i + 1] - x[i]) / (2.0 * step))
+        x[i + 1] = min(max(x[i] + 2.0 * step * u, 0.0), controllable[i + 1])
+    
+    # Verify between grid points; slowing down by k scales velocity by 1/k, acceleration by 1/k²
+    x /= _limit_violation(spline, grid, x, v_lim, a_lim) ** 2
+    
+    sdot = np.sqrt(x)
+    with np.errstate(divide='ignore'):
+        dt = 2.0 * step / (sdot[:-1] + sdot[1:])
+    dt = np.where(np.isfinite(dt), dt, 0.0)
+    grid_times = np.concatenate([[0.0], np.cumsum(dt)])
+    
+    # Path acceleration is constant over each grid interval, so sample s(t) exactly
+    times = _sample_times(grid_times[-1], frequency)
+    idx = np.clip(np.searchsorted(grid_times, times, side='right') - 1, 0, grid_points - 2)
+    tau = times - grid_times[idx]
+    u = (x[idx + 1] - x[idx]) / (2.0 * step)
+    s = np.clip(grid[idx] + sdot[idx] * tau + 0.5 * u * tau ** 2, grid[idx], grid[idx + 1])
+    return Trajectory(spline(s), times)
+
+
+def _limit_violation(spline: '_CubicSpline', grid: np.ndarray, x: np.ndarray, v_lim: np.ndarray,
+                     a_lim: np.ndarray, substeps: int = 4) -> float:
+    """
+    Factor by which a profile must be slowed to respect the joint limits.
+    
+    Evaluates joint velocity and acceleration at ``substeps`` points inside
+    every grid interval, where ``x`` = sdot² is linear in s.
+    
+    Returns:
+        max(1, peak velocity ratio, sqrt(peak acceleration ratio))
+    """
+    step = grid[1] - grid[0]
+    fraction = np.linspace(0.0, 1.0, substeps + 1)
+    s = (grid[:-1, None] + step * fraction).reshape(-1)
+    u = np.repeat((x[1:] - x[:-1]) / (2.0 * step), substeps + 1)
+    xs = np.maximum(np.repeat(x[:-1], substeps + 1) + 2.0 * u * (s - np.repeat(grid[:-1], substeps + 1)), 0.0)
+    qs, qss = spline.derivative(s, 1), spline.derivative(s, 2)
+    velocity = np.max(np.abs(qs) * np.sqrt(xs)[:, None] / v_lim)
+    acceleration = np.max(np.abs(qss * xs[:, None] + qs * u[:, None]) / a_lim)
+    return float(max(1.0, velocity, np.sqrt(acceleration)))
+
+
+def _sample_times(duration: float, frequency: float) -> np.ndarray:
+    """Uniform sample times covering [0, duration], always including the end."""
+    count = int(np.ceil(duration * frequency - 1e-9)) + 1
+    times = np.arange(count) / frequency
+    times[-1] = duration
+    if count > 1 and times[-1] <= times[-2]:
+        times = times[:-1]
+        times[-1] = duration
+    return times
+
+
+def _u_bounds(qs: np.ndarray, qss: np.ndarray, a_lim: np.ndarray, x: float):
+    """Feasible path acceleration interval [u_lo, u_hi] at squared speed x."""
+    lo, hi = -np.inf, np.inf
+    active = np.abs(qs) > 1e-12
+    b = qss[active] * x
+    a = qs[active]
+    lim = a_lim[active]
+    bound_1 = (-lim - b) / a
+    bound_2 = (lim - b) / a
+    if active.any():
+        lo = float(np.max(np.minimum(bound_1, bound_2)))
+        hi = float(np.min(np.maximum(bound_1, bound_2)))
+    return lo, hi
+
+
+def _acceleration_feasible_x(qs: np.ndarray, qss: np.ndarray, a_lim: np.ndarray) -> np.ndarray:
+    """Largest x per grid point for which some path acceleration satisfies all joint limits."""
+    # Constraints: -A_j <= qs_j * u + qss_j * x <= A_j. Eliminating u between each
+    # pair of joints j, k gives |qss_j*qs_k - qss_k*qs_j| * x <= A_j*|qs_k| + A_k*|qs_j|
+    cross = np.abs(qss[:, :, None] * qs[:, None, :] - qss[:, None, :] * qs[:, :, None])
+    budget = a_lim[None, :, None] * np.abs(qs[:, None, :]) + a_lim[None, None, :] * np.abs(qs[:, :, None])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pair = np.where(cross > 1e-12, budget / cross, np.inf)
+        # Joints that do not move along the path still feel qss * x
+        single = np.where((np.abs(qs) <= 1e-12) & (np.abs(qss) > 1e-12), a_lim / np.abs(qss), np.inf)
+    return np.minimum(pair.min(axis=(1, 2)), single.min(axis=1))
+
+
+def _max_x_reaching(qs: np.ndarray, qss: np.ndarray, a_lim: np.ndarray, step: float,
+                    x_next: float, x_cap: float) -> float:
+    """Largest x <= x_cap such that x + 2*step*u_lo(x) <= x_next."""
+    high = min(max(x_cap, 0.0), 1e6)
+    if high + 2.0 * step * _u_bounds(qs, qss, a_lim, high)[0] <= x_next:
+        return high
+    
+    # x + 2*step*u_lo(x) is convex and negative at x = 0, so the feasible
+    # set is an interval starting at zero; bisect for its upper end
+    low = 0.0
+    for _ in range(40):
+        mid = 0.5 * (low + high)
+        if mid + 2.0 * step * _u_bounds(qs, qss, a_lim, mid)[0] <= x_next:
+            low = mid
+        else:
+            high = mid
+    return low
+
+
+class _CubicSpline:
+    """Natural cubic spline through (N, D) values at increasing knots."""
+    
+    def __init__(self, knots: np.ndarray, values: np.ndarray):
+        self.knots = knots
+        self.values = values
+        n = knots.shape[0]
+        h = np.diff(knots)
+        
+        # Solve the tridiagonal system for second derivatives (natural boundary)
+        system = np.zeros((n, n))
+        rhs = np.zeros((n, values.shape[1]))
+        system[0, 0] = system[-1, -1] = 1.0
+        for i in range(1, n - 1):
+            system[i, i - 1] = h[i - 1]
+            system[i, i] = 2.0 * (h[i - 1] + h[i])
+            system[i, i + 1] = h[i]
+            rhs[i] = 6.0 * ((values[i + 1] - values[i]) / h[i] - (values[i] - values[i - 1]) / h[i - 1])
+        self.second = np.linalg.solve(system, rhs)
+        self.h = h
+    
+    def _locate(self, s: np.ndarray):
+        idx = np.clip(np.searchsorted(self.knots, s, side='right') - 1, 0, self.knots.shape[0] - 2)
+        return idx, (s - self.knots[idx])[:, None], self.h[idx][:, None]
+    
+    def __call__(self, s: np.ndarray) -> np.ndarray:
+        idx, t, h = self._locate(s)
+        m0, m1 = self.second[idx], self.second[idx + 1]
+        y0, y1 = self.values[idx], self.values[idx + 1]
+        return (m0 * (h - t) ** 3 / (6 * h) + m1 * t ** 3 / (6 * h)
+                + (y0 / h - m0 * h / 6) * (h - t) + (y1 / h - m1 * h / 6) * t)
+    
+    def derivative(self, s: np.ndarray, order: int) -> np.ndarray:
+        idx, t, h = self._locate(s)
+        m0, m1 = self.second[idx], self.second[idx + 1]
+        y0, y1 = self.values[idx], self.values[idx + 1]
+        if order == 1:
+            return (-m0 * (h - t) ** 2 / (2 * h) + m1 * t ** 2 / (2 * h)
+                    + (y1 - y0) / h - (m1 - m0) * h / 6)
+        if order == 2:
+            return m0 * (h - t) / h + m1 * t / h
+        raise ValueError(f"Unsupported derivative order {order}")
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Trajectory Type
+
+NumPy-backed container for sequences of TCP poses. Poses are stored as an
+(N, 6) float64 array of [x, y, z, rx, ry, rz] rows (meters, axis-angle radians)
+with an (N,) array of timestamps in seconds, so batch pose math runs
+vectorized instead of through per-pose Python lists.
+"""
+
+import json
+from pathlib import Path
+from typing import List, Optional, Sequence, Union, Iterable
+
+import numpy as np
+
+try:
+    from .spatial import rotvec_to_matrix, matrix_to_rotvec, integrate_deltas
+except ImportError:
+    from spatial import rotvec_to_matrix, matrix_to_rotvec, integrate_deltas
+
+
+PoseLike = Union[Sequence[float], np.ndarray]
+
+POSE_KEYS = ('x', 'y', 'z', 'rx', 'ry', 'rz')
+
+
+class Trajectory:
+    """Time-stamped sequence of TCP poses backed by an (N, 6) array."""
+    
+    def __init__(self, poses: Union[np.ndarray, Sequence[PoseLike]],
+                 timestamps: Optional[Union[np.ndarray, Sequence[float]]] = None):
+        """
+        Create a trajectory.
+        
+        Args:
+            poses: (N, 6) array-like of [x, y, z, rx, ry, rz]
+            timestamps: (N,) array-like of times in seconds. Defaults to one
+                second per pose, matching the default command responsiveness.
+        """
+        poses = np.array(poses, dtype=np.float64, ndmin=2)
+        if poses.size == 0:
+            poses = poses.reshape(0, 6)
+        if poses.ndim != 2 or poses.shape[1] != 6:
+            raise ValueError(f"Poses must have shape (N, 6), got {poses.shape}")
+        
+        if timestamps is None:
+            timestamps = np.arange(poses.shape[0], dtype=np.float64)
+        else:
+            timestamps = np.array(timestamps, dtype=np.float64).reshape(-1)
+            if timestamps.shape[0] != poses.shape[0]:
+                raise ValueError(f"Got {timestamps.shape[0]} timestamps for {poses.shape[0]} poses")
+            if timestamps.shape[0] > 1 and np.any(np.diff(timestamps) < 0):
+                raise ValueError("Timestamps must be non-decreasing")
+        
+        self.poses = poses
+        self.timestamps = timestamps
+    
+    # ------------------------------------------------------------------
+    # Basic container behaviour
+    # ------------------------------------------------------------------
+    
+    def __len__(self) -> int:
+        return self.poses.shape[0]
+    
+    def __getitem__(self, index):
+        """Integer indices return a pose row, slices and masks return a Trajectory."""
+        if isinstance(index, (int, np.integer)):
+            return self.poses[index].copy()
+        return Trajectory(self.poses[index], self.timestamps[index])
+    
+    def __iter__(self):
+        return iter(self.poses)
+    
+    def __repr__(self) -> str:
+        return f"Trajectory(n={len(self)}, duration={self.duration:.3f}s)"
+    
+    @property
+    def positions(self) -> np.ndarray:
+        """(N, 3) view of the positions."""
+        return self.poses[:, :3]
+    
+    @property
+    def rotvecs(self) -> np.ndarray:
+        """(N, 3) view of the axis-angle rotation vectors."""
+        return self.poses[:, 3:]
+    
+    @property
+    def duration(self) -> float:
+        """Time span covered by the trajectory in seconds."""
+        if len(self) == 0:
+            return 0.0
+        return float(self.timestamps[-1] - self.timestamps[0])
+    
+    def copy(self) -> 'Trajectory':
+        """Return a deep copy."""
+        return Trajectory(self.poses.copy(), self.timestamps.copy())
+    
+    def to_list(self) -> List[List[float]]:
+        """Return the poses as a list of [x, y, z, rx, ry, rz] lists."""
+        return self.poses.tolist()
+    
+    # ------------------------------------------------------------------
+    # Vectorized pose math
+    # ------------------------------------------------------------------
+    
+    def offset(self, translation: Union[Sequence[float], np.ndarray]) -> 'Trajectory':
+        """
+        Translate every pose in the base frame.
+        
+        Args:
+            translation: [dx, dy, dz], or an (N, 3) array with one offset per pose
+        
+        Returns:
+            New trajectory with shifted positions and unchanged orientations
+        """
+        translation = np.asarray(translation, dtype=np.float64)
+        poses = self.poses.copy()
+        poses[:, :3] += translation
+        return Trajectory(poses, self.timestamps.copy())
+    
+    def transform(self, frame: Union[PoseLike, np.ndarray]) -> 'Trajectory':
+        """
+        Express the trajectory in another frame (URScript ``pose_trans(frame, p)``).
+        
+        Args:
+            frame: Frame pose [x, y, z, rx, ry, rz] or a 4x4 homogeneous matrix
+        
+        Returns:
+            New trajectory with every pose premultiplied by the frame
+        """
+        frame = np.asarray(frame, dtype=np.float64)
+        if frame.shape == (4, 4):
+            rotation, translation = frame[:3, :3], frame[:3, 3]
+        elif frame.shape == (6,):
+            rotation = rotvec_to_matrix(frame[3:])
+            translation = frame[:3]
+        else:
+            raise ValueError(f"Frame must be a 6-vector pose or 4x4 matrix, got shape {frame.shape}")
+        
+        poses = np.empty_like(self.poses)
+        poses[:, :3] = self.positions @ rotation.T + translation
+        if len(self):
+            poses[:, 3:] = matrix_to_rotvec(rotation @ rotvec_to_matrix(self.rotvecs))
+        return Trajectory(poses, self.timestamps.copy())
+    
+    @classmethod
+    def from_deltas(cls, start_pose: PoseLike, deltas: Union[np.ndarray, Sequence[PoseLike]],
+                    timestamps: Optional[Union[np.ndarray, Sequence[float]]] = None) -> 'Trajectory':
+        """
+        Integrate a sequence of base-frame deltas from a start pose.
+        
+        Rotation deltas are composed properly rather than added to the
+        rotation vector, see ``spatial.integrate_deltas``.
+        
+        Args:
+            start_pose: Pose [x, y, z, rx, ry, rz] the deltas start from
+            deltas: (N, 6) array-like of [dx, dy, dz, drx, dry, drz]
+            timestamps: Optional timestamps for the resulting poses
+        
+        Returns:
+            Trajectory of the pose reached after each delta
+        """
+        return cls(integrate_deltas(start_pose, deltas), timestamps)
+    
+    @classmethod
+    def concatenate(cls, trajectories: Iterable['Trajectory'], gap: float = 0.0) -> 'Trajectory':
+        """
+        Join trajectories end to end.
+        
+        Each trajectory's timestamps are shifted so it starts ``gap`` seconds
+        after the previous one ends.
+        
+        Args:
+            trajectories: Trajectories to join, in order
+            gap: Time between the end of one trajectory and the start of the next
+        
+        Returns:
+            Combined trajectory
+        """
+        poses = []
+        times = []
+        end = None
+        for traj in trajectories:
+            if len(traj) == 0:
+                continue
+            shifted = traj.timestamps - traj.timestamps[0]
+            start = 0.0 if end is None else end + gap
+            poses.append(traj.poses)
+            times.append(shifted + start)
+            end = start + shifted[-1]
+        
+        if not poses:
+            return cls(np.empty((0, 6)), np.empty(0))
+        return cls(np.concatenate(poses), np.concatenate(times))
+    
+    def resample(self, frequency: float = 500.0) -> 'Trajectory':
+        """
+        Resample at a fixed rate, e.g. the RTDE frequency for servo streaming.
+        
+        Positions are interpolated linearly and orientations by spherical
+        linear interpolation between neighbouring poses.
+        
+        Args:
+            frequency: Sample rate in Hz
+        
+        Returns:
+            New trajectory sampled every 1/frequency seconds
+        """
+        if frequency <= 0:
+            raise ValueError(f"Frequency must be positive, got {frequency}")
+        if len(self) < 2:
+            return self.copy()
+        
+        t0, t1 = self.timestamps[0], self.timestamps[-1]
+        count = int(np.floor((t1 - t0) * frequency + 1e-9)) + 1
+        times = t0 + np.arange(count) / frequency
+        
+        # Segment index and fraction for every sample
+        idx = np.clip(np.searchsorted(self.timestamps, times, side='right') - 1, 0, len(self) - 2)
+        span = self.timestamps[idx + 1] - self.timestamps[idx]
+        frac = np.divide(times - self.timestamps[idx], span,
+                         out=np.zeros_like(times), where=span > 0)
+        
+        start = self.poses[idx]
+        end = self.poses[idx + 1]
+        poses = np.empty((count, 6))
+        poses[:, :3] = start[:, :3] + (end[:, :3] - start[:, :3]) * frac[:, None]
+        
+        # Slerp: R(s) = R0 * exp(s * log(R0^T R1))
+        r0 = rotvec_to_matrix(start[:, 3:])
+        r1 = rotvec_to_matrix(end[:, 3:])
+        relative = matrix_to_rotvec(np.swapaxes(r0, 1, 2) @ r1)
+        poses[:, 3:] = matrix_to_rotvec(r0 @ rotvec_to_matrix(relative * frac[:, None]))
+        
+        return Trajectory(poses, times)
+    
+    # ------------------------------------------------------------------
+    # Conversions
+    # ------------------------------------------------------------------
+    
+    @classmethod
+    def from_jsonl(cls, json_file: Union[str, Path], responsiveness: float = 1.0) -> 'Trajectory':
+        """
+        Load absolute pose commands from a JSONL file.
+        
+        Lines use the same format as the pose examples. A ``time`` field, if
+        present on every line, is used as the timestamp; otherwise poses are
+        spaced ``responsiveness`` seconds apart.
+        
+        Args:
+            json_file: Path to JSONL file with pose commands
+            responsiveness: Time between poses in seconds when no times are given
+        
+        Returns:
+            Loaded trajectory
+        """
+        rows = []
+        times = []
+        with open(json_file, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                cmd = json.loads(line)
+                rows.append([float(cmd.get(key, 0.0)) for key in POSE_KEYS])
+                times.append(cmd.get('time'))
+        
+        if rows and all(t is not None for t in times):
+            timestamps = np.array(times, dtype=np.float64)
+        else:
+            timestamps = np.arange(len(rows), dtype=np.float64) * responsiveness
+        return cls(np.array(rows, dtype=np.float64).reshape(-1, 6), timestamps)
+    
+    def to_jsonl(self, json_file: Union[str, Path], include_time: bool = True) -> None:
+        """
+        Write the poses as JSONL pose commands.
+        
+        Args:
+            json_file: Output path
+            include_time: Also write each pose's timestamp as ``time``
+        """
+        with open(json_file, 'w') as f:
+            for pose, t in zip(self.poses.tolist(), self.timestamps.tolist()):
+                cmd = dict(zip(POSE_KEYS, pose))
+                if include_time:
+                    cmd['time'] = t
+                f.write(json.dumps(cmd) + '\n')
+    
+    @classmethod
+    def from_path(cls, path: Sequence[Sequence[float]],
+                  timestamps: Optional[Sequence[float]] = None) -> 'Trajectory':
+        """
+        Build a trajectory from a ur_rtde ``moveL`` path.
+        
+        Args:
+            path: Rows of [x, y, z, rx, ry, rz, speed, acceleration, blend]
+            timestamps: Optional timestamps for the waypoints
+        
+        Returns:
+            Trajectory of the path waypoints
+        """
+        rows = np.array(path, dtype=np.float64, ndmin=2)
+        return cls(rows[:, :6], timestamps)
+    
+    def to_path(self, speed: float, acceleration: float, blend: float = 0.0) -> List[List[float]]:
+        """
+        Convert to a ur_rtde ``moveL`` path.
+        
+        Args:
+            speed: Tool speed for every waypoint in m/s
+            acceleration: Tool acceleration in m/s²
+            blend: Blend radius in meters. The last waypoint always uses zero.
+        
+        Returns:
+            List of [x, y, z, rx, ry, rz, speed, acceleration, blend] rows
+        """
+        path = np.empty((len(self), 9))
+        path[:, :6] = self.poses
+        path[:, 6] = speed
+        path[:, 7] = acceleration
+        path[:, 8] = blend
+        if len(self):
+            path[-1, 8] = 0.0
+        return path.tolist()
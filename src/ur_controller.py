@@ -13,15 +13,21 @@ import json
 import time
 import sys
 import logging
+import threading
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple, Any, TextIO
 from pathlib import Path
 
+import numpy as np
+
 try:
     import rtde_control
     import rtde_receive
 except ImportError:
-    print("ERROR: ur_rtde library not found. Please install with: pip install ur-rtde")
-    sys.exit(1)
+    print("WARNING: ur_rtde library not found. Only the simulated robot backend is available "
+          "(install with: pip install ur-rtde)")
+    rtde_control = None
+    rtde_receive = None
 
 try:
     import yaml
@@ -29,20 +35,107 @@ except ImportError:
     print("WARNING: PyYAML not found. Configuration file support disabled.")
     yaml = None
 
+try:
+    from .trajectory import Trajectory
+    from .spatial import apply_delta, compose_rotvecs
+    from .kinematics import URKinematics
+    from .time_parameterization import MotionLimits, parameterize_waypoints
+    from .coalescing import DeltaCoalescer
+    from .emergency_stop import EmergencyStopChannel
+    from .robot_state import RobotState, StateMonitor
+    from .command_tracking import CommandTracker
+    from .command_watchdog import CommandWatchdog
+    from .realtime import RealtimeMode
+    from .loop_timing import LoopTimer, install_dump_signal
+    from .metrics import ControllerMetrics, ProcessorMetrics, start_server
+    from .profiling import PROFILER, span, traced
+    from .hot_logging import HotPathLogger, start_queue_logging
+    from .clock import SYSTEM_CLOCK
+    from .workspace import WorkspaceLimits
+    from .keep_out import KeepOutZones
+    from .simulated_robot import SimulatedRobot
+except ImportError:
+    from trajectory import Trajectory
+    from spatial import apply_delta, compose_rotvecs
+    from kinematics import URKinematics
+    from time_parameterization import MotionLimits, parameterize_waypoints
+    from coalescing import DeltaCoalescer
+    from emergency_stop import EmergencyStopChannel
+    from robot_state import RobotState, StateMonitor
+    from command_tracking import CommandTracker
+    from command_watchdog import CommandWatchdog
+    from realtime import RealtimeMode
+    from loop_timing import LoopTimer, install_dump_signal
+    from metrics import ControllerMetrics, ProcessorMetrics, start_server
+    from profiling import PROFILER, span, traced
+    from hot_logging import HotPathLogger, start_queue_logging
+    from clock import SYSTEM_CLOCK
+    from workspace import WorkspaceLimits
+    from keep_out import KeepOutZones
+    from simulated_robot import SimulatedRobot
+
+DELTA_KEYS = ('dx', 'dy', 'dz', 'drx', 'dry', 'drz')
+
+
+class MotionFuture(Future):
+    """
+    Completion of an asynchronous move.
+    
+    Resolves to True when the robot finished the motion and False if the
+    command was rejected or superseded by another asynchronous move.
+    ``cancel()`` stops the robot (stopL/stopJ) and cancels the future.
+    """
+    
+    def __init__(self, description: str, stop):
+        super().__init__()
+        self.description = description
+        self.progress = 0
+        self._stop = stop
+    
+    def cancel(self) -> bool:
+        """Stop the motion and cancel the future; False if it already completed."""
+        if self.done():
+            return False
+        self._stop()
+        return super().cancel()
+    
+    def _finish(self, result: bool) -> None:
+        """Resolve the future unless it was cancelled meanwhile."""
+        try:
+            self.set_result(result)
+        except InvalidStateError:
+            pass
+
 
 class URRobotController:
-    """Universal Robot controller supporting both simulation and physical robots."""
+    """
+    Universal Robot controller supporting both simulation and physical robots.
+    
+    Concurrency model (once connected):
+    
+    - Commands: every call on the control interface runs on one owner
+      thread, fed by a single-worker executor. Any thread may call the
+      public methods; calls are serialized in submission order.
+    - Stops: ``emergency_stop`` and motion cancellation call stopL/stopJ
+      directly so they pre-empt a command blocking the owner thread.
+    - State: a telemetry thread is the only user of the receive interface
+      and publishes immutable ``RobotState`` snapshots (see ``state``),
+      which readers take without locking.
+    """
     
     def __init__(self, config_path: Optional[str] = None, robot_ip: str = "127.0.0.1", 
-                 robot_type: str = "simulation", frequency: float = 500.0):
+                 robot_type: str = "simulation", frequency: float = 500.0, backend=None):
         """
         Initialize the UR Robot Controller.
         
         Args:
             config_path: Path to YAML configuration file
             robot_ip: IP address of the robot or simulator
-            robot_type: "simulation" or "physical"
+            robot_type: "simulation", "physical" or "simulated" (in-process
+                ``SimulatedRobot``, built from the config's ``simulated_robot`` section)
             frequency: RTDE communication frequency in Hz
+            backend: In-process robot (e.g. ``SimulatedRobot``) used instead of
+                RTDE connections; its clock drives all waits
         """
         self.config = {}
         self.robot_ip = robot_ip
@@ -59,15 +152,85 @@ class URRobotController:
             self.robot_type = self.config.get('robot', {}).get('type', robot_type)
             self.frequency = self.config.get('robot', {}).get('frequency', frequency)
         
+        # robot.type "simulated" runs on the in-process simulated robot
+        if backend is None and self.robot_type == "simulated":
+            backend = SimulatedRobot.from_config(self.config)
+        self.backend = backend
+        self.clock = backend.clock if backend is not None else SYSTEM_CLOCK
+        
+        # Per-move and per-cycle messages: lazy, deduplicated and rate limited;
+        # with logging.queue, the root handlers move to a listener thread
+        self.hot_log = HotPathLogger.from_config(self.logger, self.config)
+        if self.config.get('logging', {}).get('queue', False):
+            start_queue_logging()
+        
         # RTDE interfaces
         self.rtde_c: Optional[rtde_control.RTDEControlInterface] = None
         self.rtde_r: Optional[rtde_receive.RTDEReceiveInterface] = None
         
+        # Command owner thread and state snapshots, started on connect
+        self.state_frequency = self.config.get('robot', {}).get('state_frequency', 125.0)
+        self.state_max_age = self.config.get('robot', {}).get('state_max_age', 0.1)
+        self._command_executor: Optional[ThreadPoolExecutor] = None
+        self._command_thread: Optional[threading.Thread] = None
+        self._state_monitor: Optional[StateMonitor] = None
+        
+        # Opt-in real-time scheduling, memory locking and GC control for the control loops
+        self.realtime = RealtimeMode.from_config(self.config, clock=self.clock)
+        self.servo_timer = LoopTimer('servo')
+        
+        # Health metrics, served in Prometheus format when metrics.enabled
+        metrics = self.config.get('metrics', {})
+        self.metrics_enabled = metrics.get('enabled', False)
+        self.metrics_host = metrics.get('host', '0.0.0.0')
+        self.metrics_port = metrics.get('port', 9108)
+        self.metrics = ControllerMetrics(self.robot_ip)
+        self.metrics.queue_depth.set_function(
+            lambda: self._command_executor._work_queue.qsize() if self._command_executor else 0)
+        
+        # Sampled hot-path spans, exported as a Chrome trace when profiling.enabled
+        PROFILER.configure(self.config)
+        
         # Safety and movement settings
         self.max_velocity = self.config.get('physical', {}).get('safety', {}).get('max_velocity', 0.5)
         self.max_acceleration = self.config.get('physical', {}).get('safety', {}).get('max_acceleration', 1.0)
         self.default_speed = self.config.get('movement', {}).get('default_speed', 0.2)
         self.default_acceleration = self.config.get('movement', {}).get('default_acceleration', 0.5)
+        self.default_joint_speed = self.config.get('movement', {}).get('default_joint_speed', 1.05)
+        self.default_joint_acceleration = self.config.get('movement', {}).get('default_joint_acceleration', 1.4)
+        self.async_poll_interval = self.config.get('movement', {}).get('async_poll_interval', 0.005)
+        self._active_motion: Optional[MotionFuture] = None
+        
+        # Out-of-band stop path, opened on connect
+        self.use_stop_channel = (self.config.get('physical', {}).get('safety', {})
+                                 .get('emergency_stop', {}).get('enabled', True))
+        self.stop_channel: Optional[EmergencyStopChannel] = None
+        self.check_reachability = self.config.get('physical', {}).get('safety', {}).get('check_reachability', False)
+        self.motion_limits = MotionLimits.from_config(self.config)
+        
+        # Workspace box, also checked along the path to each target (physical.safety.swept_check)
+        self.workspace = WorkspaceLimits.from_config(self.config)
+        
+        # Keep-out zones (fixtures, conveyors, other robots) for the tool spheres
+        self.keep_out = KeepOutZones.from_config(self.config)
+        
+        # Settle detection (see wait_until_settled)
+        settle = self.config.get('movement', {}).get('settle', {})
+        self.settle_timeout = settle.get('timeout', 5.0)
+        self.settle_speed_tolerance = settle.get('speed_tolerance', 0.002)
+        self.settle_position_tolerance = settle.get('position_tolerance', 0.0005)
+        self.settle_orientation_tolerance = settle.get('orientation_tolerance', 0.002)
+        self.settle_samples = settle.get('samples', 3)
+        self.settle_poll_interval = settle.get('poll_interval', 0.002)
+        
+        # Offline kinematics for the configured model
+        self.robot_model = self.config.get('robot', {}).get('model', 'UR5e')
+        tcp_offset = self.config.get('robot', {}).get('tcp_offset')
+        try:
+            self.kinematics: Optional[URKinematics] = URKinematics(self.robot_model, tcp_offset)
+        except ValueError as e:
+            self.logger.warning(f"Kinematics disabled: {e}")
+            self.kinematics = None
         
         self.logger.info(f"Initialized UR Controller for {robot_type} robot at {robot_ip}")
     
@@ -99,15 +262,24 @@ class URRobotController:
         try:
             self.logger.info(f"Connecting to robot at {self.robot_ip}...")
             
+            if self.backend is None and rtde_control is None:
+                self.logger.error("ur_rtde library not found; only robot.type 'simulated' is available")
+                return False
+            
             # Initialize RTDE interfaces
-            if self.robot_type == "physical":
+            if self.backend is not None:
+                flags = 0
+            elif self.robot_type == "physical":
                 # For physical robots, use additional safety checks
                 flags = rtde_control.RTDEControlInterface.FLAG_VERBOSE
             else:
                 flags = 0
-                
-            self.rtde_c = rtde_control.RTDEControlInterface(self.robot_ip, self.frequency, flags)
-            self.rtde_r = rtde_receive.RTDEReceiveInterface(self.robot_ip, self.frequency)
+            
+            if self.backend is not None:
+                self.rtde_c, self.rtde_r = self.backend.connect(self.robot_ip, self.frequency)
+            else:
+                self.rtde_c = rtde_control.RTDEControlInterface(self.robot_ip, self.frequency, flags)
+                self.rtde_r = rtde_receive.RTDEReceiveInterface(self.robot_ip, self.frequency)
             
             # Check connections
             if not (self.rtde_c.isConnected() and self.rtde_r.isConnected()):
@@ -116,16 +288,88 @@ class URRobotController:
             
             self.logger.info("Successfully connected to robot")
             
+            # Separate stop thread and connections, so a stop never waits behind a blocking move
+            if self.use_stop_channel and self.backend is None:
+                channel = EmergencyStopChannel.from_config(self)
+                if channel.start():
+                    self.stop_channel = channel
+                else:
+                    self.logger.warning("Emergency stop channel unavailable, stops use the control interface")
+            
             # Additional checks for physical robots
-            if self.robot_type == "physical":
-                return self._verify_physical_robot_safety()
+            if self.robot_type == "physical" and not self._verify_physical_robot_safety():
+                return False
             
-            return True
+            self._start_threads()
             
+            if self.metrics.connects.value:
+                self.metrics.reconnects.inc()
+            self.metrics.connects.inc()
+            self.metrics.connected.set(1)
+            if self.metrics_enabled:
+                start_server(self.metrics_host, self.metrics_port)
+            return True
+        
         except Exception as e:
             self.logger.error(f"Connection failed: {e}")
             return False
     
+    def _start_threads(self) -> None:
+        """Start the command owner thread and the state monitor."""
+        self._command_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='URCommand',
+                                                    initializer=self._claim_command_thread)
+        
+        # An in-process backend is read directly, so state follows its clock
+        if self.backend is None:
+            self._state_monitor = StateMonitor(self.rtde_r, self.state_frequency)
+            if not self._state_monitor.start():
+                self.logger.warning("No robot state received yet")
+        
+        if self.realtime.enabled:
+            self.realtime.setup_process()
+            self._call(self.realtime.apply_thread, 'command')
+    
+    def _claim_command_thread(self) -> None:
+        """Record the executor's worker as the command owner thread."""
+        self._command_thread = threading.current_thread()
+    
+    def _call(self, command, *args):
+        """
+        Run a control interface call on the command owner thread and return its result.
+        
+        Calls made on the owner thread itself (nested commands) run directly.
+        Before connect, or after disconnect, the call runs on the caller's thread.
+        """
+        executor = self._command_executor
+        if executor is None or threading.current_thread() is self._command_thread:
+            return command(*args)
+        return executor.submit(self._timed_call, command, *args).result()
+    
+    @traced('rtde_call')
+    def _timed_call(self, command, *args):
+        """Run a command on the owner thread and record it in the metrics (single writer)."""
+        start = time.perf_counter()
+        try:
+            return command(*args)
+        finally:
+            self.metrics.call_seconds.observe(time.perf_counter() - start)
+            self.metrics.commands.inc()
+    
+    @property
+    def state(self) -> Optional[RobotState]:
+        """
+        Latest robot state snapshot (lock-free).
+        
+        None if not connected, or if the snapshot is older than
+        ``robot.state_max_age`` (the monitor's reads are failing); callers
+        then read the robot directly instead of using a frozen pose.
+        """
+        state = self._state_monitor.latest if self._state_monitor else None
+        if state is not None and state.age > self.state_max_age:
+            self.hot_log.warning("Robot state snapshot is %.3fs old, reading the robot directly", state.age)
+            return None
+        return state
+    
     def _verify_physical_robot_safety(self) -> bool:
         """Verify safety conditions for physical robot."""
         try:
@@ -141,19 +385,32 @@ class URRobotController:
             # For example, checking joint limits, workspace limits, etc.
             
             return True
-            
+        
         except Exception as e:
             self.logger.error(f"Safety verification failed: {e}")
             return False
     
     def disconnect(self) -> None:
         """Disconnect from the robot."""
+        if self.stop_channel:
+            self.stop_channel.close()
+            self.stop_channel = None
+        if self._state_monitor:
+            self._state_monitor.stop()
+            self._state_monitor = None
+        if self._command_executor:
+            self._command_executor.shutdown(wait=True)
+            self._command_executor = None
+            self._command_thread = None
+        self.realtime.release_process()
+        self.metrics.connected.set(0)
         if self.rtde_c:
             self.rtde_c.disconnect()
         if self.rtde_r:
             self.rtde_r.disconnect()
         self.logger.info("Disconnected from robot")
     
+    @traced('get_tcp_pose')
     def get_tcp_pose(self) -> Optional[List[float]]:
         """
         Get current TCP (Tool Center Point) pose.
@@ -162,15 +419,20 @@ class URRobotController:
             [x, y, z, rx, ry, rz] or None if failed
         """
         if not self.rtde_r:
-            self.logger.error("Not connected to robot")
+            self.hot_log.error("Not connected to robot")
             return None
         
+        state = self.state
+        if state is not None:
+            return list(state.tcp_pose)
+        
         try:
             return self.rtde_r.getActualTCPPose()
         except Exception as e:
-            self.logger.error(f"Failed to get TCP pose: {e}")
+            self.hot_log.error("Failed to get TCP pose: %s", e)
             return None
     
+    @traced('move_linear')
     def move_linear(self, target_pose: List[float], speed: Optional[float] = None, 
                    acceleration: Optional[float] = None) -> bool:
         """
@@ -180,30 +442,328 @@ class URRobotController:
             target_pose: [x, y, z, rx, ry, rz] in meters and radians
             speed: Linear speed in m/s
             acceleration: Linear acceleration in m/s²
-            
+        
         Returns:
             True if move command sent successfully
         """
         if not self.rtde_c:
-            self.logger.error("Not connected to robot")
+            self.hot_log.error("Not connected to robot")
             return False
         
+        if self._stop_latched():
+            return False
+        
+        target_pose = np.asarray(target_pose, dtype=np.float64).tolist()
         speed = speed or self.default_speed
         acceleration = acceleration or self.default_acceleration
         
         # Safety checks for physical robots
         if self.robot_type == "physical":
-            if not self._check_safety_limits(target_pose, speed, acceleration):
+            if not self._check_safety_limits(target_pose, speed, acceleration, self._path_start()):
+                self.metrics.rejections['pose'].inc()
                 return False
         
         try:
-            self.logger.info(f"Moving to pose: {target_pose} at speed {speed}")
-            self.rtde_c.moveL(target_pose, speed, acceleration)
+            self.hot_log.info("Moving to pose: %s at speed %s", target_pose, speed)
+            self._call(self.rtde_c.moveL, target_pose, speed, acceleration)
             return True
         except Exception as e:
-            self.logger.error(f"Move failed: {e}")
+            self.hot_log.error("Move failed: %s", e)
             return False
     
+    def move_linear_async(self, target_pose: List[float], speed: Optional[float] = None,
+                          acceleration: Optional[float] = None) -> MotionFuture:
+        """
+        Start a linear move and return immediately.
+        
+        Args:
+            target_pose: [x, y, z, rx, ry, rz] in meters and radians
+            speed: Linear speed in m/s
+            acceleration: Linear acceleration in m/s²
+        
+        Returns:
+            Future resolving when the motion completes; cancelling it calls stopL
+        """
+        target_pose = np.asarray(target_pose, dtype=np.float64).tolist()
+        speed = speed or self.default_speed
+        acceleration = acceleration or self.default_acceleration
+        future = MotionFuture(f"moveL to {target_pose}", lambda: self._stop_motion('L'))
+        
+        if not self.rtde_c:
+            self.hot_log.error("Not connected to robot")
+            future._finish(False)
+            return future
+        
+        if self._stop_latched():
+            future._finish(False)
+            return future
+        
+        # Safety checks for physical robots
+        if self.robot_type == "physical":
+            if not self._check_safety_limits(target_pose, speed, acceleration, self._path_start()):
+                self.metrics.rejections['pose'].inc()
+                future._finish(False)
+                return future
+        
+        self.hot_log.info("Moving asynchronously to pose: %s at speed %s", target_pose, speed)
+        return self._start_async_motion(future, lambda: self.rtde_c.moveL(target_pose, speed, acceleration, True))
+    
+    def move_joint(self, joint_positions: List[float], speed: Optional[float] = None,
+                   acceleration: Optional[float] = None) -> bool:
+        """
+        Move robot to joint positions (linear in joint space).
+        
+        Args:
+            joint_positions: Six joint angles in radians
+            speed: Joint speed of the leading axis in rad/s
+            acceleration: Joint acceleration of the leading axis in rad/s²
+        
+        Returns:
+            True if move command sent successfully
+        """
+        if not self.rtde_c:
+            self.hot_log.error("Not connected to robot")
+            return False
+        
+        if self._stop_latched():
+            return False
+        
+        joint_positions = np.asarray(joint_positions, dtype=np.float64).tolist()
+        speed = speed or self.default_joint_speed
+        acceleration = acceleration or self.default_joint_acceleration
+        
+        # Safety checks for physical robots
+        if self.robot_type == "physical":
+            if not self._check_joint_safety_limits(joint_positions, speed, acceleration,
+                                                   self._path_start(joint_space=True)):
+                self.metrics.rejections['joint'].inc()
+                return False
+        
+        try:
+            self.hot_log.info("Moving to joints: %s at speed %s", joint_positions, speed)
+            self._call(self.rtde_c.moveJ, joint_positions, speed, acceleration)
+            return True
+        except Exception as e:
+            self.hot_log.error("Joint move failed: %s", e)
+            return False
+    
+    def move_joint_async(self, joint_positions: List[float], speed: Optional[float] = None,
+                         acceleration: Optional[float] = None) -> MotionFuture:
+        """
+        Start a joint move and return immediately.
+        
+        Args:
+            joint_positions: Six joint angles in radians
+            speed: Joint speed of the leading axis in rad/s
+            acceleration: Joint acceleration of the leading axis in rad/s²
+        
+        Returns:
+            Future resolving when the motion completes; cancelling it calls stopJ
+        """
+        joint_positions = np.asarray(joint_positions, dtype=np.float64).tolist()
+        speed = speed or self.default_joint_speed
+        acceleration = acceleration or self.default_joint_acceleration
+        future = MotionFuture(f"moveJ to {joint_positions}", lambda: self._stop_motion('J'))
+        
+        if not self.rtde_c:
+            self.hot_log.error("Not connected to robot")
+            future._finish(False)
+            return future
+        
+        if self._stop_latched():
+            future._finish(False)
+            return future
+        
+        # Safety checks for physical robots
+        if self.robot_type == "physical":
+            if not self._check_joint_safety_limits(joint_positions, speed, acceleration,
+                                                   self._path_start(joint_space=True)):
+                self.metrics.rejections['joint'].inc()
+                future._finish(False)
+                return future
+        
+        self.hot_log.info("Moving asynchronously to joints: %s at speed %s", joint_positions, speed)
+        return self._start_async_motion(future, lambda: self.rtde_c.moveJ(joint_positions, speed, acceleration, True))
+    
+    def _start_async_motion(self, future: MotionFuture, send) -> MotionFuture:
+        """Send an asynchronous move and resolve ``future`` from a monitor thread."""
+        try:
+            if not self._call(self._send_async_motion, future, send):
+                future._finish(False)
+                return future
+        except Exception as e:
+            self.hot_log.error("Move failed: %s", e)
+            future._finish(False)
+            return future
+        
+        threading.Thread(target=self._monitor_async_motion, args=(future,),
+                         name='URMotionMonitor', daemon=True).start()
+        return future
+    
+    def _send_async_motion(self, future: MotionFuture, send) -> bool:
+        """Make ``future`` the active motion and send it (runs on the command owner thread)."""
+        # The robot drops a running asynchronous move when a new one is sent
+        previous, self._active_motion = self._active_motion, future
+        if previous is not None and not previous.done():
+            self.logger.info(f"Superseded: {previous.description}")
+            previous._finish(False)
+        
+        if not send():
+            self.logger.error(f"Robot rejected {future.description}")
+            return False
+        return True
+    
+    def _monitor_async_motion(self, future: MotionFuture) -> None:
+        """Poll getAsyncOperationProgress until the motion is done."""
+        while not future.done():
+            try:
+                progress = self._call(self.rtde_c.getAsyncOperationProgress)
+            except Exception as e:
+                self.logger.error(f"Failed to read motion progress: {e}")
+                future._finish(False)
+                return
+            
+            # Negative progress: no asynchronous operation running anymore
+            if progress < 0:
+                future._finish(True)
+                return
+            future.progress = progress
+            self.clock.sleep(self.async_poll_interval)
+    
+    def _stop_motion(self, space: str) -> None:
+        """Decelerate a linear ('L') or joint ('J') motion to a stop."""
+        try:
+            if space == 'J':
+                self.rtde_c.stopJ(2.0)  # Stop with 2 rad/s² deceleration
+            else:
+                self.rtde_c.stopL(2.0)  # Stop with 2 m/s² deceleration
+            self.logger.warning("Motion cancelled")
+        except Exception as e:
+            self.logger.error(f"Stop failed: {e}")
+    
+    def move_path(self, trajectory: Trajectory, speed: Optional[float] = None,
+                  acceleration: Optional[float] = None, blend: float = 0.0) -> bool:
+        """
+        Move robot linearly through every pose of a trajectory in one blended path.
+        
+        Args:
+            trajectory: Waypoints to visit in order
+            speed: Linear speed in m/s
+            acceleration: Linear acceleration in m/s²
+            blend: Blend radius between waypoints in meters
+        
+        Returns:
+            True if path command sent successfully
+        """
+        if not self.rtde_c:
+            self.hot_log.error("Not connected to robot")
+            return False
+        
+        if self._stop_latched():
+            return False
+        
+        speed = speed or self.default_speed
+        acceleration = acceleration or self.default_acceleration
+        
+        # Safety checks for physical robots
+        if self.robot_type == "physical":
+            for target_pose in trajectory.to_list():
+                if not self._check_safety_limits(target_pose, speed, acceleration):
+                    self.metrics.rejections['pose'].inc()
+                    return False
+            
+            # All segments at once (blends are checked along the unblended segments)
+            start_pose = self._path_start()
+            if start_pose is not None:
+                leaving = self.workspace.check_path(trajectory.poses, start_pose) if self.workspace.swept else []
+                if len(leaving):
+                    self.hot_log.error("Path leaves the workspace limits on the way to waypoint %s", int(leaving[0]))
+                    self.metrics.rejections['pose'].inc()
+                    return False
+                hits, zones = self.keep_out.check_path(trajectory.poses, start_pose)
+                if len(hits):
+                    self.hot_log.error("Path enters keep-out zone %s on the way to waypoint %s",
+                                       self.keep_out.names[zones[0]], int(hits[0]))
+                    self.metrics.rejections['pose'].inc()
+                    return False
+        
+        try:
+            self.logger.info(f"Moving through {len(trajectory)} waypoints at speed {speed}")
+            self._call(self.rtde_c.moveL, trajectory.to_path(speed, acceleration, blend))
+            return True
+        except Exception as e:
+            self.logger.error(f"Path move failed: {e}")
+            return False
+    
+    def servo_trajectory(self, trajectory: Trajectory, joint_space: bool = False,
+                         lookahead_time: float = 0.1, gain: float = 300.0) -> bool:
+        """
+        Stream a time-stamped trajectory with servo commands at the RTDE frequency.
+        
+        Args:
+            trajectory: TCP poses, or joint angles if joint_space is True
+            joint_space: Stream rows with servoJ instead of servoL
+            lookahead_time: Servo lookahead time in seconds (0.03 - 0.2)
+            gain: Servo proportional gain (100 - 2000)
+        
+        Returns:
+            True if the whole trajectory was streamed
+        """
+        if not self.rtde_c:
+            self.hot_log.error("Not connected to robot")
+            return False
+        
+        if self._stop_latched():
+            return False
+        
+        if len(trajectory) == 0:
+            return True
+        
+        dt = 1.0 / self.frequency
+        if joint_space:
+            times = trajectory.timestamps[0] + np.arange(int(trajectory.duration * self.frequency) + 1) * dt
+            samples = np.column_stack([np.interp(times, trajectory.timestamps, trajectory.poses[:, i])
+                                       for i in range(6)])
+        else:
+            samples = trajectory.resample(self.frequency).poses
+        
+        # Safety checks for physical robots (all samples at once)
+        if self.robot_type == "physical":
+            if not self._check_servo_samples(samples, joint_space, dt):
+                self.metrics.rejections['joint' if joint_space else 'pose'].inc()
+                return False
+        
+        try:
+            self.logger.info(f"Streaming {len(samples)} servo targets over {trajectory.duration:.2f}s")
+            # The whole stream is one command, so the servo loop is not interleaved with others
+            return self._call(self._servo_samples, samples.tolist(), joint_space, dt, lookahead_time, gain)
+        except Exception as e:
+            self.logger.error(f"Servo streaming failed: {e}")
+            return False
+    
+    def _servo_samples(self, targets: List[List[float]], joint_space: bool, dt: float,
+                       lookahead_time: float, gain: float) -> bool:
+        """Servo loop over precomputed targets (runs on the command owner thread)."""
+        servo = self.rtde_c.servoJ if joint_space else self.rtde_c.servoL
+        timer = self.servo_timer
+        timer.reset()
+        with self.realtime.gc_paused():
+            for target in targets:
+                if self._stop_latched():
+                    return False
+                t_start = self.rtde_c.initPeriod()
+                cycle_start = timer.start_cycle()
+                servo(target, 0.0, 0.0, dt, lookahead_time, gain)
+                sent = time.perf_counter()
+                timer.record('rtde', sent - cycle_start)
+                self.realtime.idle(dt - (sent - cycle_start))
+                self.rtde_c.waitPeriod(t_start)
+                timer.record('overshoot', max(time.perf_counter() - cycle_start - dt, 0.0))
+        self.rtde_c.servoStop()
+        self.logger.debug(" | ".join(timer.summary()))
+        return True
+    
+    @traced('move_velocity')
     def move_velocity(self, velocity: List[float], acceleration: Optional[float] = None, 
                      duration: float = 1.0) -> bool:
         """
@@ -213,12 +773,15 @@ class URRobotController:
             velocity: [vx, vy, vz, vrx, vry, vrz] in m/s and rad/s
             acceleration: Acceleration in m/s²
             duration: Duration to apply velocity in seconds
-            
+        
         Returns:
             True if velocity command sent successfully
         """
         if not self.rtde_c:
-            self.logger.error("Not connected to robot")
+            self.hot_log.error("Not connected to robot")
+            return False
+        
+        if self._stop_latched():
             return False
         
         acceleration = acceleration or self.default_acceleration
@@ -226,25 +789,47 @@ class URRobotController:
         # Safety checks for physical robots
         if self.robot_type == "physical":
             if not self._check_velocity_limits(velocity, acceleration):
+                self.metrics.rejections['velocity'].inc()
                 return False
         
         try:
-            self.rtde_c.speedL(velocity, acceleration, duration)
+            self._call(self.rtde_c.speedL, velocity, acceleration, duration)
             return True
         except Exception as e:
-            self.logger.error(f"Velocity move failed: {e}")
+            self.hot_log.error("Velocity move failed: %s", e)
             return False
     
+    def _path_start(self, joint_space: bool = False) -> Optional[List[float]]:
+        """Current TCP pose (or joints) a move starts from, or None when swept checks are off."""
+        if not (self.workspace.swept or (self.keep_out.enabled and self.keep_out.swept)):
+            return None
+        if not joint_space:
+            return self.get_tcp_pose()
+        state = self.state
+        if state is not None:
+            return list(state.joint_positions)
+        try:
+            return self.rtde_r.getActualQ()
+        except Exception as e:
+            self.hot_log.error("Failed to get joint positions: %s", e)
+            return None
+    
+    @traced('safety_check')
     def _check_safety_limits(self, target_pose: List[float], speed: float, 
-                           acceleration: float) -> bool:
-        """Check safety limits for physical robot movements."""
+                           acceleration: float, start_pose: Optional[List[float]] = None) -> bool:
+        """
+        Check safety limits for physical robot movements.
+        
+        With ``start_pose``, the linear move from there is also checked
+        against the workspace limits (TCP and tool points along the way).
+        """
         # Check speed and acceleration limits
         if speed > self.max_velocity:
-            self.logger.error(f"Speed {speed} exceeds maximum {self.max_velocity}")
+            self.hot_log.error("Speed %s exceeds maximum %s", speed, self.max_velocity)
             return False
         
         if acceleration > self.max_acceleration:
-            self.logger.error(f"Acceleration {acceleration} exceeds maximum {self.max_acceleration}")
+            self.hot_log.error("Acceleration %s exceeds maximum %s", acceleration, self.max_acceleration)
             return False
         
         # Check workspace limits if configured
@@ -253,41 +838,256 @@ class URRobotController:
             x, y, z = target_pose[:3]
             
             if 'x' in workspace and not (workspace['x'][0] <= x <= workspace['x'][1]):
-                self.logger.error(f"X position {x} outside workspace limits {workspace['x']}")
+                self.hot_log.error("X position %s outside workspace limits %s", x, workspace['x'])
                 return False
             
             if 'y' in workspace and not (workspace['y'][0] <= y <= workspace['y'][1]):
-                self.logger.error(f"Y position {y} outside workspace limits {workspace['y']}")
+                self.hot_log.error("Y position %s outside workspace limits %s", y, workspace['y'])
                 return False
             
             if 'z' in workspace and not (workspace['z'][0] <= z <= workspace['z'][1]):
-                self.logger.error(f"Z position {z} outside workspace limits {workspace['z']}")
+                self.hot_log.error("Z position %s outside workspace limits %s", z, workspace['z'])
+                return False
+            
+            if (start_pose is not None and self.workspace.swept
+                    and len(self.workspace.check_path([target_pose], start_pose))):
+                self.hot_log.error("Path from %s to %s leaves the workspace limits", start_pose, target_pose)
+                return False
+        
+        # Keep-out zones, along the way when the start pose is known
+        if self.keep_out.enabled:
+            if start_pose is not None and self.keep_out.swept:
+                hits, zones = self.keep_out.check_path([target_pose], start_pose)
+            else:
+                hits, zones = self.keep_out.check_poses([target_pose])
+            if len(hits):
+                self.hot_log.error("Move to %s enters keep-out zone %s", target_pose, self.keep_out.names[zones[0]])
+                return False
+        
+        # Check the pose has an IK solution if enabled
+        if self.check_reachability and self.kinematics:
+            if not self.kinematics.is_reachable(target_pose):
+                self.hot_log.error("Pose %s is not reachable by a %s", target_pose, self.robot_model)
                 return False
         
         return True
     
+    def _check_joint_safety_limits(self, joint_positions: List[float], speed: float,
+                                   acceleration: float, start_joints: Optional[List[float]] = None) -> bool:
+        """
+        Check safety limits for physical robot joint movements.
+        
+        With ``start_joints``, the joint move from there is also checked
+        against the workspace limits (the TCP follows a curve).
+        """
+        if speed > float(np.min(self.motion_limits.joint_velocity)):
+            self.hot_log.error("Joint speed %s exceeds maximum %s", speed, self.motion_limits.joint_velocity.tolist())
+            return False
+        
+        if acceleration > float(np.min(self.motion_limits.joint_acceleration)):
+            self.hot_log.error("Joint acceleration %s exceeds maximum %s", acceleration,
+                               self.motion_limits.joint_acceleration.tolist())
+            return False
+        
+        # The workspace limits apply to the TCP pose the joints lead to
+        if self.kinematics:
+            if start_joints is not None and self.workspace.swept and len(self.workspace.check_joint_path(
+                    [joint_positions], start_joints, self.kinematics)):
+                self.hot_log.error("Joint move from %s to %s leaves the workspace limits",
+                                   start_joints, joint_positions)
+                return False
+            if start_joints is not None and self.keep_out.enabled and self.keep_out.swept:
+                hits, zones = self.keep_out.check_joint_path([joint_positions], start_joints, self.kinematics)
+                if len(hits):
+                    self.hot_log.error("Joint move to %s enters keep-out zone %s",
+                                       joint_positions, self.keep_out.names[zones[0]])
+                    return False
+            target_pose = self.kinematics.forward(joint_positions).tolist()
+            return self._check_safety_limits(target_pose, 0.0, 0.0)
+        
+        return True
+    
+    @traced('safety_check')
+    def _check_servo_samples(self, samples: np.ndarray, joint_space: bool, dt: float) -> bool:
+        """
+        Check servo targets sent every ``dt`` seconds.
+        
+        Joint targets are checked against the joint velocity limits and,
+        through forward kinematics, like TCP targets: workspace, keep-out
+        zones and the TCP speed between consecutive targets.
+        """
+        if joint_space:
+            joint_speed = np.abs(np.diff(samples, axis=0)) / dt
+            too_fast = np.flatnonzero((joint_speed > self.motion_limits.joint_velocity).any(axis=1))
+            if len(too_fast):
+                self.hot_log.error("Joint speed %s exceeds maximum %s before target %s",
+                                   joint_speed[too_fast[0]].tolist(), self.motion_limits.joint_velocity.tolist(),
+                                   int(too_fast[0]) + 1)
+                return False
+            if not self.kinematics:
+                return True
+            samples = self.kinematics.forward(samples).reshape(-1, 6)
+        
+        tcp_speed = np.linalg.norm(np.diff(samples[:, :3], axis=0), axis=1) / dt
+        too_fast = np.flatnonzero(tcp_speed > self.max_velocity)
+        if len(too_fast):
+            self.hot_log.error("TCP speed %s exceeds maximum %s before target %s",
+                               float(tcp_speed[too_fast[0]]), self.max_velocity, int(too_fast[0]) + 1)
+            return False
+        
+        # Forward kinematics results are reachable by construction
+        return self._check_pose_samples(samples, check_reach=not joint_space)
+    
+    @traced('safety_check')
+    def _check_pose_samples(self, samples: np.ndarray, check_reach: bool = True) -> bool:
+        """Check a batch of TCP poses (e.g. servo targets) against the workspace, reach and keep-out zones."""
+        outside = self.workspace.check_poses(samples) if self.workspace.enabled else []
+        if len(outside):
+            self.hot_log.error("Pose %s outside workspace limits", samples[outside[0]].tolist())
+            return False
+        
+        if check_reach and self.check_reachability and self.kinematics:
+            unreachable = np.flatnonzero(~self.kinematics.is_reachable(samples))
+            if len(unreachable):
+                self.hot_log.error("Pose %s is not reachable by a %s", samples[unreachable[0]].tolist(),
+                                   self.robot_model)
+                return False
+        
+        hits, zones = self.keep_out.check_poses(samples)
+        if len(hits):
+            self.hot_log.error("Pose %s is in keep-out zone %s", samples[hits[0]].tolist(),
+                               self.keep_out.names[zones[0]])
+            return False
+        
+        return True
+    
+    @traced('safety_check')
     def _check_velocity_limits(self, velocity: List[float], acceleration: float) -> bool:
         """Check velocity limits for physical robot."""
         # Check if any velocity component exceeds limits
         linear_velocity = (velocity[0]**2 + velocity[1]**2 + velocity[2]**2)**0.5
         
         if linear_velocity > self.max_velocity:
-            self.logger.error(f"Linear velocity {linear_velocity} exceeds maximum {self.max_velocity}")
+            self.hot_log.error("Linear velocity %s exceeds maximum %s", linear_velocity, self.max_velocity)
             return False
         
         if acceleration > self.max_acceleration:
-            self.logger.error(f"Acceleration {acceleration} exceeds maximum {self.max_acceleration}")
+            self.hot_log.error("Acceleration %s exceeds maximum %s", acceleration, self.max_acceleration)
             return False
         
         return True
     
+    def reset_emergency_stop(self) -> bool:
+        """
+        Accept motion commands again after an emergency stop.
+        
+        Returns:
+            True if motion commands are accepted again
+        """
+        if self.stop_channel:
+            if not self.stop_channel.reset():
+                return False
+            self.logger.info("Emergency stop reset")
+        return True
+    
+    def _stop_latched(self) -> bool:
+        """Refuse motion while an emergency stop is active."""
+        if self.stop_channel and self.stop_channel.triggered:
+            self.hot_log.error("Emergency stop active, motion command refused")
+            return True
+        return False
+    
     def is_connected(self) -> bool:
         """Check if robot is connected."""
         return (self.rtde_c is not None and self.rtde_c.isConnected() and 
                 self.rtde_r is not None and self.rtde_r.isConnected())
     
+    def is_settled(self) -> bool:
+        """
+        Check if the robot is at rest on its target.
+        
+        The robot is settled when the controller reports it steady, the TCP
+        speed is below ``settle_speed_tolerance`` and the actual TCP pose is
+        within the position/orientation tolerance of the target TCP pose.
+        """
+        if not (self.rtde_c and self.rtde_r):
+            return False
+        
+        try:
+            if not self._call(self.rtde_c.isSteady):
+                return False
+            
+            state = self.state
+            if state is not None:
+                speed, target, actual = state.tcp_speed, state.target_tcp_pose, state.tcp_pose
+            else:
+                speed = self.rtde_r.getActualTCPSpeed()
+                target = self.rtde_r.getTargetTCPPose()
+                actual = self.rtde_r.getActualTCPPose()
+            
+            if sum(v * v for v in speed[:3]) ** 0.5 > self.settle_speed_tolerance:
+                return False
+            
+            position_error = sum((t - a) ** 2 for t, a in zip(target[:3], actual[:3])) ** 0.5
+            if position_error > self.settle_position_tolerance:
+                return False
+            rotation = compose_rotvecs([-r for r in target[3:]], actual[3:])
+            return float((rotation ** 2).sum() ** 0.5) <= self.settle_orientation_tolerance
+        except Exception as e:
+            self.logger.error(f"Failed to read robot state: {e}")
+            return False
+    
+    def wait_until_settled(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the current motion has completed.
+        
+        Returns as soon as ``is_settled`` holds for ``settle_samples``
+        consecutive polls, instead of sleeping for a fixed time.
+        
+        Args:
+            timeout: Maximum time to wait in seconds (default: movement.settle.timeout)
+        
+        Returns:
+            True if the robot settled, False on timeout or if not connected
+        """
+        if not self.is_connected():
+            self.hot_log.error("Not connected to robot")
+            return False
+        
+        timeout = self.settle_timeout if timeout is None else timeout
+        start = self.clock.monotonic()
+        deadline = start + timeout
+        settled_polls = 0
+        last_sequence = -1
+        
+        while True:
+            # Only count fresh state snapshots towards the settled samples
+            state = self.state
+            sequence = state.sequence if state is not None else None
+            if sequence is None or sequence != last_sequence:
+                last_sequence = sequence
+                settled_polls = settled_polls + 1 if self.is_settled() else 0
+            if settled_polls >= self.settle_samples:
+                self.logger.debug(f"Settled after {self.clock.monotonic() - start:.3f}s")
+                return True
+            if self.clock.monotonic() >= deadline:
+                self.logger.warning(f"Robot did not settle within {timeout}s")
+                return False
+            self.clock.sleep(self.settle_poll_interval)
+    
     def emergency_stop(self) -> bool:
-        """Emergency stop the robot."""
+        """
+        Emergency stop the robot.
+        
+        With the stop channel running this only hands the request to the stop
+        thread and returns immediately, so it is safe from signal handlers and
+        other threads. Motion commands are refused until ``reset_emergency_stop``.
+        """
+        self.metrics.emergency_stops.inc()
+        if self.stop_channel and self.stop_channel.running:
+            self.stop_channel.trigger("emergency_stop()")
+            return True
+        
         if not self.rtde_c:
             return False
         
@@ -298,6 +1098,33 @@ class URRobotController:
         except Exception as e:
             self.logger.error(f"Emergency stop failed: {e}")
             return False
+    
+    def stop_motion(self, deceleration: float = 2.0) -> bool:
+        """
+        Decelerate the current motion (speedL, moveL or asynchronous move) to rest.
+        
+        Unlike ``emergency_stop`` this does not latch: the next motion command
+        is accepted. Like other stops it bypasses the command queue.
+        
+        Args:
+            deceleration: Linear deceleration in m/s²
+        
+        Returns:
+            True if the stop was sent
+        """
+        if not self.rtde_c:
+            return False
+        
+        active = self._active_motion
+        try:
+            self.rtde_c.stopL(deceleration)
+        except Exception as e:
+            self.logger.error(f"Stop failed: {e}")
+            return False
+        if active is not None and not active.done():
+            self.logger.info(f"Stopped: {active.description}")
+            active._finish(False)
+        return True
 
 
 class URCommandProcessor:
@@ -307,9 +1134,44 @@ class URCommandProcessor:
         """Initialize with a robot controller."""
         self.controller = controller
         self.logger = logging.getLogger('URCommandProcessor')
+        self.hot_log = HotPathLogger.from_config(self.logger, self.controller.config)
+        
+        # Change detection for the streaming loops
+        movement = self.controller.config.get('movement', {})
+        deadband = movement.get('deadband', {})
+        self.position_deadband = deadband.get('position', 0.0005)
+        self.orientation_deadband = deadband.get('orientation', 0.002)
+        self.velocity_deadband = deadband.get('velocity', 0.001)
+        self.refresh_interval = movement.get('refresh_interval', 0.0)
+        
+        # Delta execution: "velocity" (speedL per delta) or "dead_reckoned" (moveL to an integrated pose)
+        self.delta_mode = movement.get('delta_mode', 'velocity')
+        dead_reckoning = movement.get('dead_reckoning', {})
+        self.resync_interval = dead_reckoning.get('resync_interval', 2.0)
+        self.drift_position = dead_reckoning.get('drift_position', 0.002)
+        self.drift_orientation = dead_reckoning.get('drift_orientation', 0.01)
+        self.commanded_pose: Optional[List[float]] = None
+        self._last_resync = 0.0
+        
+        # Synchronous jobs wait for the robot to settle instead of sleeping responsiveness
+        self.settle = movement.get('settle', {}).get('enabled', False)
+        
+        # Command freshness (t/seq/ttl fields) and latency statistics
+        self.tracker = CommandTracker.from_config(self.controller.config)
+        
+        # Deadman for the streaming loops: stop when the producer goes silent
+        self.watchdog = CommandWatchdog.from_config(self.controller.config)
+        
+        # Per-loop timing histograms (dumped on SIGUSR1, exported at exit per the timing config)
+        self.timers = {loop: LoopTimer(loop) for loop in (
+            'synchronous_commands', 'asynchronous_commands', 'synchronous_poses', 'asynchronous_poses')}
+        install_dump_signal(self.controller.config)
+        
+        self.metrics = ProcessorMetrics(self.controller.robot_ip)
+        self.watchdog.add_listener(lambda silence: self.metrics.watchdog_trips.inc())
     
     def process_synchronous_commands(self, json_file: str, log_file: Optional[str] = None,
-                                   responsiveness: float = 1.0) -> None:
+                                   responsiveness: float = 1.0, settle: Optional[bool] = None) -> None:
         """
         Process commands from JSON file synchronously.
         
@@ -317,6 +1179,9 @@ class URCommandProcessor:
             json_file: Path to JSONL file with delta commands
             log_file: Optional log file path
             responsiveness: Time between commands in seconds
+            settle: In dead-reckoned delta mode, wait for each move to settle
+                (timing out after ``responsiveness``) instead of sleeping;
+                defaults to movement.settle.enabled
         """
         if not self.controller.is_connected():
             self.logger.error("Robot not connected")
@@ -326,6 +1191,17 @@ class URCommandProcessor:
         if log_file:
             log_f = open(log_file, 'a')
         
+        # Seed the dead-reckoned pose from the robot at the start of every job
+        self.commanded_pose = None
+        self.tracker.reset()
+        timer = self.timers['synchronous_commands']
+        timer.reset()
+        
+        # speedL deltas keep moving, only dead-reckoned moveL deltas can settle
+        if settle is None:
+            settle = self.settle
+        settle = settle and self.delta_mode == 'dead_reckoned'
+        
         try:
             with open(json_file, 'r') as f:
                 for line_num, line in enumerate(f, 1):
@@ -333,16 +1209,28 @@ class URCommandProcessor:
                         continue
                     
                     try:
-                        cmd = json.loads(line)
-                        if self._execute_delta_command(cmd, log_f):
-                            time.sleep(responsiveness)
+                        cycle_start = timer.start_cycle()
+                        with span('decode'):
+                            cmd = json.loads(line)
+                        if not self.accept(cmd):
+                            continue
+                        self.tracker.dispatched(cmd)
+                        parsed = time.perf_counter()
+                        timer.record('parse', parsed - cycle_start)
+                        executed = self._execute_delta_command(cmd, log_f)
+                        timer.record('rtde', time.perf_counter() - parsed)
+                        if executed:
+                            self._wait_after_move(responsiveness, settle, timer)
                         else:
                             self.logger.error(f"Failed to execute command on line {line_num}")
                             break
                     except json.JSONDecodeError as e:
-                        self.logger.error(f"Invalid JSON on line {line_num}: {e}")
+                        self.hot_log.error("Invalid JSON on line %d: %s", line_num, e)
+                        continue
+                    except (TypeError, ValueError) as e:
+                        self.hot_log.error("Invalid command on line %d: %s", line_num, e)
                         continue
-                        
+        
         except FileNotFoundError:
             self.logger.error(f"Command file not found: {json_file}")
         except KeyboardInterrupt:
@@ -350,56 +1238,103 @@ class URCommandProcessor:
         finally:
             if log_f:
                 log_f.close()
+            self.log_tracking()
+            self.hot_log.flush()
+            self._log_timing(timer)
     
-    def process_asynchronous_commands(self, json_file: str, responsiveness: float = 1.0) -> None:
+    def process_asynchronous_commands(self, json_file: str, responsiveness: float = 1.0,
+                                      coalescing: Optional[str] = None) -> None:
         """
         Process commands from JSON file asynchronously (streaming).
         
         Args:
             json_file: Path to JSONL file
             responsiveness: Time between checks in seconds
+            coalescing: How deltas arriving between checks are combined
+                ("latest", "sum" or "rate_limited_sum"); defaults to movement.coalescing.policy
         """
         if not self.controller.is_connected():
             self.logger.error("Robot not connected")
             return
         
+        coalescer = DeltaCoalescer.from_config(self.controller.config, coalescing)
+        self.tracker.reset()
+        self.watchdog.reset()
+        timer = self.timers['asynchronous_commands']
+        timer.reset()
+        clock = self.controller.clock
+        
         try:
-            # Open file and seek to end
-            with open(json_file, 'r') as f:
+            # Open file and seek to end (real-time scheduling for the loop if enabled)
+            with open(json_file, 'r') as f, self.controller.realtime.thread('stream'):
                 f.seek(0, 2)  # Seek to end
                 
                 current_velocity = [0.0] * 6
+                sent_velocity = None
+                last_sent = 0.0
                 
                 while True:
-                    # Read new lines
-                    lines = f.readlines()
-                    if lines:
+                    # Read new lines (all of them, so sequence gaps and expiry are seen)
+                    cycle_start = timer.start_cycle()
+                    accepted = []
+                    for line in f.readlines():
+                        if not line.strip():
+                            continue
                         try:
-                            # Use the last command
-                            cmd = json.loads(lines[-1])
-                            current_velocity = [
+                            with span('decode'):
+                                cmd = json.loads(line)
+                            if not self.accept(cmd):
+                                continue
+                            coalescer.push([
                                 float(cmd.get('dx', 0.0)),
                                 float(cmd.get('dy', 0.0)),
                                 float(cmd.get('dz', 0.0)),
                                 float(cmd.get('drx', 0.0)),
                                 float(cmd.get('dry', 0.0)),
                                 float(cmd.get('drz', 0.0))
-                            ]
+                            ])
+                            accepted.append(cmd)
                         except (json.JSONDecodeError, ValueError) as e:
-                            self.logger.error(f"Invalid command: {e}")
+                            self.hot_log.error("Invalid command: %s", e)
+                    timer.record('parse', time.perf_counter() - cycle_start)
+                    
+                    if accepted:
+                        self.watchdog.feed(clock.monotonic())
+                    elif self.watchdog.check(clock.monotonic()):
+                        # Producer went silent: drop what is queued and ramp down to zero
+                        coalescer.reset()
+                        current_velocity = sent_velocity = [0.0] * 6
+                        self.controller.stop_motion(self.watchdog.deceleration)
+                        last_sent = clock.monotonic()
                     
-                    # Apply current velocity
-                    self.logger.debug(f"Applying velocity: {current_velocity}")
-                    self.controller.move_velocity(current_velocity, duration=responsiveness)
-                    time.sleep(responsiveness)
+                    command = coalescer.next_command()
+                    if command is not None:
+                        current_velocity = command
                     
+                    # Apply current velocity only if it changed or needs refreshing
+                    if self.needs_send(self.velocity_changed(current_velocity, sent_velocity), last_sent):
+                        self.hot_log.debug("Applying velocity: %s", current_velocity)
+                        send_start = time.perf_counter()
+                        if self.controller.move_velocity(current_velocity, duration=responsiveness):
+                            sent_velocity = current_velocity
+                            last_sent = clock.monotonic()
+                            self.metrics.sent.inc()
+                        timer.record('rtde', time.perf_counter() - send_start)
+                    for cmd in accepted:
+                        self.tracker.dispatched(cmd)
+                    timer.sleep(self.watchdog.sleep_time(responsiveness, clock.monotonic()), self.controller.realtime.sleep)
+        
         except FileNotFoundError:
             self.logger.error(f"Command file not found: {json_file}")
         except KeyboardInterrupt:
             self.logger.info("Interrupted by user")
+        finally:
+            self.log_tracking()
+            self.hot_log.flush()
+            self._log_timing(timer)
     
     def process_synchronous_poses(self, json_file: str, log_file: Optional[str] = None,
-                                 responsiveness: float = 1.0) -> None:
+                                 responsiveness: float = 1.0, settle: Optional[bool] = None) -> None:
         """
         Process absolute pose commands from JSON file synchronously.
         
@@ -407,6 +1342,8 @@ class URCommandProcessor:
             json_file: Path to JSONL file with pose commands
             log_file: Optional log file path
             responsiveness: Time between commands in seconds
+            settle: Wait for each move to settle (timing out after
+                ``responsiveness``) instead of sleeping; defaults to movement.settle.enabled
         """
         if not self.controller.is_connected():
             self.logger.error("Robot not connected")
@@ -416,6 +1353,10 @@ class URCommandProcessor:
         if log_file:
             log_f = open(log_file, 'a')
         
+        self.tracker.reset()
+        timer = self.timers['synchronous_poses']
+        timer.reset()
+        
         try:
             with open(json_file, 'r') as f:
                 for line_num, line in enumerate(f, 1):
@@ -423,16 +1364,28 @@ class URCommandProcessor:
                         continue
                     
                     try:
-                        cmd = json.loads(line)
-                        if self._execute_pose_command(cmd, log_f):
-                            time.sleep(responsiveness)
+                        cycle_start = timer.start_cycle()
+                        with span('decode'):
+                            cmd = json.loads(line)
+                        if not self.accept(cmd):
+                            continue
+                        self.tracker.dispatched(cmd)
+                        parsed = time.perf_counter()
+                        timer.record('parse', parsed - cycle_start)
+                        executed = self._execute_pose_command(cmd, log_f)
+                        timer.record('rtde', time.perf_counter() - parsed)
+                        if executed:
+                            self._wait_after_move(responsiveness, settle, timer)
                         else:
                             self.logger.error(f"Failed to execute command on line {line_num}")
                             break
                     except json.JSONDecodeError as e:
-                        self.logger.error(f"Invalid JSON on line {line_num}: {e}")
+                        self.hot_log.error("Invalid JSON on line %d: %s", line_num, e)
                         continue
-                        
+                    except (TypeError, ValueError) as e:
+                        self.hot_log.error("Invalid command on line %d: %s", line_num, e)
+                        continue
+        
         except FileNotFoundError:
             self.logger.error(f"Command file not found: {json_file}")
         except KeyboardInterrupt:
@@ -440,6 +1393,60 @@ class URCommandProcessor:
         finally:
             if log_f:
                 log_f.close()
+            self.log_tracking()
+            self.hot_log.flush()
+            self._log_timing(timer)
+    
+    def process_timed_poses(self, json_file: str, log_file: Optional[str] = None,
+                            profile: str = 'trapezoidal') -> None:
+        """
+        Execute absolute pose commands as one time-parameterized servo trajectory.
+        
+        Instead of a moveL at default speed plus a fixed sleep per line, the
+        whole pose list (starting from the current TCP pose) is timed against
+        the controller's motion limits and streamed at the RTDE frequency.
+        
+        Args:
+            json_file: Path to JSONL file with pose commands
+            log_file: Optional log file path
+            profile: "trapezoidal" or "scurve"
+        """
+        if not self.controller.is_connected():
+            self.logger.error("Robot not connected")
+            return
+        
+        try:
+            waypoints = Trajectory.from_jsonl(json_file)
+        except FileNotFoundError:
+            self.logger.error(f"Command file not found: {json_file}")
+            return
+        except (json.JSONDecodeError, ValueError) as e:
+            self.logger.error(f"Invalid command file {json_file}: {e}")
+            return
+        
+        current_pose = self.controller.get_tcp_pose()
+        if current_pose is None:
+            return
+        
+        waypoints = Trajectory.concatenate([Trajectory([current_pose]), waypoints])
+        trajectory = parameterize_waypoints(waypoints, self.controller.motion_limits,
+                                            profile, self.controller.frequency)
+        self.logger.info(f"Planned {len(waypoints) - 1} segments in {trajectory.duration:.2f}s ({profile})")
+        
+        if log_file:
+            with open(log_file, 'a') as log_f:
+                for target_pose in waypoints[1:].to_list():
+                    log_entry = {
+                        'timestamp': self.controller.clock.time(),
+                        'target_pose': target_pose,
+                        'command_type': 'absolute_pose'
+                    }
+                    log_f.write(json.dumps(log_entry) + '\n')
+        
+        try:
+            self.controller.servo_trajectory(trajectory)
+        except KeyboardInterrupt:
+            self.logger.info("Interrupted by user")
     
     def process_asynchronous_poses(self, json_file: str, responsiveness: float = 1.0) -> None:
         """
@@ -453,20 +1460,33 @@ class URCommandProcessor:
             self.logger.error("Robot not connected")
             return
         
+        self.tracker.reset()
+        self.watchdog.reset()
+        timer = self.timers['asynchronous_poses']
+        timer.reset()
+        clock = self.controller.clock
+        
         try:
-            # Open file and seek to end
-            with open(json_file, 'r') as f:
+            # Open file and seek to end (real-time scheduling for the loop if enabled)
+            with open(json_file, 'r') as f, self.controller.realtime.thread('stream'):
                 f.seek(0, 2)  # Seek to end
                 
                 current_target_pose = None
+                sent_pose = None
+                last_sent = 0.0
                 
                 while True:
-                    # Read new lines
-                    lines = f.readlines()
-                    if lines:
+                    # Read new lines (the last accepted command is the target)
+                    cycle_start = timer.start_cycle()
+                    accepted = []
+                    for line in f.readlines():
+                        if not line.strip():
+                            continue
                         try:
-                            # Use the last command
-                            cmd = json.loads(lines[-1])
+                            with span('decode'):
+                                cmd = json.loads(line)
+                            if not self.accept(cmd):
+                                continue
                             current_target_pose = [
                                 float(cmd.get('x', 0.0)),
                                 float(cmd.get('y', 0.0)),
@@ -475,20 +1495,133 @@ class URCommandProcessor:
                                 float(cmd.get('ry', 0.0)),
                                 float(cmd.get('rz', 0.0))
                             ]
+                            accepted.append(cmd)
                         except (json.JSONDecodeError, ValueError) as e:
-                            self.logger.error(f"Invalid command: {e}")
+                            self.hot_log.error("Invalid command: %s", e)
+                    timer.record('parse', time.perf_counter() - cycle_start)
                     
-                    # Move to current target pose if available
-                    if current_target_pose:
-                        self.logger.debug(f"Moving to pose: {current_target_pose}")
-                        self.controller.move_linear(current_target_pose)
+                    if accepted:
+                        self.watchdog.feed(clock.monotonic())
+                    elif self.watchdog.check(clock.monotonic()):
+                        # Producer went silent: hold position until a fresh target arrives
+                        self.controller.stop_motion(self.watchdog.deceleration)
+                        current_target_pose = sent_pose = None
                     
-                    time.sleep(responsiveness)
+                    # Move to current target pose if available and it changed or needs refreshing
+                    if current_target_pose and self.needs_send(
+                            self.pose_changed(current_target_pose, sent_pose), last_sent):
+                        self.hot_log.debug("Moving to pose: %s", current_target_pose)
+                        send_start = time.perf_counter()
+                        if self.controller.move_linear(current_target_pose):
+                            sent_pose = current_target_pose
+                            last_sent = clock.monotonic()
+                            self.metrics.sent.inc()
+                        timer.record('rtde', time.perf_counter() - send_start)
+                    for cmd in accepted:
+                        self.tracker.dispatched(cmd)
                     
+                    timer.sleep(self.watchdog.sleep_time(responsiveness, clock.monotonic()), self.controller.realtime.sleep)
+        
         except FileNotFoundError:
             self.logger.error(f"Command file not found: {json_file}")
         except KeyboardInterrupt:
             self.logger.info("Interrupted by user")
+        finally:
+            self.log_tracking()
+            self.hot_log.flush()
+            self._log_timing(timer)
+    
+    def accept(self, cmd: Dict[str, Any]) -> bool:
+        """Run a command through the tracker and count it."""
+        if self.tracker.accept(cmd):
+            self.metrics.accepted.inc()
+            return True
+        self.metrics.dropped.inc()
+        return False
+    
+    def log_tracking(self) -> None:
+        """Log command freshness and latency statistics if any commands were tracked."""
+        self.tracker.hot_log.flush()
+        if self.tracker.received:
+            self.logger.info(f"Commands: {self.tracker.summary()}")
+    
+    def _log_timing(self, timer: LoopTimer) -> None:
+        """Log the cycle timings of a finished loop."""
+        for line in timer.summary():
+            self.logger.info(f"Timing {line}")
+    
+    def _wait_after_move(self, responsiveness: float, settle: Optional[bool],
+                         timer: Optional[LoopTimer] = None) -> None:
+        """Sleep ``responsiveness`` or, with settling on, wait at most that long for the robot to settle."""
+        if settle is None:
+            settle = self.settle
+        if settle:
+            self.controller.wait_until_settled(timeout=responsiveness)
+        elif timer:
+            timer.sleep(responsiveness, self.controller.clock.sleep)
+        else:
+            self.controller.clock.sleep(responsiveness)
+    
+    def needs_send(self, changed: bool, last_sent: float, now: Optional[float] = None) -> bool:
+        """Decide whether a streaming loop should issue its current command (times on the controller clock)."""
+        if changed:
+            return True
+        now = self.controller.clock.monotonic() if now is None else now
+        return self.refresh_interval > 0 and now - last_sent >= self.refresh_interval
+    
+    def pose_changed(self, target_pose: List[float], sent_pose: Optional[List[float]]) -> bool:
+        """Check if a pose target moved outside the position/orientation deadband."""
+        if sent_pose is None:
+            return True
+        
+        position_error = sum((target_pose[i] - sent_pose[i]) ** 2 for i in range(3)) ** 0.5
+        if position_error > self.position_deadband:
+            return True
+        
+        # Angle of the rotation between the two orientations
+        rotation = compose_rotvecs([-r for r in sent_pose[3:]], target_pose[3:])
+        return float((rotation ** 2).sum() ** 0.5) > self.orientation_deadband
+    
+    def velocity_changed(self, velocity: List[float], sent_velocity: Optional[List[float]]) -> bool:
+        """Check if a velocity command moved outside the velocity deadband."""
+        if sent_velocity is None:
+            return True
+        return max(abs(v - s) for v, s in zip(velocity, sent_velocity)) > self.velocity_deadband
+    
+    def reckoned_pose(self) -> Optional[List[float]]:
+        """
+        Get the pose the next delta is applied to in dead-reckoned mode.
+        
+        The commanded pose is seeded from the robot once and then integrated
+        from the deltas themselves. Every ``resync_interval`` seconds it is
+        compared with the actual TCP pose and re-seeded if the two drifted
+        apart by more than ``drift_position``/``drift_orientation``.
+        """
+        now = self.controller.clock.monotonic()
+        if self.commanded_pose is not None:
+            if not self.resync_interval or now - self._last_resync < self.resync_interval:
+                return self.commanded_pose
+        
+        actual_pose = self.controller.get_tcp_pose()
+        if actual_pose is None:
+            return None
+        self._last_resync = now
+        
+        if self.commanded_pose is None:
+            self.logger.debug(f"Seeded commanded pose: {actual_pose}")
+            self.commanded_pose = list(actual_pose)
+        elif self._drifted(actual_pose):
+            self.logger.warning(f"Commanded pose drifted from actual pose, resyncing to {actual_pose}")
+            self.commanded_pose = list(actual_pose)
+        return self.commanded_pose
+    
+    def _drifted(self, actual_pose: List[float]) -> bool:
+        """Check if the commanded pose moved outside the drift thresholds."""
+        position_error = sum((a - c) ** 2 for a, c in zip(actual_pose[:3], self.commanded_pose[:3])) ** 0.5
+        if position_error > self.drift_position:
+            return True
+        rotation = compose_rotvecs([-r for r in self.commanded_pose[3:]], actual_pose[3:])
+        return float((rotation ** 2).sum() ** 0.5) > self.drift_orientation
     
     def _execute_pose_command(self, cmd: Dict, log_f: Optional[TextIO] = None) -> bool:
         """Execute an absolute pose movement command."""
@@ -506,65 +1639,93 @@ class URCommandProcessor:
             # Log command
             if log_f:
                 log_entry = {
-                    'timestamp': time.time(),
+                    'timestamp': self.controller.clock.time(),
                     'target_pose': target_pose,
                     'command_type': 'absolute_pose'
                 }
-                log_f.write(json.dumps(log_entry) + '\n')
-                log_f.flush()
+                with span('log_write'):
+                    log_f.write(json.dumps(log_entry) + '\n')
+                    log_f.flush()
             
             # Execute movement
             return self.controller.move_linear(target_pose)
-            
+        
         except (ValueError, KeyError) as e:
-            self.logger.error(f"Invalid command format: {e}")
+            self.hot_log.error("Invalid command format: %s", e)
             return False
     
+    def plan_delta(self, cmd: Dict, log_f: Optional[TextIO] = None) -> Optional[Tuple[List[float], List[float]]]:
+        """
+        Turn a delta command into its target pose, log it and safety-check it.
+        
+        Shared by the blocking and async processors, which only differ in how
+        they then execute the move.
+        
+        Args:
+            cmd: Delta command (dx, dy, dz, drx, dry, drz)
+            log_f: Optional command log to append the entry to
+        
+        Returns:
+            Tuple of the target pose and the delta, or None if the current pose
+            is unavailable or a velocity-mode delta fails the safety checks
+        
+        Raises:
+            ValueError, TypeError: If a delta field is not a number
+        """
+        delta = [float(cmd.get(key, 0.0)) for key in DELTA_KEYS]
+        
+        # Get current pose (dead-reckoned mode reuses the last commanded pose)
+        if self.delta_mode == 'dead_reckoned':
+            current_pose = self.reckoned_pose()
+        else:
+            current_pose = self.controller.get_tcp_pose()
+        if current_pose is None:
+            return None
+        
+        # Calculate target pose (rotation deltas are composed, not added)
+        target_pose = apply_delta(current_pose, delta).tolist()
+        
+        # Log command
+        if log_f:
+            log_entry = {
+                'timestamp': self.controller.clock.time(),
+                'target_pose': target_pose,
+                'delta': delta,
+                'delta_mode': self.delta_mode
+            }
+            with span('log_write'):
+                log_f.write(json.dumps(log_entry) + '\n')
+                log_f.flush()
+        
+        # speedL has no target, so check the pose the delta leads to (and the way there)
+        controller = self.controller
+        if self.delta_mode != 'dead_reckoned' and controller.robot_type == "physical":
+            if not controller._check_safety_limits(target_pose, 0.0, 0.0, current_pose):
+                controller.metrics.rejections['pose'].inc()
+                return None
+        return target_pose, delta
+    
     def _execute_delta_command(self, cmd: Dict, log_f: Optional[TextIO] = None) -> bool:
         """Execute a delta movement command."""
         try:
-            # Extract delta values
-            dx = float(cmd.get('dx', 0.0))
-            dy = float(cmd.get('dy', 0.0))
-            dz = float(cmd.get('dz', 0.0))
-            drx = float(cmd.get('drx', 0.0))
-            dry = float(cmd.get('dry', 0.0))
-            drz = float(cmd.get('drz', 0.0))
-            
-            # Get current pose
-            current_pose = self.controller.get_tcp_pose()
-            if current_pose is None:
+            planned = self.plan_delta(cmd, log_f)
+            if planned is None:
                 return False
-            
-            # Calculate target pose
-            target_pose = [
-                current_pose[0] + dx,
-                current_pose[1] + dy,
-                current_pose[2] + dz,
-                current_pose[3] + drx,
-                current_pose[4] + dry,
-                current_pose[5] + drz
-            ]
-            
-            # Log command
-            if log_f:
-                log_entry = {
-                    'timestamp': time.time(),
-                    'target_pose': target_pose,
-                    'delta': [dx, dy, dz, drx, dry, drz]
-                }
-                log_f.write(json.dumps(log_entry) + '\n')
-                log_f.flush()
+            target_pose, delta = planned
             
             # Execute movement
-            velocity = [dx, dy, dz, drx, dry, drz]
-            return self.controller.move_velocity(velocity)
-            
+            if self.delta_mode == 'dead_reckoned':
+                if not self.controller.move_linear(target_pose):
+                    self.commanded_pose = None
+                    return False
+                self.commanded_pose = target_pose
+                return True
+            return self.controller.move_velocity(delta)
+        
         except (ValueError, KeyError) as e:
-            self.logger.error(f"Invalid command format: {e}")
+            self.hot_log.error("Invalid command format: %s", e)
             return False
 
-
 def create_default_config(config_path: str) -> None:
     """Create a default configuration file."""
     config_template_path = Path(__file__).parent.parent / "config" / "robot_config_template.yaml"
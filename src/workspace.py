@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Workspace Limits
+
+Checks poses and the motion between them against the axis-aligned
+``physical.safety.workspace_limits`` box.
+
+Checking only the target's x/y/z misses the way there: the tool turns
+with the orientation, so the flange and tool points (given in the TCP
+frame) can leave the box while the TCP goes straight between two valid
+poses, and a joint move takes the TCP along a curve. Swept checks sample
+every segment at ``resolution`` meters and ``angular_resolution`` radians
+and test the TCP and tool points of all samples, for all segments of a
+path at once.
+
+Blended moves are checked along their linear segments. A blend arc stays
+in the convex hull of the segments around its corner, so for the TCP in a
+box this is exact; tool points are approximated.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from .spatial import rotvec_to_matrix, matrix_to_rotvec, pose_inv
+except ImportError:
+    from spatial import rotvec_to_matrix, matrix_to_rotvec, pose_inv
+
+AXES = ('x', 'y', 'z')
+
+
+def interpolate_segments(start: np.ndarray, end: np.ndarray, resolution: float = 0.005,
+                         angular_resolution: float = 0.05,
+                         max_samples: int = 1000) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sample linear moves (as moveL executes them) between pairs of poses.
+    
+    Position is interpolated linearly and orientation about the fixed axis
+    between the two rotations. Both ends of every segment are included.
+    
+    Args:
+        start: (N, 6) poses the segments start from
+        end: (N, 6) poses the segments end at
+        resolution: Largest distance between samples in meters
+        angular_resolution: Largest rotation between samples in radians
+        max_samples: Cap on samples per segment
+    
+    Returns:
+        Tuple of (M, 3) positions, (M, 3, 3) rotation matrices and (M,)
+        index of the segment each sample belongs to
+    """
+    start = np.asarray(start, dtype=np.float64).reshape(-1, 6)
+    end = np.asarray(end, dtype=np.float64).reshape(-1, 6)
+    translation = end[:, :3] - start[:, :3]
+    r0 = rotvec_to_matrix(start[:, 3:]).reshape(-1, 3, 3)
+    relative = matrix_to_rotvec(np.swapaxes(r0, 1, 2) @ rotvec_to_matrix(end[:, 3:])).reshape(-1, 3)
+    
+    steps = np.maximum(np.linalg.norm(translation, axis=1) / resolution,
+                       np.linalg.norm(relative, axis=1) / angular_resolution)
+    counts = np.clip(np.ceil(steps).astype(np.int64), 1, max_samples - 1) + 1
+    segment = np.repeat(np.arange(start.shape[0]), counts)
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    s = (np.arange(segment.shape[0]) - first) / np.repeat(counts - 1, counts)
+    
+    positions = start[segment, :3] + translation[segment] * s[:, None]
+    rotations = r0[segment] @ rotvec_to_matrix(relative[segment] * s[:, None]).reshape(-1, 3, 3)
+    return positions, rotations, segment
+
+
+def interpolate_joint_segments(start: np.ndarray, end: np.ndarray, kinematics,
+                               angular_resolution: float = 0.05,
+                               max_samples: int = 1000) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sample joint moves (as moveJ executes them) and return the TCP frames.
+    
+    Args:
+        start: (N, 6) joint angles the segments start from
+        end: (N, 6) joint angles the segments end at
+        kinematics: ``URKinematics`` of the robot
+        angular_resolution: Largest joint step between samples in radians
+        max_samples: Cap on samples per segment
+    
+    Returns:
+        Tuple of (M, 3) TCP positions, (M, 3, 3) TCP rotations and (M,)
+        index of the segment each sample belongs to
+    """
+    start = np.asarray(start, dtype=np.float64).reshape(-1, 6)
+    travel = np.asarray(end, dtype=np.float64).reshape(-1, 6) - start
+    steps = np.abs(travel).max(axis=1) / angular_resolution
+    counts = np.clip(np.ceil(steps).astype(np.int64), 1, max_samples - 1) + 1
+    segment = np.repeat(np.arange(start.shape[0]), counts)
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    s = (np.arange(segment.shape[0]) - first) / np.repeat(counts - 1, counts)
+    
+    frames = kinematics.forward_matrix(start[segment] + travel[segment] * s[:, None]).reshape(-1, 4, 4)
+    return frames[:, :3, 3], frames[:, :3, :3], segment
+
+
+class WorkspaceLimits:
+    """Axis-aligned workspace box for the TCP and tool points."""
+    
+    def __init__(self, limits: Optional[Dict[str, Sequence[float]]] = None,
+                 tool_points: Optional[Sequence[Sequence[float]]] = None, swept: bool = True,
+                 resolution: float = 0.005, angular_resolution: float = 0.05):
+        """
+        Initialize the limits.
+        
+        Args:
+            limits: ``{'x': [min, max], 'y': ..., 'z': ...}`` in meters; missing axes are unlimited
+            tool_points: Points in the TCP frame [[x, y, z], ...] checked with the TCP
+            swept: Check the motion between poses, not only the poses
+            resolution: Largest distance between path samples in meters
+            angular_resolution: Largest rotation between path samples in radians
+        """
+        limits = limits or {}
+        self.lower = np.array([limits[axis][0] if axis in limits else -np.inf for axis in AXES], dtype=np.float64)
+        self.upper = np.array([limits[axis][1] if axis in limits else np.inf for axis in AXES], dtype=np.float64)
+        points = np.zeros((1, 3)) if tool_points is None else np.asarray(tool_points, dtype=np.float64).reshape(-1, 3)
+        if not (points == 0.0).all(axis=1).any():
+            points = np.vstack([np.zeros(3), points])
+        self.tool_points = points
+        self.swept = swept and self.enabled
+        self.resolution = resolution
+        self.angular_resolution = angular_resolution
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> 'WorkspaceLimits':
+        """
+        Build from ``physical.safety`` (``workspace_limits`` and ``swept_check``).
+        
+        The tool flange, found from ``robot.tcp_offset``, is always one of
+        the tool points.
+        """
+        config = config or {}
+        safety = config.get('physical', {}).get('safety', {})
+        swept = safety.get('swept_check', {})
+        points = [list(p) for p in swept.get('tool_points') or []]
+        tcp_offset = config.get('robot', {}).get('tcp_offset')
+        if tcp_offset is not None and np.any(tcp_offset):
+            points.append(pose_inv(tcp_offset)[:3].tolist())
+        return cls(
+            limits=safety.get('workspace_limits'),
+            tool_points=points,
+            swept=swept.get('enabled', True),
+            resolution=swept.get('resolution', 0.005),
+            angular_resolution=swept.get('angular_resolution', 0.05),
+        )
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether any axis is limited."""
+        return bool(np.isfinite(self.lower).any() or np.isfinite(self.upper).any())
+    
+    def outside(self, points: np.ndarray) -> np.ndarray:
+        """Mask of (..., 3) points outside the box."""
+        points = np.asarray(points, dtype=np.float64)
+        return ((points < self.lower) | (points > self.upper)).any(axis=-1)
+    
+    def tool_points_at(self, positions: np.ndarray, rotations: np.ndarray) -> np.ndarray:
+        """(M, K, 3) base-frame positions of the TCP and tool points at M TCP frames."""
+        return positions[:, None, :] + np.einsum('mij,kj->mki', rotations, self.tool_points)
+    
+    def check_poses(self, poses: np.ndarray) -> np.ndarray:
+        """
+        Check poses including the tool points.
+        
+        Args:
+            poses: (N, 6) TCP poses
+        
+        Returns:
+            Indices of the poses with the TCP or a tool point outside the box
+        """
+        poses = np.asarray(poses, dtype=np.float64).reshape(-1, 6)
+        points = self.tool_points_at(poses[:, :3], rotvec_to_matrix(poses[:, 3:]).reshape(-1, 3, 3))
+        return np.flatnonzero(self.outside(points).any(axis=1))
+    
+    def check_path(self, poses: np.ndarray, start_pose: Optional[Sequence[float]] = None) -> np.ndarray:
+        """
+        Check the linear moves through a list of poses.
+        
+        Args:
+            poses: (N, 6) TCP poses in path order
+            start_pose: Pose the path starts from (default: the first pose,
+                whose own segment is then skipped)
+        
+        Returns:
+            Indices of the poses whose segment (the move to that pose) leaves the box
+        """
+        poses = np.asarray(poses, dtype=np.float64).reshape(-1, 6)
+        if start_pose is None:
+            starts, ends, offset = poses[:-1], poses[1:], 1
+        else:
+            starts = np.vstack([np.asarray(start_pose, dtype=np.float64).reshape(1, 6), poses[:-1]])
+            ends, offset = poses, 0
+        if not ends.shape[0]:
+            return np.empty(0, dtype=np.int64)
+        
+        positions, rotations, segment = interpolate_segments(starts, ends, self.resolution,
+                                                             self.angular_resolution)
+        leaving = self.outside(self.tool_points_at(positions, rotations)).any(axis=1)
+        return np.unique(segment[leaving]) + offset
+    
+    def check_joint_path(self, joints: np.ndarray, start_joints: Sequence[float], kinematics) -> np.ndarray:
+        """
+        Check joint moves (as moveJ executes them) through a list of configurations.
+        
+        Args:
+            joints: (N, 6) joint angles in path order
+            start_joints: Joint angles the path starts from
+            kinematics: ``URKinematics`` of the robot
+        
+        Returns:
+            Indices of the configurations whose segment leaves the box
+        """
+        q1 = np.asarray(joints, dtype=np.float64).reshape(-1, 6)
+        q0 = np.vstack([np.asarray(start_joints, dtype=np.float64).reshape(1, 6), q1[:-1]])
+        positions, rotations, segment = interpolate_joint_segments(q0, q1, kinematics, self.angular_resolution)
+        return np.unique(segment[self.outside(self.tool_points_at(positions, rotations)).any(axis=1)])